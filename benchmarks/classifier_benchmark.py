@@ -0,0 +1,161 @@
+"""Cause-of-death classification benchmark.
+
+Builds a synthetic mix of watcher log lines (quoted ``.ljson`` death events,
+plain death messages and unrelated chatter) and times the previous
+keyword-scan classifier against :class:`DeathClassifier`. Results are written
+as JSON in the same shape as the list benchmark so runs can be compared:
+
+    python -m benchmarks.classifier_benchmark --output before.json
+    python -m benchmarks.classifier_benchmark --output after.json --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+from benchmarks.list_benchmark import _git_revision, compare_results
+from services.death_classifier import DEFAULT_CAUSE_RULES, DeathClassifier
+from services.file_utils import atomic_write_text
+
+RESULTS_VERSION = 1
+
+_WEAPONS = ["M4A1", "Mosin9130", "KitchenKnife", "FirefighterAxe", "RGD5Grenade", "SVD", "Machete", ""]
+_KILLERS = ["ZmbM_HermitSkinny_Beige", "ZmbF_JournalistNormal_Blue", "SurvivorM_Mirek", "FallDamage", ""]
+_NAMES = ["Zombie Slayer", "Knifey", "Gunter", "Survivor", "FallGuy"]
+
+
+def legacy_detect_cause(line: str) -> Optional[str]:
+    """The classifier this benchmark replaces, kept verbatim for comparison."""
+    lower = line.lower()
+    if "death" not in lower and "killed" not in lower:
+        return None
+    for label, keywords in DEFAULT_CAUSE_RULES.items():
+        if any(word in lower for word in keywords):
+            return label
+    return "Unknown"
+
+
+def generate_lines(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    lines: List[str] = []
+    for index in range(count):
+        kind = rng.random()
+        name = rng.choice(_NAMES)
+        if kind < 0.5:
+            event = {
+                "ts": 1700000000 + index,
+                "event": "PLAYER_DEATH",
+                "player": {"name": name, "steamId": f"7656119{index:010d}", "aliveSec": rng.randint(1, 9999)},
+                "killer": {"type": rng.choice(_KILLERS), "name": rng.choice(_NAMES)},
+                "weapon": rng.choice(_WEAPONS),
+                "ammo": rng.choice(["Bullet_556x45", "Bullet_762x54", ""]),
+                "hitZone": rng.choice(["Head", "Torso", "LeftLeg", ""]),
+            }
+            lines.append(f"[Server 1] Found death log:\n    {json.dumps(event)} Victim id: guid{index}")
+        elif kind < 0.8:
+            lines.append(f"12:00:{index % 60:02d} | Player \"{name}\" (id={index}) killed by {rng.choice(_WEAPONS)}")
+        else:
+            lines.append(f"[Server 1] Player \"{name}\" is connected (id={index})")
+    return lines
+
+
+def _measure(operation: Callable[[], None], iterations: int, per_call: int) -> Dict:
+    durations: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - start) * 1000.0)
+    ordered = sorted(durations)
+    return {
+        "iterations": iterations,
+        "lines": per_call,
+        "mean_ms": statistics.fmean(durations),
+        "p50_ms": statistics.median(durations),
+        "p95_ms": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        "min_ms": ordered[0],
+        "max_ms": ordered[-1],
+        "us_per_line": statistics.median(durations) * 1000.0 / max(1, per_call),
+    }
+
+
+def run_benchmarks(lines: List[str], iterations: int, rules: Optional[Dict] = None) -> Dict[str, Dict]:
+    classifier = DeathClassifier(rules)
+    plain = [line for line in lines if "{" not in line]
+    events = [json.loads(line[line.find("{") : line.rfind("}") + 1]) for line in lines if "{" in line]
+
+    def run(function, items):
+        return lambda: [function(item) for item in items]
+
+    results: Dict[str, Dict] = {}
+    results["legacy.mixed"] = _measure(run(legacy_detect_cause, lines), iterations, len(lines))
+    results["classifier.mixed"] = _measure(run(classifier.classify_line, lines), iterations, len(lines))
+    results["legacy.plain"] = _measure(run(legacy_detect_cause, plain), iterations, len(plain))
+    results["classifier.plain"] = _measure(run(classifier.classify_line, plain), iterations, len(plain))
+    results["classifier.events"] = _measure(run(classifier.classify_event, events), iterations, len(events))
+    return results
+
+
+def agreement(lines: List[str]) -> Dict[str, int]:
+    """How often the two classifiers disagree on the plain-text lines."""
+    classifier = DeathClassifier()
+    plain = [line for line in lines if "{" not in line]
+    differing = sum(1 for line in plain if legacy_detect_cause(line) != classifier.classify_line(line))
+    return {"plain_lines": len(plain), "differing": differing}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--rules", help="JSON file with death_cause_rules to benchmark instead of the defaults")
+    parser.add_argument("--output", default="classifier_benchmark_results.json")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    rules = None
+    if args.rules:
+        with open(args.rules, "r") as file:
+            rules = json.load(file)
+
+    lines = generate_lines(args.lines, args.seed)
+    operations = run_benchmarks(lines, args.iterations, rules)
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {"lines": args.lines, "iterations": args.iterations, "seed": args.seed, "rules": args.rules},
+        },
+        "operations": operations,
+        "agreement": agreement(lines),
+    }
+    atomic_write_text(args.output, json.dumps(results, indent=4))
+
+    for name, entry in operations.items():
+        print(f"{name:<24} p50 {entry['p50_ms']:>9.2f} ms  {entry['us_per_line']:>7.2f} us/line")
+    print(f"\nPlain-text lines classified differently: {results['agreement']['differing']}")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            previous = json.load(file)
+        print("\nCompared to", args.compare)
+        for line in compare_results(previous, results):
+            print("  " + line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
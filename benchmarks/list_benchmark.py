@@ -0,0 +1,450 @@
+"""Synthetic large-scale benchmark for whitelist/ban list handling.
+
+Generates whitelist/ban files for several servers plus a userdata DB, then
+times the list-processing parts of ``vc_check``, ``set_user_as_dead``,
+``unban_user`` and ``/validatesteamid`` against a stand-in guild. Results are
+written as JSON so runs from different versions can be compared:
+
+    python -m benchmarks.list_benchmark --output before.json
+    python -m benchmarks.list_benchmark --output after.json --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+from services.file_utils import (
+    atomic_write_lines,
+    atomic_write_text,
+    configure_durability,
+    get_lock_stats,
+    get_write_latency_histograms,
+    get_write_stats,
+    read_lines,
+)
+from services.list_service import (
+    add_steam_id_to_list,
+    apply_voice_check,
+    find_voice_member,
+    is_exempt_from_voice_check,
+    load_server_list_state,
+    remove_steam_id_from_list,
+    remove_steam_id_occurrences,
+    sanitize_steam_id_list,
+    write_server_list_state,
+)
+from services.server_config import resolve_user_server_ids
+
+RESULTS_VERSION = 1
+JOIN_VC_CATEGORY_ID = 1088172608878542888
+
+
+# ----------------------------------------------------------------------
+# stand-in Discord objects
+# ----------------------------------------------------------------------
+class StandInChannel:
+    def __init__(self, category_id: int) -> None:
+        self.category_id = category_id
+
+
+class StandInVoiceState:
+    def __init__(self, channel: Optional[StandInChannel]) -> None:
+        self.channel = channel
+
+
+class StandInMember:
+    def __init__(self, member_id: int, *, in_voice: bool) -> None:
+        self.id = member_id
+        self.bot = False
+        channel = StandInChannel(JOIN_VC_CATEGORY_ID) if in_voice else None
+        self.voice = StandInVoiceState(channel) if channel else None
+
+
+class StandInGuild:
+    """Just enough of ``nextcord.Guild`` for the enforcement loops."""
+
+    def __init__(self, members: List[StandInMember]) -> None:
+        self._members = {member.id: member for member in members}
+
+    def get_member(self, member_id: int) -> Optional[StandInMember]:
+        return self._members.get(member_id)
+
+
+# ----------------------------------------------------------------------
+# synthetic data
+# ----------------------------------------------------------------------
+def _steam_id(rng: random.Random) -> str:
+    return "7656119" + "".join(rng.choice("0123456789") for _ in range(10))
+
+
+def _noisy(values: List[str], rng: random.Random, noise: float) -> List[str]:
+    """Sprinkle in blank, malformed and duplicate lines like hand-edited files have."""
+    lines = list(values)
+    for _ in range(int(len(values) * noise)):
+        kind = rng.random()
+        position = rng.randrange(len(lines) + 1)
+        if kind < 0.3:
+            lines.insert(position, "")
+        elif kind < 0.6:
+            lines.insert(position, "not-a-steam-id")
+        else:
+            lines.insert(position, rng.choice(values))
+    return lines
+
+
+def generate_dataset(
+    workdir: Path,
+    *,
+    servers: int,
+    whitelist_size: int,
+    ban_size: int,
+    users: int,
+    voice_fraction: float,
+    seed: int,
+    noise: float = 0.01,
+) -> Dict:
+    rng = random.Random(seed)
+    whitelist_ids = [_steam_id(rng) for _ in range(whitelist_size)]
+    ban_ids = [_steam_id(rng) for _ in range(ban_size)]
+    user_ids = rng.sample(whitelist_ids, min(users, len(whitelist_ids)))
+
+    server_entries = []
+    for index in range(1, servers + 1):
+        server_dir = workdir / f"server_{index}"
+        server_dir.mkdir(parents=True, exist_ok=True)
+        whitelist_path = server_dir / "whitelist.txt"
+        ban_path = server_dir / "ban.txt"
+        death_path = workdir / f"deaths_{index}.txt"
+        atomic_write_lines(whitelist_path, _noisy(whitelist_ids, rng, noise))
+        atomic_write_lines(ban_path, _noisy(ban_ids + user_ids[: len(user_ids) // 2], rng, noise))
+        atomic_write_text(death_path, "")
+        server_entries.append(
+            {
+                "server_id": str(index),
+                "display_name": f"Server {index}",
+                "path_to_whitelist": str(whitelist_path),
+                "path_to_bans": str(ban_path),
+                "death_watcher_death_path": str(death_path),
+                "enabled": True,
+            }
+        )
+
+    userdata: Dict[str, Dict] = {}
+    members: List[StandInMember] = []
+    for offset, steam_id in enumerate(user_ids):
+        discord_id = 100000000000000000 + offset
+        is_admin = 1 if rng.random() < 0.01 else 0
+        is_alive = 0 if rng.random() < 0.1 else 1
+        userdata[str(discord_id)] = {
+            "username": f"player{offset}",
+            "steam_id": steam_id,
+            "guid": f"guid{offset}",
+            "is_alive": is_alive,
+            "time_of_death": 0 if is_alive else int(time.time()),
+            "can_revive": 0,
+            "is_admin": is_admin,
+            "active_server_id": str(rng.randint(1, servers)),
+            "home_server_id": "",
+        }
+        members.append(StandInMember(discord_id, in_voice=rng.random() < voice_fraction))
+
+    userdata_path = workdir / "userdata_db.json"
+    season_deaths = [key for key, value in userdata.items() if not value["is_alive"]]
+    atomic_write_text(
+        userdata_path,
+        json.dumps({"userdata": userdata, "season_deaths": season_deaths}, indent=4),
+    )
+    return {
+        "servers": server_entries,
+        "userdata_path": str(userdata_path),
+        "guild": StandInGuild(members),
+        "rng": rng,
+    }
+
+
+# ----------------------------------------------------------------------
+# the list-processing parts of the bot's handlers
+# ----------------------------------------------------------------------
+def _load_userdata(path: str) -> Dict:
+    with open(path, "r") as json_file:
+        return json.load(json_file)
+
+
+def _save_userdata(path: str, data: Dict) -> None:
+    atomic_write_text(path, json.dumps(data, indent=4), file_class="userdata")
+
+
+def vc_check_pass(dataset: Dict) -> None:
+    """One ``vc_check`` tick minus the Discord voice channel housekeeping."""
+    servers = dataset["servers"]
+    guilds = [({"join_vc_category_id": JOIN_VC_CATEGORY_ID}, dataset["guild"])]
+    userdata_json = _load_userdata(dataset["userdata_path"])
+    server_state = load_server_list_state(servers)
+    for user_id, userdata in userdata_json["userdata"].items():
+        member, in_join_category = find_voice_member(guilds, user_id)
+        if is_exempt_from_voice_check(member, userdata):
+            continue
+        steam_id = str(userdata.get("steam_id", "")).strip()
+        if not steam_id:
+            continue
+        is_admin = int(userdata["is_admin"]) != 0
+        apply_voice_check(
+            server_state,
+            steam_id,
+            is_admin=is_admin,
+            in_voice=member is not None and in_join_category,
+            scope_servers=[] if is_admin else resolve_user_server_ids(
+                scope="active_server_only",
+                userdata=userdata,
+                servers=servers,
+                default_server_id="1",
+            ),
+        )
+    write_server_list_state(server_state)
+
+
+def _pick_user(dataset: Dict, *, alive: int) -> tuple[str, Dict]:
+    userdata = _load_userdata(dataset["userdata_path"])["userdata"]
+    candidates = [key for key, value in userdata.items() if int(value["is_alive"]) == alive]
+    key = dataset["rng"].choice(candidates or list(userdata))
+    return key, userdata[key]
+
+
+def set_user_as_dead_pass(dataset: Dict, user_id: str) -> None:
+    userdata_json = _load_userdata(dataset["userdata_path"])
+    userdata = userdata_json["userdata"][user_id]
+    userdata["is_alive"] = 0
+    userdata["time_of_death"] = int(time.time())
+    if user_id not in userdata_json["season_deaths"]:
+        userdata_json["season_deaths"].append(user_id)
+    _save_userdata(dataset["userdata_path"], userdata_json)
+    server = dataset["servers"][int(userdata["active_server_id"]) - 1]
+    add_steam_id_to_list(server["path_to_bans"], userdata["steam_id"])
+
+
+def unban_user_pass(dataset: Dict, user_id: str) -> None:
+    userdata_json = _load_userdata(dataset["userdata_path"])
+    userdata = userdata_json["userdata"][user_id]
+    userdata["is_alive"] = 1
+    userdata["time_of_death"] = 0
+    if user_id in userdata_json["season_deaths"]:
+        userdata_json["season_deaths"].remove(user_id)
+    _save_userdata(dataset["userdata_path"], userdata_json)
+    server = dataset["servers"][int(userdata["active_server_id"]) - 1]
+    remove_steam_id_from_list(server["path_to_bans"], userdata["steam_id"])
+
+
+def validatesteamid_pass(dataset: Dict, steam_id: str) -> None:
+    """Registration of a new Steam ID with the default ``all_servers`` scope."""
+    userdata_json = _load_userdata(dataset["userdata_path"])
+    registered = [entry["steam_id"] for entry in userdata_json["userdata"].values()]
+    if steam_id in registered:
+        return
+    for server in dataset["servers"]:
+        add_steam_id_to_list(server["path_to_whitelist"], steam_id)
+    for server in dataset["servers"]:
+        add_steam_id_to_list(server["path_to_bans"], steam_id)
+
+
+# ----------------------------------------------------------------------
+# runner
+# ----------------------------------------------------------------------
+def _lock_totals() -> Dict[str, float]:
+    totals = {"acquisitions": 0, "contended": 0, "total_wait": 0.0}
+    for stats in get_lock_stats().values():
+        for key in totals:
+            totals[key] += stats[key]
+    return totals
+
+
+def _measure(operation: Callable[[], None], iterations: int) -> Dict:
+    durations: List[float] = []
+    written: List[int] = []
+    writes: List[int] = []
+    locks_before = _lock_totals()
+    for _ in range(iterations):
+        before = get_write_stats()
+        start = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - start) * 1000.0)
+        after = get_write_stats()
+        written.append(after["bytes"] - before["bytes"])
+        writes.append(after["writes"] - before["writes"])
+    locks_after = _lock_totals()
+    ordered = sorted(durations)
+    return {
+        "iterations": iterations,
+        "mean_ms": statistics.fmean(durations),
+        "p50_ms": statistics.median(durations),
+        "p95_ms": ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        "min_ms": ordered[0],
+        "max_ms": ordered[-1],
+        "bytes_written_mean": statistics.fmean(written),
+        "writes_mean": statistics.fmean(writes),
+        "lock_acquisitions_mean": (locks_after["acquisitions"] - locks_before["acquisitions"]) / iterations,
+        "lock_contended": locks_after["contended"] - locks_before["contended"],
+        "lock_wait_ms_mean": (locks_after["total_wait"] - locks_before["total_wait"]) * 1000.0 / iterations,
+    }
+
+
+def run_benchmarks(dataset: Dict, iterations: int) -> Dict[str, Dict]:
+    server = dataset["servers"][0]
+    whitelist_path = server["path_to_whitelist"]
+    ban_path = server["path_to_bans"]
+    whitelist_raw = read_lines(whitelist_path)
+    bans_raw = read_lines(ban_path)
+    bans_clean = sanitize_steam_id_list(bans_raw)
+    rng = dataset["rng"]
+
+    results: Dict[str, Dict] = {}
+    results["read_lines.whitelist"] = _measure(lambda: read_lines(whitelist_path), iterations)
+    results["read_lines.bans"] = _measure(lambda: read_lines(ban_path), iterations)
+    results["sanitize_steam_id_list.whitelist"] = _measure(
+        lambda: sanitize_steam_id_list(whitelist_raw), iterations
+    )
+    results["sanitize_steam_id_list.bans"] = _measure(
+        lambda: sanitize_steam_id_list(bans_raw), iterations
+    )
+    results["remove_steam_id_occurrences.bans"] = _measure(
+        lambda: remove_steam_id_occurrences(bans_clean, rng.choice(bans_clean)), iterations
+    )
+    results["atomic_write_lines.bans"] = _measure(
+        lambda: atomic_write_lines(ban_path, bans_clean), iterations
+    )
+    results["vc_check"] = _measure(lambda: vc_check_pass(dataset), iterations)
+    results["set_user_as_dead"] = _measure(
+        lambda: set_user_as_dead_pass(dataset, _pick_user(dataset, alive=1)[0]), iterations
+    )
+    results["unban_user"] = _measure(
+        lambda: unban_user_pass(dataset, _pick_user(dataset, alive=0)[0]), iterations
+    )
+    results["validatesteamid"] = _measure(
+        lambda: validatesteamid_pass(dataset, _steam_id(rng)), iterations
+    )
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return output.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def compare_results(previous: Dict, current: Dict) -> List[str]:
+    lines = []
+    old_ops = previous.get("operations", {})
+    for name, entry in current.get("operations", {}).items():
+        old = old_ops.get(name)
+        if not old or not old.get("p50_ms"):
+            lines.append(f"{name}: {entry['p50_ms']:.2f} ms (new)")
+            continue
+        ratio = entry["p50_ms"] / old["p50_ms"]
+        lines.append(
+            f"{name}: {old['p50_ms']:.2f} ms -> {entry['p50_ms']:.2f} ms (x{ratio:.2f})"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=5)
+    parser.add_argument("--whitelist", type=int, default=50_000, help="entries per whitelist")
+    parser.add_argument("--bans", type=int, default=100_000, help="entries per ban file")
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=2_000,
+        help="registered users in the synthetic userdata DB",
+    )
+    parser.add_argument("--voice-fraction", type=float, default=0.3)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument(
+        "--durability",
+        choices=("none", "file", "full"),
+        help="durability mode for list and userdata writes (default: the bot's defaults)",
+    )
+    parser.add_argument("--workdir", help="keep generated files here instead of a temp dir")
+    parser.add_argument("--output", default="list_benchmark_results.json")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    params = {
+        "servers": args.servers,
+        "whitelist": args.whitelist,
+        "bans": args.bans,
+        "users": args.users,
+        "voice_fraction": args.voice_fraction,
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "durability": args.durability or "default",
+    }
+    if args.durability:
+        configure_durability({"lists": args.durability, "userdata": args.durability})
+
+    with tempfile.TemporaryDirectory(prefix="dw_bench_") as temp_dir:
+        workdir = Path(args.workdir) if args.workdir else Path(temp_dir)
+        print(f"Generating synthetic data in {workdir}...")
+        dataset = generate_dataset(
+            workdir,
+            servers=args.servers,
+            whitelist_size=args.whitelist,
+            ban_size=args.bans,
+            users=args.users,
+            voice_fraction=args.voice_fraction,
+            seed=args.seed,
+        )
+        operations = run_benchmarks(dataset, args.iterations)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+        },
+        "operations": operations,
+        "write_latency": get_write_latency_histograms(),
+    }
+    atomic_write_text(args.output, json.dumps(results, indent=4))
+
+    for name, entry in operations.items():
+        print(
+            f"{name:<36} p50 {entry['p50_ms']:>10.2f} ms  p95 {entry['p95_ms']:>10.2f} ms  "
+            f"{entry['bytes_written_mean'] / 1024:>10.1f} KiB written"
+        )
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            previous = json.load(file)
+        print("\nCompared to", args.compare)
+        for line in compare_results(previous, results):
+            print("  " + line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
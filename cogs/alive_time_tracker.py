@@ -1,13 +1,19 @@
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from nextcord import Embed, Message, TextChannel
 from nextcord.ext import commands, tasks
 
 from services.alive_time_service import AliveTimeLogWatcher
+from services.guild_config import get_guild_config
+from services.leaderboard_service import ALL_TIME, LeaderboardService, season_board, server_board
 from services.server_config import get_active_servers, get_default_server_id
 from services import userdata_service
+from services.userdata_store import get_userdata_store
+
+LEADERBOARD_TITLE = "Alive Time Leaderboard"
+LEADERBOARD_SIZE = 10
 
 
 def _format_duration(seconds: int) -> str:
@@ -38,10 +44,22 @@ class AliveTimeTracker(commands.Cog):
             self.config.get("alive_leaderboard_update_seconds", 300)
         )
         self.cache_path = Path(self.config.get("alive_log_cache_path", "./alive_cache.json"))
+        self.season = str(self.config.get("alive_leaderboard_season") or "").strip() or None
+        self.leaderboard = LeaderboardService(
+            self.config.get("alive_leaderboard_snapshot_path") or "./alive_leaderboards.json"
+        )
+        self._leaderboard_loaded = False
+        self.userdata_store = get_userdata_store(self.userdata_path)
+        # store membership version the all-time board was last built from
+        self._synced_version: Optional[int] = None
 
-        self.log_watcher: Optional[AliveTimeLogWatcher] = None
-        self.leaderboard_message_id: Optional[int] = None
+        self.log_watchers: Dict[str, AliveTimeLogWatcher] = {}
+        self.server_id: Optional[str] = None
+        self.leaderboard_message_ids: Dict[str, int] = {}
+        # last top-N rendered per board; the embed is only edited when it changes
+        self._board_signatures: Dict[str, tuple] = {}
         self._configure_watcher()
+        self.boards = self._resolve_boards(self.config.get("alive_leaderboard_boards") or [ALL_TIME])
 
         # default intervals are replaced during initialization
         self.poll_logs.change_interval(seconds=self.search_logs_interval)
@@ -55,38 +73,94 @@ class AliveTimeTracker(commands.Cog):
 
     def _configure_watcher(self) -> None:
         death_watcher_config_path = self.config.get("death_watcher_config_path") or "./death_watcher/config.json"
-        logs_directory: Optional[Path] = None
+        fallback_directory: Optional[Path] = None
         self.search_logs_interval = 5
 
         servers = get_active_servers(self.config)
         default_id = get_default_server_id(self.config, servers)
-        for server in servers:
-            if server.get("server_id") == default_id and server.get("path_to_logs_directory"):
-                logs_directory = Path(str(server["path_to_logs_directory"]))
-                break
+        self.server_id = default_id
+        self._server_names = {
+            str(server.get("server_id")): server.get("display_name") or f"Server {server.get('server_id')}"
+            for server in servers
+        }
 
         if death_watcher_config_path and Path(death_watcher_config_path).exists():
             try:
                 with open(death_watcher_config_path, "r", encoding="utf-8") as file:
                     death_config = json.load(file)
-                if not logs_directory:
-                    logs_directory = Path(death_config.get("path_to_logs_directory", ""))
+                fallback_directory = Path(death_config.get("path_to_logs_directory", ""))
                 self.search_logs_interval = float(death_config.get("search_logs_interval", 5))
             except Exception:
-                logs_directory = None
+                fallback_directory = None
 
-        if logs_directory and logs_directory.exists():
-            self.log_watcher = AliveTimeLogWatcher(
+        # the default server first: it takes over a cache file written before
+        # the cache was kept per server
+        ordered = sorted(servers, key=lambda server: str(server.get("server_id")) != str(default_id))
+        for server in ordered:
+            server_id = str(server.get("server_id"))
+            logs_directory: Optional[Path] = None
+            if server.get("path_to_logs_directory"):
+                logs_directory = Path(str(server["path_to_logs_directory"]))
+            elif server_id == str(default_id):
+                logs_directory = fallback_directory
+            if not logs_directory or not logs_directory.exists():
+                continue
+            self.log_watchers[server_id] = AliveTimeLogWatcher(
                 logs_directory=logs_directory,
                 cache_path=self.cache_path,
-                server_id=default_id,
-                logger=lambda message: print(f"[AliveTimeWatcher] {message}")
+                server_id=server_id,
+                logger=lambda message, server_id=server_id: print(
+                    f"[AliveTimeWatcher] [Server {server_id}] {message}"
+                ),
             )
-        else:
+
+        if not self.log_watchers:
             print("[AliveTimeWatcher] Logs directory not configured; disconnect tracking disabled.")
 
+    def _resolve_boards(self, names: List[str]) -> List[str]:
+        boards = []
+        for name in names:
+            name = str(name)
+            if name == "server":
+                for server_id in self.log_watchers:
+                    if server_board(server_id) not in boards:
+                        boards.append(server_board(server_id))
+                continue
+            if name == "season":
+                name = season_board(self.season) if self.season else ""
+            if name and name not in boards:
+                boards.append(name)
+        return boards
+
+    def _board_title(self, board: str) -> str:
+        if board.startswith("server:"):
+            server_id = board.split(":", 1)[1]
+            return f"{LEADERBOARD_TITLE} — {self._server_names.get(server_id, f'Server {server_id}')}"
+        if board.startswith("season:"):
+            return f"{LEADERBOARD_TITLE} — Season {board.split(':', 1)[1]}"
+        return LEADERBOARD_TITLE
+
+    def _sync_all_time(self) -> bool:
+        """Rebuild the all-time board if users were added, removed or renamed.
+
+        Disconnects already reach the board through ``record``, so rewrites of
+        ``alive_time_seconds`` alone do not trigger a rebuild. Runs on the event
+        loop: the store hands out the document the bot's tasks mutate, so it
+        must not be walked from another thread.
+        """
+        data = self.userdata_store.load()
+        if self.userdata_store.membership_version == self._synced_version:
+            return False
+        self.leaderboard.load_all_time(data)
+        self._synced_version = self.userdata_store.membership_version
+        return True
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
+        if not self._leaderboard_loaded:
+            self._sync_all_time()
+            await self.bot.loop.run_in_executor(None, self.leaderboard.load_snapshot)
+            self._leaderboard_loaded = True
         if not self.poll_logs.is_running():
             self.poll_logs.start()
         if not self.update_leaderboard.is_running():
@@ -94,17 +168,41 @@ class AliveTimeTracker(commands.Cog):
 
     @tasks.loop(seconds=10)
     async def poll_logs(self) -> None:
-        if not self.log_watcher:
-            return
+        recorded_any = False
+        for server_id, log_watcher in self.log_watchers.items():
+            events = await self.bot.loop.run_in_executor(None, log_watcher.poll_disconnects)
+            for event in events:
+                recorded = userdata_service.record_alive_time(
+                    self.userdata_path,
+                    steam_id=event.get("steam_id"),
+                    guid=event.get("guid"),
+                    alive_seconds=event.get("alive_seconds"),
+                )
+                if recorded:
+                    discord_id, user = recorded
+                    self.leaderboard.record(
+                        discord_id,
+                        user["alive_time_seconds"],
+                        user=user,
+                        server_id=server_id,
+                        season=self.season,
+                    )
+            recorded_any = recorded_any or bool(events)
+        if recorded_any:
+            self.leaderboard.save_snapshot()
 
-        events = await self.bot.loop.run_in_executor(None, self.log_watcher.poll_disconnects)
-        for event in events:
-            success = userdata_service.set_alive_time_seconds(
-                self.userdata_path,
-                steam_id=event.get("steam_id"),
-                guid=event.get("guid"),
-                alive_seconds=event.get("alive_seconds"),
-            )
+    @commands.Cog.listener()
+    async def on_member_update(self, member_before, member_after) -> None:
+        # keeps the status column current without reloading the userdata DB
+        guild_config = get_guild_config(self.config, member_after.guild.id) or self.config
+        alive_role_id = int(guild_config.get("alive_role", 0) or 0)
+        dead_role_id = int(guild_config.get("dead_role", 0) or 0)
+        before = {role.id for role in member_before.roles}
+        after = {role.id for role in member_after.roles}
+        if dead_role_id in after - before:
+            self.leaderboard.set_player_status(str(member_after.id), is_alive=False)
+        elif alive_role_id in after - before:
+            self.leaderboard.set_player_status(str(member_after.id), is_alive=True)
 
     @tasks.loop(seconds=300)
     async def update_leaderboard(self) -> None:
@@ -113,24 +211,38 @@ class AliveTimeTracker(commands.Cog):
         if not self.leaderboard_channel_id:
             return
 
+        if not self._leaderboard_loaded:
+            return
+
+        # wipes, deleted users and renames made through the GUI or commands
+        # only reach the board through the DB
+        self._sync_all_time()
+
         channel = await self._get_channel()
         if not channel:
             return
 
-        leaderboard = userdata_service.get_alive_time_leaderboard(
-            self.userdata_path, top_n=10
-        )
-        content = self._build_message(leaderboard)
+        for board in self.boards:
+            leaderboard = self.leaderboard.top(board, LEADERBOARD_SIZE)
+            signature = tuple(
+                (entry["discord_id"], entry["alive_time_seconds"], entry["is_alive"], entry["username"])
+                for entry in leaderboard
+            )
+            if self._board_signatures.get(board) == signature:
+                continue
 
-        message = await self._get_leaderboard_message(channel)
-        if message:
-            await message.edit(content=None, embed=content)
-        else:
-            sent = await channel.send(embed=content)
-            self.leaderboard_message_id = sent.id
+            title = self._board_title(board)
+            content = self._build_message(leaderboard, title)
+            message = await self._get_leaderboard_message(channel, board, title)
+            if message:
+                await message.edit(content=None, embed=content)
+            else:
+                sent = await channel.send(embed=content)
+                self.leaderboard_message_ids[board] = sent.id
+            self._board_signatures[board] = signature
 
-    def _build_message(self, leaderboard: list[dict]) -> Embed:
-        embed = Embed(title="Alive Time Leaderboard", colour=0x5865F2)
+    def _build_message(self, leaderboard: list[dict], title: str = LEADERBOARD_TITLE) -> Embed:
+        embed = Embed(title=title, colour=0x5865F2)
 
         if not leaderboard:
             embed.description = "No disconnects have been recorded yet."
@@ -160,23 +272,24 @@ class AliveTimeTracker(commands.Cog):
         return None
 
     async def _get_leaderboard_message(
-        self, channel: TextChannel
+        self, channel: TextChannel, board: str = ALL_TIME, title: str = LEADERBOARD_TITLE
     ) -> Optional[Message]:
-        if self.leaderboard_message_id:
+        message_id = self.leaderboard_message_ids.get(board)
+        if message_id:
             try:
-                return await channel.fetch_message(self.leaderboard_message_id)
+                return await channel.fetch_message(message_id)
             except Exception:
-                self.leaderboard_message_id = None
+                self.leaderboard_message_ids.pop(board, None)
 
         async for message in channel.history(limit=50):
             if (
                 message.author.id == self.bot.user.id
                 and (
-                    (message.content and "Alive Time Leaderboard" in message.content)
-                    or any(embed.title == "Alive Time Leaderboard" for embed in message.embeds)
+                    (board == ALL_TIME and message.content and title in message.content)
+                    or any(embed.title == title for embed in message.embeds)
                 )
             ):
-                self.leaderboard_message_id = message.id
+                self.leaderboard_message_ids[board] = message.id
                 return message
         return None
 
@@ -20,6 +20,7 @@ class DeathWatcher(commands.Cog):
 
         config = getattr(bot, "config", {})
         self.logger = getattr(bot, "death_watcher_logger", None)
+        self.death_events = getattr(bot, "death_event_queue", None)
 
         base_config = dict(DEFAULT_CONFIG)
         config_path = config.get("death_watcher_config_path") or "./death_watcher/config.json"
@@ -63,10 +64,16 @@ class DeathWatcher(commands.Cog):
                         print(formatted)
                 return _log
 
+            def _make_death_handler(sid: str):
+                if self.death_events is None:
+                    return None
+                return lambda guid: self.death_events.put_threadsafe(sid, guid)
+
             watcher = DayZDeathWatcher(
                 config_data=config_data,
                 server_id=server_id,
                 logger=_make_logger(server_id),
+                on_death=_make_death_handler(server_id),
             )
             self.watchers.append(watcher)
             thread = threading.Thread(target=lambda w=watcher: self._run_watcher(w), daemon=True)
@@ -6,8 +6,14 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import Webhook
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
-from main import get_server_by_id, reset_death_counter
-from services.file_utils import atomic_write_text
+from main import get_server_by_id, get_userdata, reset_death_counter, start_bulk_revive, start_role_cleanup
+from services.bulk_jobs import bulk_jobs
+from services.discord_actions import action_queue
+from services.error_digest import error_digest
+from services.file_utils import get_lock_stats
+from services.guild_config import get_guild_config, get_primary_guild_id
+from services.member_index import member_index
+from services.runtime_config import get_runtime_config
 
 
 class ExtraCommands(commands.Cog):
@@ -15,8 +21,7 @@ class ExtraCommands(commands.Cog):
         self.client = client
         
     global config
-    with open("config.json") as file:
-        config = json.load(file)
+    config = get_runtime_config()
     
     
     @nextcord.slash_command(name="userdata", description="Gets userdata from either discord id, or steam id.")
@@ -27,7 +32,7 @@ class ExtraCommands(commands.Cog):
             
             is_admin = False
             for role in interaction.user.roles:
-                if (role.id == config["admin_role_id"]):
+                if (role.id == self.get_admin_role_id(interaction)):
                     is_admin = True
                     break
             
@@ -85,7 +90,7 @@ class ExtraCommands(commands.Cog):
             
             is_admin = False
             for role in interaction.user.roles:
-                if (role.id == config["admin_role_id"]):
+                if (role.id == self.get_admin_role_id(interaction)):
                     is_admin = True
                     break
             
@@ -100,15 +105,13 @@ class ExtraCommands(commands.Cog):
                 return
             
             
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
+            store = get_userdata()
+            userdata_json = store.load()
             
             
             if (user_id in userdata_json["userdata"]):
                 del userdata_json["userdata"][user_id]
-                atomic_write_text(
-                    config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-                )
+                store.save(userdata_json)
                 await interaction.response.send_message(f"Successfully deleted user with ID ({user_id}) from the database.", ephemeral=True, delete_after=20)
                 print(f"Successfully deleted user with ID ({user_id}) from the database.")
             
@@ -128,7 +131,7 @@ class ExtraCommands(commands.Cog):
         try:
             is_admin = False
             for role in interaction.user.roles:
-                if (role.id == config["admin_role_id"]):
+                if (role.id == self.get_admin_role_id(interaction)):
                     is_admin = True
                     break
 
@@ -147,6 +150,141 @@ class ExtraCommands(commands.Cog):
             except Exception:
                 pass
 
+    @nextcord.slash_command(name="revive_all", description="Revive every dead player in the background.")
+    @commands.has_role("Admin")
+    async def revive_all_command(self, interaction):
+        await self.start_bulk_job(interaction, start_bulk_revive, "[ReviveAllCommand]")
+
+    @nextcord.slash_command(name="clear_alive_dead_roles", description="Remove the alive/dead roles from every member in the background.")
+    @commands.has_role("Admin")
+    async def clear_alive_dead_roles_command(self, interaction):
+        await self.start_bulk_job(interaction, start_role_cleanup, "[ClearRolesCommand]")
+
+    @nextcord.slash_command(name="job_status", description="Show the progress of a bulk revive or role cleanup.")
+    @commands.has_role("Admin")
+    async def job_status(
+        self,
+        interaction,
+        job_id: str = nextcord.SlashOption(name="job_id", description="Job ID. Defaults to the most recent job.", required=False, default=""),
+        cancel: bool = nextcord.SlashOption(name="cancel", description="Stop the job before its remaining Discord actions.", required=False, default=False),
+    ):
+        try:
+            if (not self.is_admin(interaction)):
+                await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True, delete_after=15)
+                return
+
+            job = bulk_jobs.get(job_id) if job_id else bulk_jobs.latest()
+            if (job == None):
+                await interaction.response.send_message("No matching bulk job found.", ephemeral=True, delete_after=20)
+                return
+
+            if (cancel and job.cancel()):
+                await interaction.response.send_message(f"Cancelling `{job.job_id}` after {job.done}/{job.total} actions.", ephemeral=True)
+                return
+
+            await interaction.response.send_message(self.format_job(job), ephemeral=True)
+
+        except Exception as e:
+            text = f"[JobStatusCommand] \"{e}\"\n"
+            print(text)
+            try:
+                await interaction.response.send_message("Failed to read the job status.", ephemeral=True, delete_after=20)
+            except Exception:
+                pass
+
+    @nextcord.slash_command(name="queue_stats", description="Show the Discord action queue's depth and latency.")
+    @commands.has_role("Admin")
+    async def queue_stats(self, interaction):
+        try:
+            if (not self.is_admin(interaction)):
+                await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True, delete_after=15)
+                return
+
+            await interaction.response.send_message(self.format_queue_stats(action_queue.stats()), ephemeral=True)
+
+        except Exception as e:
+            text = f"[QueueStatsCommand] \"{e}\"\n"
+            print(text)
+            try:
+                await interaction.response.send_message("Failed to read the queue stats.", ephemeral=True, delete_after=20)
+            except Exception:
+                pass
+
+    @nextcord.slash_command(name="lock_stats", description="Show wait times on the shared list/DB file locks.")
+    @commands.has_role("Admin")
+    async def lock_stats(self, interaction):
+        try:
+            if (not self.is_admin(interaction)):
+                await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True, delete_after=15)
+                return
+
+            await interaction.response.send_message(self.format_lock_stats(get_lock_stats()), ephemeral=True)
+
+        except Exception as e:
+            text = f"[LockStatsCommand] \"{e}\"\n"
+            print(text)
+            try:
+                await interaction.response.send_message("Failed to read the lock stats.", ephemeral=True, delete_after=20)
+            except Exception:
+                pass
+
+    async def start_bulk_job(self, interaction, starter, log_tag : str):
+        try:
+            if (not self.is_admin(interaction)):
+                await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True, delete_after=15)
+                return
+
+            job = await starter()
+            await interaction.response.send_message(f"{self.format_job(job)}\nUse `/job_status` to follow its progress.", ephemeral=True)
+
+        except Exception as e:
+            text = f"{log_tag} \"{e}\"\n"
+            print(text)
+            try:
+                await interaction.response.send_message("Failed to start the bulk job.", ephemeral=True, delete_after=20)
+            except Exception:
+                pass
+
+    def format_job(self, job):
+        text = f"`{job.job_id}` is **{job.status}**: {job.done}/{job.total} Discord actions done, {job.failed} failed."
+        if (job.message):
+            text += f"\n{job.message}"
+        return text
+
+    def format_queue_stats(self, stats):
+        if (not stats):
+            return "No Discord actions have been queued yet."
+        lines = [f"**Discord action queue** ({action_queue.depth()} waiting)"]
+        for bucket, entry in sorted(stats.items()):
+            lines.append(
+                f"`{bucket}`: depth {entry['depth']}, concurrency {entry['concurrency']}, "
+                f"{entry['executed']} done, {entry['skipped']} skipped, {entry['coalesced']} coalesced, {entry['failed']} failed; "
+                f"wait p95 {entry['wait']['p95_ms']:.0f} ms (max {entry['wait']['max_ms']:.0f}), "
+                f"run p95 {entry['run']['p95_ms']:.0f} ms (max {entry['run']['max_ms']:.0f})"
+            )
+        return "\n".join(lines)
+
+    def format_lock_stats(self, stats, limit : int = 10):
+        if (not stats):
+            return "No file locks have been taken yet."
+        # the files other processes hold up the most come first
+        ordered = sorted(stats.items(), key=lambda item: (item[1]["total_wait"], item[1]["contended"]), reverse=True)
+        lines = [f"**File locks** (timeout {config.get('file_lock_timeout_seconds', 5)} s)"]
+        for path, entry in ordered[:limit]:
+            taken = entry["acquisitions"] + entry["timeouts"]
+            mean_ms = entry["total_wait"] / taken * 1000.0 if taken else 0.0
+            lines.append(
+                f"`{os.path.basename(path)}`: {entry['acquisitions']} taken, {entry['contended']} contended, "
+                f"{entry['timeouts']} timed out; wait mean {mean_ms:.1f} ms, max {entry['max_wait'] * 1000.0:.0f} ms"
+            )
+        if (len(ordered) > limit):
+            lines.append(f"…and {len(ordered) - limit} more files.")
+        return "\n".join(lines)
+
+    def is_admin(self, interaction):
+        admin_role_id = self.get_admin_role_id(interaction)
+        return any(role.id == admin_role_id for role in interaction.user.roles)
+
     @nextcord.slash_command(name="setserver", description="Set the active DayZ server for a user.")
     @commands.has_role("Admin")
     async def set_server(
@@ -161,7 +299,7 @@ class ExtraCommands(commands.Cog):
         try:
             is_admin = False
             for role in interaction.user.roles:
-                if (role.id == config["admin_role_id"]):
+                if (role.id == self.get_admin_role_id(interaction)):
                     is_admin = True
                     break
 
@@ -182,8 +320,8 @@ class ExtraCommands(commands.Cog):
                 )
                 return
 
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
+            store = get_userdata()
+            userdata_json = store.load()
             user_entry = userdata_json["userdata"].get(str(interaction.user.id))
             if not user_entry:
                 await interaction.response.send_message(
@@ -195,9 +333,7 @@ class ExtraCommands(commands.Cog):
 
             user_entry["active_server_id"] = str(server_id)
             userdata_json["userdata"][str(interaction.user.id)] = user_entry
-            atomic_write_text(
-                config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-            )
+            store.save(userdata_json)
 
             await interaction.response.send_message(
                 f"Active server set to {server.get('display_name')} ({server_id}).",
@@ -215,9 +351,7 @@ class ExtraCommands(commands.Cog):
     async def get_userdata_from_user_id(self, user_id : str):
         userdata = None
         try:
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
-            userdata = userdata_json["userdata"][user_id]
+            userdata = get_userdata().load()["userdata"][user_id]
         except:
             userdata = None
         
@@ -229,13 +363,10 @@ class ExtraCommands(commands.Cog):
         userdata = None
         user_id = 0
         try:
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
-            for ID, data in userdata_json["userdata"].items():
-                if (steam_id == data["steam_id"]):
-                    user_id = ID
-                    userdata = data
-                    break
+            store = get_userdata()
+            user_id = store.find_by_steam_id(steam_id) or 0
+            if (user_id != 0):
+                userdata = store.load()["userdata"][user_id]
         except:
             user_id = 0
             userdata = None
@@ -264,7 +395,19 @@ class ExtraCommands(commands.Cog):
                 if (mention != "" and mention != "everyone" and mention != "here"):
                     mention = await self.get_user_id_from_name(mention)
             mention = (f"@{mention} " if (mention == "everyone" or mention == "here") else f"<@{mention}> ") if (mention != "") else ""
-            await channel.send(f"{mention}**{prefix}**\n{error_message}")
+            await error_digest.report(channel, prefix, error_message, mention)
+        
+        
+        
+    def get_admin_role_id(self, interaction):
+        guild_config = get_guild_config(config, interaction.guild_id) or config
+        return guild_config["admin_role_id"]
+        
+    async def get_user_id_from_name(self, username : str):
+        try:
+            return member_index.lookup(self.client.get_guild(get_primary_guild_id(config)), username)
+        except:
+            return ""
         
         
 def setup(client):
@@ -0,0 +1,52 @@
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+from nextcord.ext import commands
+from services.guild_resources import guild_resources
+
+
+class GuildResources(commands.Cog):
+    """Keeps the shared role/channel cache in sync with the gateway."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.client.guilds:
+            guild_resources.rebuild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild):
+        guild_resources.rebuild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        guild_resources.forget_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        guild_resources.role_changed(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, role_before, role_after):
+        guild_resources.role_changed(role_after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        guild_resources.role_deleted(role)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        guild_resources.channel_changed(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, channel_before, channel_after):
+        guild_resources.channel_changed(channel_after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        guild_resources.channel_deleted(channel)
+
+
+def setup(client):
+    client.add_cog(GuildResources(client))
@@ -0,0 +1,42 @@
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+from nextcord.ext import commands
+from services.member_index import member_index
+
+
+class MemberIndex(commands.Cog):
+    """Keeps the shared member name index in sync with the gateway."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.client.guilds:
+            member_index.rebuild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        member_index.forget_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        member_index.add(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member):
+        member_index.remove(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, member_before, member_after):
+        if member_before.name != member_after.name:
+            member_index.add(member_after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, user_before, user_after):
+        if user_before.name != user_after.name:
+            member_index.rename_user(user_after)
+
+
+def setup(client):
+    client.add_cog(MemberIndex(client))
@@ -7,6 +7,11 @@ from nextcord.ext import commands
 from nextcord import Webhook
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
 from main import *
+from services.error_digest import error_digest
+from services.guild_config import get_guild_config, get_primary_guild_id
+from services.guild_resources import guild_resources
+from services.member_index import member_index
+from services.runtime_config import get_runtime_config
 
 
 
@@ -15,8 +20,7 @@ class OnMemberJoin(commands.Cog):
         self.client = client
         
     global config
-    with open("config.json") as file:
-        config = json.load(file)
+    config = get_runtime_config()
     
     @commands.Cog.listener()
     async def on_member_join(self, member):
@@ -34,14 +38,15 @@ class OnMemberJoin(commands.Cog):
             if (not str(user_id) in keys):
                 return
             userdata = userdata_json["userdata"][str(user_id)]
+            guild_config = get_guild_config(config, member.guild.id) or config
             role = None
             
             # If they're alive in the database
             if (str(userdata["is_alive"]) != "0"):
-                role = nextcord.utils.get(member.guild.roles, id = int(config["alive_role"]))
+                role = guild_resources.role(member.guild, guild_config["alive_role"])
             # If they're dead in the database
             else:
-                role = nextcord.utils.get(member.guild.roles, id = int(config["dead_role"]))
+                role = guild_resources.role(member.guild, guild_config["dead_role"])
             
             # Give them the proper role
             await member.add_roles(role)
@@ -75,23 +80,15 @@ class OnMemberJoin(commands.Cog):
                 if (mention != "" and mention != "everyone" and mention != "here"):
                     mention = await self.get_user_id_from_name(mention)
             mention = (f"@{mention} " if (mention == "everyone" or mention == "here") else f"<@{mention}> ") if (mention != "") else ""
-            await channel.send(f"{mention}**{prefix}**\n{error_message}")
+            await error_digest.report(channel, prefix, error_message, mention)
         
         
         
     async def get_user_id_from_name(self, username : str):
-        ID = ""
         try:
-            guild = self.client.get_guild(config["guild_id"])
-            if (guild != None):
-                mention_member = nextcord.utils.get(guild.members, name = username)
-                ID = str(mention_member.id) if (mention_member != None) else ""
-            else:
-                ID = ""
+            return member_index.lookup(self.client.get_guild(get_primary_guild_id(config)), username)
         except:
-            ID = ""
-        
-        return ID
+            return ""
         
     
         
@@ -7,7 +7,13 @@ from nextcord.ext import commands
 from nextcord import Webhook
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
 from main import *
-from services.file_utils import atomic_write_text
+from services.discord_actions import action_queue
+from services.error_digest import error_digest
+from services.guild_config import get_guild_config, get_primary_guild_id
+from services.guild_resources import guild_resources
+from services.member_index import member_index
+from services.runtime_config import get_runtime_config
+from services.userdata_store import get_userdata_store
 
 
 
@@ -16,8 +22,7 @@ class OnMemberUpdate(commands.Cog):
         self.client = client
         
     global config
-    with open("config.json") as file:
-        config = json.load(file)
+    config = get_runtime_config()
     
     @commands.Cog.listener()
     async def on_member_update(self, member_before, member_after):
@@ -26,28 +31,30 @@ class OnMemberUpdate(commands.Cog):
             
             user_id = int(member_before.id)
             
-            # open userdata db file
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
-            keys = list(userdata_json["userdata"].keys())
+            # Only a newly added alive/dead role matters; nickname, avatar and
+            # unrelated role changes are dropped before touching the database
+            guild_config = get_guild_config(config, member_after.guild.id) or config
+            added_role_ids = {role.id for role in member_after.roles} - {role.id for role in member_before.roles}
+            if (not added_role_ids & {int(guild_config["alive_role"]), int(guild_config["dead_role"])}):
+                return
+            
+            store = get_userdata_store(config["userdata_db_path"])
             
             # If they're not in the database, do nothing
-            if (not str(user_id) in keys):
+            if (not store.is_registered(user_id)):
                 return
             
+            userdata_json = store.load()
             season_deaths = userdata_json["season_deaths"]
             
             userdata = userdata_json["userdata"][str(user_id)]
-            alive_role = nextcord.utils.get(member_after.guild.roles, id = int(config["alive_role"]))
-            dead_role = nextcord.utils.get(member_after.guild.roles, id = int(config["dead_role"]))
-            can_revive_role = nextcord.utils.get(member_after.guild.roles, id = int(config["can_revive_role"]))
+            alive_role = guild_resources.role(member_after.guild, guild_config["alive_role"])
+            dead_role = guild_resources.role(member_after.guild, guild_config["dead_role"])
+            can_revive_role = guild_resources.role(member_after.guild, guild_config["can_revive_role"])
             new_role = None
             
             if (alive_role in member_after.roles and (not alive_role in member_before.roles) and str(userdata["is_alive"]) == "0"):
-                if (dead_role in member_after.roles):
-                    await member_after.remove_roles(dead_role)
-                if (can_revive_role in member_after.roles):
-                    await member_after.remove_roles(can_revive_role)
+                action_queue.update_roles(member_after, remove=[dead_role, can_revive_role])
                 userdata["is_alive"] = 1
                 userdata["time_of_death"] = 0
                 userdata["can_revive"] = 0
@@ -59,10 +66,7 @@ class OnMemberUpdate(commands.Cog):
                 print(f"[OnMemberUpdate] Alive role was given to user: {member_after.name}. Unbanning them.")
                 
             elif (dead_role in member_after.roles and (not dead_role in member_before.roles) and (not str(userdata["is_alive"]) == "0")):
-                if (alive_role in member_after.roles):
-                    await member_after.remove_roles(alive_role)
-                if (can_revive_role in member_after.roles):
-                    await member_after.remove_roles(can_revive_role)
+                action_queue.update_roles(member_after, remove=[alive_role, can_revive_role])
                 userdata["is_alive"] = 0
                 userdata["time_of_death"] = int(time.time())
                 userdata["can_revive"] = 0
@@ -78,9 +82,7 @@ class OnMemberUpdate(commands.Cog):
             
             # store their userdata in db
             userdata_json["userdata"][str(user_id)] = userdata
-            atomic_write_text(
-                config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-            )
+            store.save(userdata_json)
             
             
         except Exception as e:
@@ -110,23 +112,15 @@ class OnMemberUpdate(commands.Cog):
                 if (mention != "" and mention != "everyone" and mention != "here"):
                     mention = await self.get_user_id_from_name(mention)
             mention = (f"@{mention} " if (mention == "everyone" or mention == "here") else f"<@{mention}> ") if (mention != "") else ""
-            await channel.send(f"{mention}**{prefix}**\n{error_message}")
+            await error_digest.report(channel, prefix, error_message, mention)
         
         
         
     async def get_user_id_from_name(self, username : str):
-        ID = ""
         try:
-            guild = self.client.get_guild(config["guild_id"])
-            if (guild != None):
-                mention_member = nextcord.utils.get(guild.members, name = username)
-                ID = str(mention_member.id) if (mention_member != None) else ""
-            else:
-                ID = ""
+            return member_index.lookup(self.client.get_guild(get_primary_guild_id(config)), username)
         except:
-            ID = ""
-        
-        return ID
+            return ""
         
     
         
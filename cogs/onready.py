@@ -4,21 +4,29 @@ import platform
 import json
 import nextcord
 from nextcord.ext import commands
+import main
 from main import update_bot_activity
+from services.runtime_config import get_runtime_config
 
 class Onready(commands.Cog):
     
     def __init__(self, client):
         self.client = client
+        self.reported_startup = False
 
     global config
-    with open("config.json") as file:
-        config = json.load(file)
+    config = get_runtime_config()
 
     @commands.Cog.listener()
     async def on_ready(self):
         print("-------------------")
 
+        timer = main.startup_timer
+        if (timer != None and not self.reported_startup):
+            self.reported_startup = True
+            timer.mark("connect to Discord")
+            print(timer.report())
+
         await update_bot_activity()
         print(f"Logged in as: {self.client.user.name}")
         print(f"Nextcord API Version: {nextcord.__version__}")
@@ -7,23 +7,32 @@ from nextcord.ext import commands
 from nextcord import Webhook
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
 from main import *
-from services.file_utils import atomic_write_lines, atomic_write_text, read_lines
+from services.error_digest import error_digest
+from services.file_utils import FileLockTimeout, atomic_write_lines, read_lines
+from services.guild_config import get_guild_config, get_guild_ids, get_primary_guild_id
+from services.guild_resources import guild_resources
+from services.list_service import add_steam_id_to_list
+from services.member_index import member_index
+from services.runtime_config import get_runtime_config
 import asyncio
 import time
 import traceback
 
 
 whitelist_id_length = 17
+# list files are read under a cross-process lock that already waits up to
+# file_lock_timeout_seconds, so only a lock timeout is worth another attempt
+lock_retry_attempts = 3
+lock_retry_delay = 0.25
 
 class ValidateSteamId(commands.Cog):
     def __init__(self, client):
         self.client = client
         
     global config
-    with open("config.json") as file:
-        config = json.load(file)
+    config = get_runtime_config()
     
-    @nextcord.slash_command(name = "validatesteamid", guild_ids = [config["guild_id"]])
+    @nextcord.slash_command(name = "validatesteamid", guild_ids = get_guild_ids(config))
     async def validatesteamid(self, interaction, steam_id : str): # int = nextcord.SlashOption(name="steam_id", description="Example steam id: 01234567890123456", required=True)
         
         try:
@@ -33,8 +42,12 @@ class ValidateSteamId(commands.Cog):
             except Exception as e:
                 channel_id = -1
             
+            guild_config = get_guild_config(config, interaction.guild_id)
+            if (guild_config == None):
+                return
+            
             # ignore if posted in wrong channel
-            if (channel_id != int(config["validate_steam_id_channel"])):
+            if (channel_id != int(guild_config["validate_steam_id_channel"])):
                 return
             
             author = interaction.user
@@ -48,7 +61,7 @@ class ValidateSteamId(commands.Cog):
             user_id = int(author.id)
             
             for role in author.roles:
-                if (role.id == int(config["dead_role"])):
+                if (role.id == int(guild_config["dead_role"])):
                     embedVar = nextcord.Embed(title="Dead users cannot update their Steam ID!", color=0xFF0000)
                     await interaction.response.send_message(embed = embedVar)
                     return
@@ -66,8 +79,7 @@ class ValidateSteamId(commands.Cog):
                 return
             
             # open userdata db file
-            with open(config["userdata_db_path"], "r") as json_file:
-                userdata_json = json.load(json_file)
+            userdata_json = get_userdata().load()
             keys = list(userdata_json["userdata"].keys())
             
             # check if steam id is already registered
@@ -90,19 +102,9 @@ class ValidateSteamId(commands.Cog):
                 death_path = server.get("death_watcher_death_path", "")
                 if not death_path:
                     continue
-                success = False
-                tries = 0
-                while not success and tries < 10:
-                    try:
-                        deaths_list = read_lines(death_path)
-                        success = True
-                    except Exception as e:
-                        print(
-                            "[ValidateSteamId] Attempt "
-                            f"{tries + 1} - Failed to open deaths list file: {death_path} '{e}'"
-                        )
-                        tries += 1
-                        time.sleep(0.25)
+                success, deaths_list = await self.retry_on_lock_timeout(
+                    "[ValidateSteamId]", f"deaths list file: {death_path}", read_lines, death_path
+                )
                 if not success:
                     death_check_failed = True
                     break
@@ -115,7 +117,7 @@ class ValidateSteamId(commands.Cog):
                     return
 
             if death_check_failed:
-                print(f"Could not verify that user: {user_id} is in death list after 10 tries.")
+                print(f"Could not verify that user: {user_id} is in death list.")
                 embedVar = nextcord.Embed(
                     title="Internal error. Please try again later.",
                     color=0xFF0000,
@@ -145,21 +147,11 @@ class ValidateSteamId(commands.Cog):
                         continue
                     blacklist_path = server.get("path_to_bans", "")
                     whitelist_path = server.get("path_to_whitelist", "")
-                    success = False
-                    tries = 0
-                    while not success and tries < 10:
-                        try:
-                            blacklist_list = read_lines(blacklist_path)
-                            success = True
-                        except Exception as e:
-                            print(
-                                "[ValidateSteamId] Attempt "
-                                f"{tries + 1} - Failed to open blacklist file: {blacklist_path} '{e}'"
-                            )
-                            tries += 1
-                            time.sleep(0.25)
+                    success, blacklist_list = await self.retry_on_lock_timeout(
+                        "[ValidateSteamId]", f"blacklist file: {blacklist_path}", read_lines, blacklist_path
+                    )
                     if not success:
-                        print(f"Could not open blacklist file: {blacklist_path} after 10 tries.")
+                        print(f"Could not open blacklist file: {blacklist_path}.")
                         embedVar = nextcord.Embed(
                             title="Internal error. Please try again later.",
                             color=0xFF0000,
@@ -191,9 +183,7 @@ class ValidateSteamId(commands.Cog):
                 
                 userdata["steam_id"] = str(steam_id)
                 userdata["guid"] = str(guid)
-                atomic_write_text(
-                    config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-                )
+                get_userdata().save(userdata_json)
                 print (f"Updated Steam ID ({steam_id}) for discord user: {userdata['username']}!")
                 embedVar = nextcord.Embed(title=f"Updated your Steam ID ({steam_id})!", color=0x00FF00)
                 await interaction.response.send_message(embed = embedVar)
@@ -215,9 +205,7 @@ class ValidateSteamId(commands.Cog):
             
             # store their userdata in db
             userdata_json["userdata"][str(user_id)] = new_userdata
-            atomic_write_text(
-                config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-            )
+            get_userdata().save(userdata_json)
             
             validate_scope = get_validate_scope(config)
             scope_servers = resolve_user_scope_servers(new_userdata, scope=validate_scope)
@@ -227,16 +215,11 @@ class ValidateSteamId(commands.Cog):
                 server = get_server_by_id(server_id)
                 if not server:
                     continue
-                whitelist_path = server.get("path_to_whitelist", "")
-                whitelist_list_raw = read_lines(whitelist_path)
-                whitelist_list = sanitize_steam_id_list(whitelist_list_raw)
-                whitelist_list = remove_steam_id_occurrences(whitelist_list, steam_id)
-                whitelist_list.append(str(steam_id))
-                atomic_write_lines(whitelist_path, whitelist_list)
+                add_steam_id_to_list(server.get("path_to_whitelist", ""), steam_id)
 
             # don't assign alive role if they already have it, or has the dead role
-            alive_role = nextcord.utils.get(interaction.guild.roles, id = int(config["alive_role"]))
-            dead_role = nextcord.utils.get(interaction.guild.roles, id = int(config["dead_role"]))
+            alive_role = guild_resources.role(interaction.guild, guild_config["alive_role"])
+            dead_role = guild_resources.role(interaction.guild, guild_config["dead_role"])
             if ((not alive_role in author.roles) and (not dead_role in author.roles)):
                 await interaction.user.add_roles(alive_role)
             
@@ -245,31 +228,15 @@ class ValidateSteamId(commands.Cog):
                 if not server:
                     continue
                 blacklist_path = server.get("path_to_bans", "")
-                success = False
-                tries = 0
-                while not success and tries < 10:
-                    try:
-                        blacklist_list_raw = read_lines(blacklist_path)
-                        blacklist_list = sanitize_steam_id_list(blacklist_list_raw)
-                        blacklist_list = remove_steam_id_occurrences(
-                            blacklist_list, steam_id
-                        )
-                        blacklist_list.append(str(steam_id))
-                        atomic_write_lines(blacklist_path, blacklist_list)
-                        success = True
-
-                    except Exception as e:
-                        print(
-                            "[UnbanUser] Attempt "
-                            f"{tries + 1} - Failed to open deaths list file: {blacklist_path} '{e}'"
-                        )
-                        tries += 1
-                        time.sleep(0.25)
+                success, _ = await self.retry_on_lock_timeout(
+                    "[ValidateSteamId]", f"blacklist file: {blacklist_path}",
+                    add_steam_id_to_list, blacklist_path, steam_id,
+                )
 
                 if not success:
-                    print(f"Could not validate user: {user_id} after 10 tries.")
+                    print(f"Could not validate user: {user_id}.")
                     await dump_error_discord(
-                        f"Could not validate user: `{user_id}` after 10 tries.\n"
+                        f"Could not validate user: `{user_id}`.\n"
                         "(likely file permission error?)",
                         "Unexpected error",
                     )
@@ -301,7 +268,8 @@ class ValidateSteamId(commands.Cog):
                 return
             
             channel_id = message.channel.id
-            if (channel_id != int(config["validate_steam_id_channel"])):
+            guild_config = get_guild_config(config, getattr(message.guild, "id", None))
+            if (guild_config == None or channel_id != int(guild_config["validate_steam_id_channel"])):
                 return
             
             await asyncio.sleep(5)
@@ -320,6 +288,23 @@ class ValidateSteamId(commands.Cog):
         
         
         
+    async def retry_on_lock_timeout(self, tag : str, description : str, operation, *args):
+        """Run a list file operation; returns ``(success, result)``.
+
+        Only lock timeouts are retried, and the wait between attempts does not
+        block the event loop. Other I/O errors fail straight away.
+        """
+        for attempt in range(1, lock_retry_attempts + 1):
+            try:
+                return True, operation(*args)
+            except FileLockTimeout as e:
+                print(f"{tag} Attempt {attempt} - Timed out waiting for the lock on {description} '{e}'")
+                await asyncio.sleep(lock_retry_delay)
+            except OSError as e:
+                print(f"{tag} Failed to open {description} '{e}'")
+                break
+        return False, None
+    
     async def dump_error_discord(self, error_message : str, prefix : str = "Error", force_mention_tag : str = ""):
         prefix = "Error" if (prefix == "") else prefix
         channel_id = config["error_dump_channel"]
@@ -340,23 +325,15 @@ class ValidateSteamId(commands.Cog):
                 if (mention != "" and mention != "everyone" and mention != "here"):
                     mention = await self.get_user_id_from_name(mention)
             mention = (f"@{mention} " if (mention == "everyone" or mention == "here") else f"<@{mention}> ") if (mention != "") else ""
-            await channel.send(f"{mention}**{prefix}**\n{error_message}")
+            await error_digest.report(channel, prefix, error_message, mention)
         
         
         
     async def get_user_id_from_name(self, username : str):
-        ID = ""
         try:
-            guild = self.client.get_guild(config["guild_id"])
-            if (guild != None):
-                mention_member = nextcord.utils.get(guild.members, name = username)
-                ID = str(mention_member.id) if (mention_member != None) else ""
-            else:
-                ID = ""
+            return member_index.lookup(self.client.get_guild(get_primary_guild_id(config)), username)
         except:
-            ID = ""
-        
-        return ID
+            return ""
         
         
         
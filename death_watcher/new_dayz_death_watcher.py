@@ -1,14 +1,17 @@
 import json
 import os
+import sys
 import threading
 import time
 import traceback
-import uuid
 from pathlib import Path
 from typing import Callable, List, Optional, Tuple
 
 from dayz_dev_tools import guid as GUID
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+from services.file_utils import atomic_write_text, file_lock
+
 DEFAULT_CACHE_CONTENT = {
     "prev_log_read": {"line": ""},
     "log_label": "2022-01-01 at 00:00:00",
@@ -25,13 +28,6 @@ DEFAULT_CONFIG = {
 }
 
 
-def _atomic_write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
-    temp_path.write_text(text, encoding="utf-8")
-    os.replace(temp_path, path)
-
-
 class DayZDeathWatcher:
     """Utility that tails DayZ server logs for death events."""
 
@@ -43,6 +39,7 @@ class DayZDeathWatcher:
         config_data: Optional[dict] = None,
         server_id: Optional[str] = None,
         logger: Optional[Callable[[str], None]] = None,
+        on_death: Optional[Callable[[str], None]] = None,
     ) -> None:
         self._script_dir = Path(__file__).resolve().parent
         self.config_path = Path(config_path) if config_path else self._script_dir / "config.json"
@@ -54,6 +51,7 @@ class DayZDeathWatcher:
         self._cache_container: dict = {}
         self._stop_event = threading.Event()
         self._log = logger or (lambda message: print(message, flush=True))
+        self._on_death = on_death
 
         # populated during configuration loading
         self.config: dict = {}
@@ -159,10 +157,13 @@ class DayZDeathWatcher:
         self._ensure_cache_exists()
         self.current_cache = self._load_cache()
 
-        if not self.path_to_bans or not self.path_to_bans.exists():
+        if not self.path_to_bans or not self.path_to_bans.parent.exists():
             raise FileNotFoundError(
                 f"Failed to find ban file: \"{self.path_to_bans}\""
             )
+        # the consumer rotates the log aside during compaction, so a missing
+        # file just means nothing has been appended since
+        self.path_to_bans.touch(exist_ok=True)
 
     def _ensure_config_exists(self) -> None:
         if self.config_data is not None:
@@ -172,7 +173,7 @@ class DayZDeathWatcher:
 
         self._log(f"Generating default config file: ({self.config_path})")
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        _atomic_write_text(self.config_path, json.dumps(DEFAULT_CONFIG, indent=4))
+        atomic_write_text(self.config_path, json.dumps(DEFAULT_CONFIG, indent=4))
 
     def _load_config(self) -> None:
         if self.config_data is not None:
@@ -212,7 +213,9 @@ class DayZDeathWatcher:
         assert self.path_to_cache is not None
         self._log(f"Failed to find cache file: {self.path_to_cache}\nCreating it now.")
         self.path_to_cache.parent.mkdir(parents=True, exist_ok=True)
-        _atomic_write_text(self.path_to_cache, json.dumps(DEFAULT_CACHE_CONTENT, indent=4))
+        atomic_write_text(
+            self.path_to_cache, json.dumps(DEFAULT_CACHE_CONTENT, indent=4), file_class="cache"
+        )
 
     def _load_cache(self) -> dict:
         assert self.path_to_cache is not None
@@ -241,9 +244,15 @@ class DayZDeathWatcher:
             if "servers" not in self._cache_container:
                 self._cache_container = {"servers": {}}
             self._cache_container["servers"][self.server_id] = self.current_cache
-            _atomic_write_text(self.path_to_cache, json.dumps(self._cache_container, indent=4))
+            atomic_write_text(
+                self.path_to_cache,
+                json.dumps(self._cache_container, indent=4),
+                file_class="cache",
+            )
             return
-        _atomic_write_text(self.path_to_cache, json.dumps(self.current_cache, indent=4))
+        atomic_write_text(
+            self.path_to_cache, json.dumps(self.current_cache, indent=4), file_class="cache"
+        )
 
     # ------------------------------------------------------------------
     # log helpers
@@ -336,16 +345,7 @@ class DayZDeathWatcher:
         tries = 0
         while not success and tries < 10:
             try:
-                ids = []
-                if self.path_to_bans.exists():
-                    ids = [
-                        name.strip()
-                        for name in self.path_to_bans.read_text(encoding="utf-8").splitlines()
-                        if name.strip()
-                    ]
-                if player_id not in ids:
-                    ids.append(player_id)
-                    _atomic_write_text(self.path_to_bans, "\n".join(ids))
+                self._append_death(player_id)
                 success = True
             except Exception as exc:
                 self._log(f"Failed to ban player: '{exc}' Try: {tries + 1}")
@@ -358,6 +358,28 @@ class DayZDeathWatcher:
         else:
             self._log(f"Player: {player_id} could not be added to the ban file: {self.path_to_bans}")
 
+        # the ban file stays the record for external consumers; in-process
+        # listeners are notified regardless so a file error can't delay a ban
+        if self._on_death:
+            try:
+                self._on_death(player_id)
+            except Exception as exc:
+                self._log(f"Failed to hand off death for player {player_id}: {exc}")
+
+    def _append_death(self, player_id: str) -> None:
+        """Append a GUID to the deaths log without rewriting existing entries."""
+        assert self.path_to_bans is not None
+        # the bot rotates this file under the same lock when compacting
+        with file_lock(self.path_to_bans), self.path_to_bans.open("a+b") as deaths_file:
+            deaths_file.seek(0, os.SEEK_END)
+            prefix = b""
+            if deaths_file.tell() > 0:
+                # files written by older versions have no trailing newline
+                deaths_file.seek(-1, os.SEEK_END)
+                if deaths_file.read(1) != b"\n":
+                    prefix = b"\n"
+            deaths_file.write(prefix + f"{player_id}\n".encode("utf-8"))
+
     # ------------------------------------------------------------------
     # misc helpers
     # ------------------------------------------------------------------
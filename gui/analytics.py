@@ -1,91 +1,188 @@
 from __future__ import annotations
 
+import math
+import time
 import tkinter as tk
 from datetime import datetime
 from tkinter import filedialog, messagebox
 
-try:
-    import matplotlib.dates as mdates
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    _MATPLOTLIB_AVAILABLE = True
-except ImportError:  # pragma: no cover - runtime dependency guard
-    mdates = None
-    FigureCanvasTkAgg = None
-    Figure = None
-    _MATPLOTLIB_AVAILABLE = False
-
 from gui.theme import LIGHT_THEME, ThemePalette
 from services.analytics_service import AnalyticsManager
 
+# matplotlib is imported the first time the analytics tab is shown; it is by
+# far the slowest import in the GUI and most sessions never open the tab
+mdates = None
+FigureCanvasTkAgg = None
+Figure = None
+_MATPLOTLIB_AVAILABLE: bool | None = None
+
+DEFAULT_MAX_FPS = 2.0
+
+
+def _load_matplotlib() -> bool:
+    global mdates, FigureCanvasTkAgg, Figure, _MATPLOTLIB_AVAILABLE
+    if _MATPLOTLIB_AVAILABLE is None:
+        try:
+            import matplotlib.dates as mdates
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            _MATPLOTLIB_AVAILABLE = True
+        except ImportError:  # pragma: no cover - runtime dependency guard
+            _MATPLOTLIB_AVAILABLE = False
+    return _MATPLOTLIB_AVAILABLE
+
 
 class AnalyticsPane(tk.Frame):
-    def __init__(self, master, manager: AnalyticsManager) -> None:
+    """Death timeline and cause breakdown charts.
+
+    ``refresh`` only marks the charts dirty; they are redrawn at most
+    ``max_fps`` times a second, and only while the pane is visible. The
+    timeline line and the pie wedges are updated in place rather than
+    clearing the axes.
+    """
+
+    def __init__(self, master, manager: AnalyticsManager, *, max_fps: float = DEFAULT_MAX_FPS) -> None:
         super().__init__(master)
         self.manager = manager
-        self._has_matplotlib = _MATPLOTLIB_AVAILABLE
+        self._min_interval = 1.0 / max(0.1, float(max_fps))
         self._theme: ThemePalette = LIGHT_THEME
-        if self._has_matplotlib:
-            self._figure = Figure(figsize=(6, 5), dpi=100)
-            self._timeline_ax = self._figure.add_subplot(211)
-            self._pie_ax = self._figure.add_subplot(212)
-            self._canvas = FigureCanvasTkAgg(self._figure, master=self)
-            self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self._warning_label = None
-        else:
-            self._figure = None
-            self._timeline_ax = None
-            self._pie_ax = None
-            self._canvas = None
+        self._has_matplotlib = False
+        self._charts_built = False
+        self._figure = None
+        self._timeline_ax = None
+        self._pie_ax = None
+        self._canvas = None
+        self._warning_label = None
+        self._timeline_line = None
+        self._timeline_empty = None
+        self._pie_labels: tuple = ()
+        self._pie_artists: list = []
+        self._wedges: list = []
+        self._pie_empty = None
+        self._dirty = True
+        self._render_job: str | None = None
+        self._last_render = 0.0
+
+        self._export_button = tk.Button(self, text="Export Analytics", command=self._export_dialog)
+        self._export_button.pack(side=tk.BOTTOM, anchor="e", padx=8, pady=6)
+        self.bind("<Map>", self._on_shown, add="+")
+        self.apply_theme(self._theme)
+
+    def _on_shown(self, _event=None) -> None:
+        if not self._charts_built:
+            self._build_charts()
+        if self._dirty:
+            self._schedule_render()
+
+    def _build_charts(self) -> None:
+        self._charts_built = True
+        self._has_matplotlib = _load_matplotlib()
+        if not self._has_matplotlib:
             warning = (
                 "Matplotlib is not installed. Install it (pip install matplotlib) "
                 "to enable analytics charts."
             )
             self._warning_label = tk.Label(self, text=warning, wraplength=480, justify=tk.LEFT)
             self._warning_label.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
+            self.apply_theme(self._theme)
+            return
 
-        self._export_button = tk.Button(self, text="Export Analytics", command=self._export_dialog)
-        self._export_button.pack(anchor="e", padx=8, pady=6)
-        if self._has_matplotlib:
-            self.refresh()
+        self._figure = Figure(figsize=(6, 5), dpi=100)
+        self._timeline_ax = self._figure.add_subplot(211)
+        self._pie_ax = self._figure.add_subplot(212)
+        self._canvas = FigureCanvasTkAgg(self._figure, master=self)
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self._timeline_ax.set_title("Deaths Over Time")
+        self._timeline_ax.set_ylabel("Deaths")
+        (self._timeline_line,) = self._timeline_ax.plot([], [], linestyle="solid", marker="o")
+        self._timeline_ax.xaxis_date()
+        self._timeline_ax.xaxis.set_major_formatter(mdates.DateFormatter("%m-%d %H:%M"))
+        self._timeline_empty = self._timeline_ax.text(
+            0.5, 0.5, "No data yet", ha="center", va="center", transform=self._timeline_ax.transAxes
+        )
+        self._pie_ax.set_title("Cause of Death")
+        self._dirty = True
         self.apply_theme(self._theme)
 
     def refresh(self) -> None:
-        if not self._has_matplotlib:
+        """Mark the charts out of date; they are redrawn on the next allowed frame."""
+        self._dirty = True
+        if self._charts_built:
+            self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        if self._render_job is not None:
             return
+        delay = max(0.0, self._last_render + self._min_interval - time.monotonic())
+        self._render_job = self.after(int(delay * 1000), self._render)
+
+    def _render(self) -> None:
+        self._render_job = None
+        # hidden tabs stay dirty and are drawn when shown again
+        if not self._dirty or not self._has_matplotlib or not self.winfo_viewable():
+            return
+        self._dirty = False
+        self._last_render = time.monotonic()
         self._draw_timeline()
         self._draw_pie()
         self._canvas.draw_idle()
 
     def _draw_timeline(self) -> None:
-        if not self._has_matplotlib:
-            return
         times, counts = self.manager.timeline()
-        self._timeline_ax.clear()
-        self._timeline_ax.set_title("Deaths Over Time")
-        if times:
-            if hasattr(mdates, "epoch2num"):
-                dates = mdates.epoch2num(times)
-            else:
-                dates = [mdates.date2num(datetime.fromtimestamp(ts)) for ts in times]
-            self._timeline_ax.plot_date(dates, counts, linestyle="solid", marker="o")
-            self._timeline_ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S"))
-            self._timeline_ax.set_ylabel("Deaths")
+        if hasattr(mdates, "epoch2num"):
+            dates = mdates.epoch2num(times) if times else []
         else:
-            self._timeline_ax.text(0.5, 0.5, "No data yet", ha="center", va="center")
+            dates = [mdates.date2num(datetime.fromtimestamp(ts)) for ts in times]
+        self._timeline_line.set_data(dates, counts)
+        self._timeline_empty.set_visible(not times)
+        if times:
+            self._timeline_ax.relim()
+            self._timeline_ax.autoscale_view()
 
     def _draw_pie(self) -> None:
-        if not self._has_matplotlib:
-            return
         breakdown = self.manager.cause_breakdown()
-        self._pie_ax.clear()
-        self._pie_ax.set_title("Cause of Death")
-        values = [value for value in breakdown.values() if value > 0]
-        labels = [label for label, value in breakdown.items() if value > 0]
+        labels = tuple(label for label, value in breakdown.items() if value > 0)
+        values = [breakdown[label] for label in labels]
+        if labels == self._pie_labels and self._pie_artists:
+            self._update_wedges(values)
+            return
+
+        # the set of causes changed: rebuild the pie once and reuse it afterwards
+        for artist in self._pie_artists:
+            artist.remove()
+        self._pie_artists = []
+        if self._pie_empty is not None:
+            self._pie_empty.remove()
+            self._pie_empty = None
+        self._pie_labels = labels
         if values:
-            self._pie_ax.pie(values, labels=labels, autopct="%1.0f%%")
+            wedges, texts, autotexts = self._pie_ax.pie(values, labels=labels, autopct="%1.0f%%")
+            self._wedges = list(zip(wedges, texts, autotexts))
+            self._pie_artists = [*wedges, *texts, *autotexts]
+            for text in texts:
+                text.set_color(self._theme.fg)
         else:
-            self._pie_ax.text(0.5, 0.5, "No events", ha="center", va="center")
+            self._wedges = []
+            self._pie_empty = self._pie_ax.text(
+                0.5, 0.5, "No events", ha="center", va="center", transform=self._pie_ax.transAxes
+            )
+
+    def _update_wedges(self, values: list) -> None:
+        """Move the existing wedges and labels, mirroring ``Axes.pie``'s layout."""
+        total = float(sum(values))
+        theta = 0.0
+        for (wedge, text, autotext), value in zip(self._wedges, values):
+            span = 360.0 * value / total
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            middle = math.radians(theta + span / 2)
+            x, y = math.cos(middle), math.sin(middle)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment("left" if x > 0 else "right")
+            autotext.set_position((0.6 * x, 0.6 * y))
+            autotext.set_text(f"{100.0 * value / total:1.0f}%")
+            theta += span
 
     def _export_dialog(self) -> None:
         file_path = filedialog.asksaveasfilename(
@@ -112,7 +209,7 @@ class AnalyticsPane(tk.Frame):
         )
         if self._warning_label:
             self._warning_label.configure(bg=theme.bg, fg=theme.fg)
-        if self._has_matplotlib:
+        if self._has_matplotlib and self._figure is not None:
             self._figure.patch.set_facecolor(theme.bg)
             self._canvas.get_tk_widget().configure(bg=theme.bg)
             for ax in (self._timeline_ax, self._pie_ax):
@@ -125,4 +222,6 @@ class AnalyticsPane(tk.Frame):
                     ax.yaxis.label.set_color(theme.fg)
                 for spine in ax.spines.values():
                     spine.set_color(theme.fg)
+            for _wedge, text, _autotext in self._wedges:
+                text.set_color(theme.fg)
             self.refresh()
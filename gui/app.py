@@ -1,31 +1,45 @@
 from __future__ import annotations
 
+import os
 import queue
 import threading
+import time
+from collections import deque
 import tkinter as tk
 import tkinter.ttk as ttk
 from typing import Callable, Optional
 
-from gui.analytics import AnalyticsPane
-from gui.config_editor import ConfigEditor
-from gui.console_pane import ConsolePane
-from gui.path_setup import BotSetupDialog, ServerRootSetupDialog
+from gui.analytics import DEFAULT_MAX_FPS, AnalyticsPane
+from gui.console_pane import DEFAULT_MAX_LINES, ConsolePane
+from gui.lazy import LazyTab
+from gui.log_queue import LogQueue
 from gui.sidebar import SidebarPane
 from gui.theme import ThemePalette, get_theme
-from services.analytics_service import AnalyticsManager
+from services.analytics_service import DEFAULT_ANALYTICS_DIRECTORY, AnalyticsManager
+from services.analytics_store import AnalyticsStore
 from services.config_manager import ConfigManager
+from services.death_classifier import DeathClassifier
 from services.server_config import get_active_servers, get_enabled_servers, normalize_servers
+from services.timing import PhaseTimer
 
 
 class GuiApplication:
     """Tkinter front-end that visualizes bot output and server analytics."""
 
-    def __init__(self, *, config_path: str = "config.json", on_close=None) -> None:
-        self.root = tk.Tk()
+    def __init__(
+        self,
+        *,
+        config_path: str = "config.json",
+        on_close=None,
+        startup_timer: Optional[PhaseTimer] = None,
+    ) -> None:
+        self._startup_timer = startup_timer or PhaseTimer("GUI")
+        with self._startup_timer.phase("create window"):
+            self.root = tk.Tk()
         self.root.title("DayZ Death Watcher")
         self.root.geometry("1300x750")
-        self.main_queue: queue.Queue[str] = queue.Queue()
-        self.death_queue: queue.Queue[str | tuple[str, str]] = queue.Queue()
+        self.main_queue: LogQueue[str] = LogQueue()
+        self.death_queue: LogQueue[str | tuple[str, str, Optional[str]]] = LogQueue()
         self.counter_queue: queue.Queue[tuple[int, int]] = queue.Queue()
         self.bot_thread: Optional[threading.Thread] = None
         self._shutdown_callback = on_close
@@ -34,16 +48,25 @@ class GuiApplication:
         self._ready = False
         self._ready_callbacks: list[Callable[[], None]] = []
         self._path_dialog: Optional[tk.Toplevel] = None
-        self._bot_dialog: Optional[BotSetupDialog] = None
-
-        self.config_manager = ConfigManager(config_path)
-        self._needs_full_setup = self.config_manager.needs_initial_setup
-        self.analytics_manager = AnalyticsManager()
+        self._bot_dialog: Optional[tk.Toplevel] = None
+
+        with self._startup_timer.phase("load config"):
+            self.config_manager = ConfigManager(config_path)
+            self._needs_full_setup = self.config_manager.needs_initial_setup
+            self.analytics_manager = AnalyticsManager(
+                AnalyticsStore(self.config_manager.data.get("analytics_directory") or DEFAULT_ANALYTICS_DIRECTORY),
+                classifier=DeathClassifier.from_config(self.config_manager.data),
+            )
         self._servers = get_active_servers(self.config_manager.data)
         self._active_server_id: Optional[str] = None
-        self._server_log_queues: dict[str, queue.Queue[str]] = {}
-
-        self._build_ui()
+        self._server_log_queues: dict[str, LogQueue[str]] = {}
+        # lines for server consoles that were not built yet, replayed when they are
+        self._server_log_backlog: dict[str, deque[str]] = {}
+        self._frame_budget = float(self.config_manager.data.get("gui_log_frame_budget_ms") or 30) / 1000
+
+        with self._startup_timer.phase("build widgets"):
+            self._build_ui()
+        self._first_map_binding = self.root.bind("<Map>", self._on_first_map, add="+")
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.config_manager.add_listener(self._on_config_update)
         self.root.after(100, self._poll_logs)
@@ -86,6 +109,7 @@ class GuiApplication:
         self._main_console = ConsolePane(
             summary_tab,
             title="Life and Death Bot",
+            **self._console_options("bot"),
             description=(
                 "Stream of Discord bot activity including command output "
                 "and moderation events."
@@ -96,6 +120,7 @@ class GuiApplication:
         self._death_console = ConsolePane(
             summary_tab,
             title="Death Watcher",
+            **self._console_options("death_watcher"),
             description=(
                 "Watcher log that tracks deaths from your DayZ server for "
                 "revival timers and analytics."
@@ -103,13 +128,19 @@ class GuiApplication:
         )
         self._death_console.grid(row=0, column=1, sticky="nsew", padx=(5, 10), pady=10)
 
-        self._server_logs_tab = tk.Frame(logs_notebook)
+        # one console per server is only worth building once someone looks;
+        # until then their lines are kept in a backlog capped at console_max_lines
+        self._server_logs_tab = LazyTab(logs_notebook, self._build_server_logs_view)
         logs_notebook.add(self._server_logs_tab, text="Server Activity")
         self._build_server_log_panels()
 
         analytics_tab = tk.Frame(notebook)
         notebook.add(analytics_tab, text="Analytics")
-        self._analytics = AnalyticsPane(analytics_tab, self.analytics_manager)
+        self._analytics = AnalyticsPane(
+            analytics_tab,
+            self.analytics_manager,
+            max_fps=float(self.config_manager.data.get("gui_analytics_max_fps") or DEFAULT_MAX_FPS),
+        )
         self._analytics.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
         self._apply_theme()
@@ -136,7 +167,20 @@ class GuiApplication:
 
     # endregion
 
+    def _on_first_map(self, event) -> None:
+        if event.widget is not self.root:
+            return
+        self.root.unbind("<Map>", self._first_map_binding)
+        # runs once the redraws queued by mapping the window are done
+        self.root.after_idle(self._report_startup)
+
+    def _report_startup(self) -> None:
+        self._startup_timer.mark("first paint")
+        print(self._startup_timer.report())
+
     def _open_config_editor(self) -> None:
+        from gui.config_editor import ConfigEditor
+
         ConfigEditor(self.root, self.config_manager, on_reload=self._on_config_update)
 
     def _on_config_update(self, data: dict) -> None:
@@ -147,46 +191,66 @@ class GuiApplication:
         self._ensure_initial_paths()
 
     def append_main_log(self, message: str) -> None:
-        self.main_queue.put(message)
+        self.main_queue.offer(message)
 
     def append_death_log(self, message: str, server_id: Optional[str] = None) -> None:
         if server_id and server_id in self._server_log_queues:
-            self._server_log_queues[server_id].put(message)
+            self._server_log_queues[server_id].offer(message)
         formatted = self._format_death_log(message)
         if not formatted:
             return
-        self.death_queue.put((formatted, message))
+        self.death_queue.offer((formatted, message, server_id))
 
     def handle_death_counter_update(self, count: int, last_reset: int) -> None:
         self.counter_queue.put((count, last_reset))
 
     def _poll_logs(self) -> None:
-        self._drain_queue(self.main_queue, self._main_console)
-        self._drain_queue(self.death_queue, self._death_console, analytics=True)
+        # every console gets an equal share of the frame so one flooded
+        # queue cannot starve the others or freeze the window
+        targets = [(self.main_queue, self._main_console, False), (self.death_queue, self._death_console, True)]
+        unbuilt = []
         for server_id, q in self._server_log_queues.items():
             console = getattr(self, "_server_log_panels", {}).get(server_id)
             if console:
-                self._drain_queue(q, console)
+                targets.append((q, console, False))
+            else:
+                unbuilt.append((server_id, q))
+        share = self._frame_budget / (len(targets) + len(unbuilt))
+        for q, console, analytics in targets:
+            self._drain_queue(q, console, deadline=time.perf_counter() + share, analytics=analytics)
+        for server_id, q in unbuilt:
+            backlog = self._server_log_backlog.get(server_id)
+            if backlog is None:
+                backlog = self._server_log_backlog[server_id] = deque(maxlen=self._console_max_lines())
+            backlog.extend(q.take_until(time.perf_counter() + share, max_items=backlog.maxlen))
         self._process_counter_updates()
         self.root.after(100, self._poll_logs)
 
     def _drain_queue(
         self,
-        q: "queue.Queue[str | tuple[str, str]]",
+        q: "LogQueue[str | tuple[str, str, Optional[str]]]",
         console: ConsolePane,
         *,
+        deadline: float,
         analytics: bool = False,
     ) -> None:
-        while not q.empty():
-            payload = q.get_nowait()
+        messages = []
+        analytics_changed = False
+        for payload in q.take_until(deadline, max_items=console.max_lines):
             if isinstance(payload, tuple):
-                message, analytics_line = payload
+                message, analytics_line, server_id = payload
             else:
                 message = payload
                 analytics_line = payload if analytics else None
-            console.append(message)
-            if analytics and analytics_line and self.analytics_manager.record_line(analytics_line):
-                self._analytics.refresh()
+                server_id = None
+            messages.append(message)
+            if analytics and analytics_line and self.analytics_manager.record_line(analytics_line, server_id):
+                analytics_changed = True
+        # one insert per console per frame instead of one per message
+        console.append_many(messages)
+        console.set_backlog(q.qsize(), q.dropped)
+        if analytics_changed:
+            self._analytics.refresh()
 
     def _process_counter_updates(self) -> None:
         while not self.counter_queue.empty():
@@ -219,6 +283,8 @@ class GuiApplication:
             self._header.configure(bg=palette.bg)
         if hasattr(self, "_server_selector"):
             self._server_selector.configure(background=palette.bg)
+        if hasattr(self, "_server_logs_tab"):
+            self._server_logs_tab.apply_theme(palette)
         if hasattr(self, "_server_log_panels"):
             for panel in self._server_log_panels.values():
                 panel.apply_theme(palette)
@@ -251,17 +317,30 @@ class GuiApplication:
         if hasattr(self, "_sidebar"):
             self._sidebar.set_active_server(self._active_server_id)
 
+    def _build_server_logs_view(self, master) -> tk.Frame:
+        self._server_logs_frame = tk.Frame(master)
+        self._build_server_log_panels()
+        return self._server_logs_frame
+
     def _build_server_log_panels(self) -> None:
-        if not hasattr(self, "_server_logs_tab"):
+        enabled = get_enabled_servers(self._servers)
+        self._server_log_queues = {
+            str(server["server_id"]): self._server_log_queues.get(str(server["server_id"])) or LogQueue()
+            for server in enabled
+        }
+        self._server_log_backlog = {
+            server_id: backlog
+            for server_id, backlog in self._server_log_backlog.items()
+            if server_id in self._server_log_queues
+        }
+        if not hasattr(self, "_server_logs_frame"):
             return
-        for child in self._server_logs_tab.winfo_children():
+        for child in self._server_logs_frame.winfo_children():
             child.destroy()
-        enabled = get_enabled_servers(self._servers)
         self._server_log_panels = {}
-        self._server_log_queues = {str(server["server_id"]): queue.Queue() for server in enabled}
         if not enabled:
             tk.Label(
-                self._server_logs_tab,
+                self._server_logs_frame,
                 text="No enabled servers configured.",
             ).pack(pady=10)
             return
@@ -270,24 +349,39 @@ class GuiApplication:
         columns = 2 if count <= 4 else 3
         rows = (count + columns - 1) // columns
         for col in range(columns):
-            self._server_logs_tab.columnconfigure(col, weight=1)
+            self._server_logs_frame.columnconfigure(col, weight=1)
         for row in range(rows):
-            self._server_logs_tab.rowconfigure(row, weight=1)
+            self._server_logs_frame.rowconfigure(row, weight=1)
 
         for idx, server in enumerate(enabled):
             server_id = str(server["server_id"])
             title = server.get("display_name") or f"Server {server_id}"
             panel = ConsolePane(
-                self._server_logs_tab,
+                self._server_logs_frame,
                 title=title,
                 description="Latest log activity for this server.",
+                **self._console_options(f"server_{server_id}"),
             )
             row = idx // columns
             col = idx % columns
             panel.grid(row=row, column=col, sticky="nsew", padx=8, pady=8)
             panel.apply_theme(self._theme)
+            backlog = self._server_log_backlog.pop(server_id, None)
+            if backlog:
+                panel.append_many(list(backlog))
             self._server_log_panels[server_id] = panel
 
+    def _console_max_lines(self) -> int:
+        return int(self.config_manager.data.get("console_max_lines") or DEFAULT_MAX_LINES)
+
+    def _console_options(self, name: str) -> dict:
+        data = self.config_manager.data
+        options = {"max_lines": self._console_max_lines()}
+        spill_directory = str(data.get("console_spill_directory") or "").strip()
+        if spill_directory:
+            options["spill_path"] = os.path.join(spill_directory, f"{name}.log")
+        return options
+
     def _format_death_log(self, message: str) -> Optional[str]:
         if not message:
             return None
@@ -382,6 +476,8 @@ class GuiApplication:
         self.root.after(0, _prompt)
 
     def _show_server_root_dialog(self) -> None:
+        from gui.path_setup import ServerRootSetupDialog
+
         if self._path_dialog and self._path_dialog.winfo_exists():
             return
 
@@ -409,6 +505,8 @@ class GuiApplication:
         self._path_dialog.bind("<Destroy>", lambda _event: setattr(self, "_path_dialog", None))
 
     def _show_bot_setup_dialog(self) -> None:
+        from gui.path_setup import BotSetupDialog
+
         if self._bot_dialog and self._bot_dialog.winfo_exists():
             return
 
@@ -440,6 +538,7 @@ class GuiApplication:
                 self._shutdown_callback()
             except Exception:
                 pass
+        self.analytics_manager.close()
         self.root.quit()
         self.root.destroy()
 
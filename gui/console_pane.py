@@ -1,24 +1,56 @@
 from __future__ import annotations
 
+import os
+import shutil
 import tkinter as tk
+from collections import deque
+from itertools import islice
+from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import List
+from typing import Deque, List, Optional
 
 from gui.theme import LIGHT_THEME, ThemePalette
 from services.file_utils import atomic_write_text
 
+DEFAULT_MAX_LINES = 5000
+# a spill file past this size is moved to ``<name>.1``, replacing the previous one
+SPILL_ROTATE_BYTES = 10 * 1024 * 1024
+
 
 class ConsolePane(tk.Frame):
-    """Reusable console widget with filtering, auto-scroll, and export tools."""
+    """Reusable console widget with filtering, auto-scroll, and export tools.
+
+    Only the newest ``max_lines`` lines are kept in memory and in the text
+    widget. Older lines are dropped, or appended to ``spill_path`` when one
+    is given so "Save Log" can still export the full history. The spill file
+    survives restarts and config reloads and is rotated to ``.1`` whenever it
+    grows past :data:`SPILL_ROTATE_BYTES`.
+    """
 
-    def __init__(self, master, *, title: str, description: str, **kwargs) -> None:
+    def __init__(
+        self,
+        master,
+        *,
+        title: str,
+        description: str,
+        max_lines: int = DEFAULT_MAX_LINES,
+        spill_path: Optional[str] = None,
+        **kwargs,
+    ) -> None:
         super().__init__(master, **kwargs)
         self.title = title
         self.description = description
-        self._log_buffer: List[str] = []
+        self.max_lines = max(1, int(max_lines))
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._log_buffer: Deque[str] = deque(maxlen=self.max_lines)
+        # sequence number of the next line; the buffer holds the last len() of them
+        self._line_count = 0
         self._auto_scroll = tk.BooleanVar(value=True)
         self._filter_var = tk.StringVar()
         self._cleared_index = 0
+        if self.spill_path:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate_spill()
         self._theme: ThemePalette = LIGHT_THEME
 
         self._build_ui()
@@ -52,6 +84,10 @@ class ConsolePane(tk.Frame):
         )
         self._auto_box.pack(side=tk.LEFT, padx=(10, 0))
 
+        # shown only while the UI is behind the producer
+        self._backlog_lbl = tk.Label(self._toolbar, text="")
+        self._backlog_lbl.pack(side=tk.RIGHT)
+
         self._text_container = tk.Frame(self)
         self._text_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
 
@@ -69,17 +105,60 @@ class ConsolePane(tk.Frame):
         self._text.configure(yscrollcommand=self._scrollbar.set)
 
     def append(self, message: str) -> None:
-        if not message:
+        self.append_many([message])
+
+    def append_many(self, messages: List[str]) -> None:
+        """Append a batch of messages with a single widget update."""
+        lines: List[str] = []
+        for message in messages:
+            if not message:
+                continue
+            if not message.endswith("\n"):
+                message += "\n"
+            lines.extend(message.splitlines(True))
+        if not lines:
             return
-        if not message.endswith("\n"):
-            message += "\n"
-        lines = message.splitlines(True)
-        self._log_buffer.extend(lines)
-        if self._filter_active:
-            self._refresh_display()
-        else:
+        self._store_lines(lines)
+        filter_text = self._current_filter()
+        if filter_text:
+            # only the new lines need testing; the widget already holds the older matches
+            lines = [line for line in lines if filter_text in line.lower()]
+        if lines:
             self._append_visible("".join(lines))
 
+    def _store_lines(self, lines: List[str]) -> None:
+        overflow = len(self._log_buffer) + len(lines) - self.max_lines
+        if overflow > 0 and self.spill_path:
+            evicted = list(islice(self._log_buffer, overflow))
+            evicted += lines[: max(0, overflow - len(evicted))]
+            try:
+                with open(self.spill_path, "a", encoding="utf-8") as spill:
+                    spill.write("".join(evicted))
+                    spilled = spill.tell()
+            except OSError:
+                self.spill_path = None
+            else:
+                if spilled >= SPILL_ROTATE_BYTES:
+                    self._rotate_spill()
+        self._log_buffer.extend(lines)
+        self._line_count += len(lines)
+
+    def set_backlog(self, pending: int, dropped: int) -> None:
+        parts = []
+        if pending:
+            parts.append(f"{pending} queued")
+        if dropped:
+            parts.append(f"{dropped} dropped")
+        text = ", ".join(parts)
+        if text != self._backlog_lbl.cget("text"):
+            self._backlog_lbl.configure(text=text)
+
+    def _current_filter(self) -> str:
+        text = self._filter_var.get().strip()
+        if text == "Filter output…":
+            return ""
+        return text.lower()
+
     @property
     def _filter_active(self) -> bool:
         text = self._filter_var.get().strip()
@@ -88,18 +167,20 @@ class ConsolePane(tk.Frame):
     def _append_visible(self, text: str) -> None:
         self._text.configure(state="normal")
         self._text.insert(tk.END, text)
+        # "end-1c" sits on the empty line after the trailing newline
+        excess = int(self._text.index("end-1c").split(".")[0]) - 1 - self.max_lines
+        if excess > 0:
+            self._text.delete("1.0", f"{excess + 1}.0")
         if self._auto_scroll.get():
             self._text.see(tk.END)
         self._text.configure(state="disabled")
 
     def _refresh_display(self) -> None:
-        filter_text = self._filter_var.get()
-        if filter_text == "Filter output…":
-            filter_text = ""
-        lines = self._log_buffer[self._cleared_index :]
+        filter_text = self._current_filter()
+        first_kept = self._line_count - len(self._log_buffer)
+        lines = list(self._log_buffer)[max(0, self._cleared_index - first_kept) :]
         if filter_text:
-            lower = filter_text.lower()
-            lines = [line for line in lines if lower in line.lower()]
+            lines = [line for line in lines if filter_text in line.lower()]
         self._text.configure(state="normal")
         self._text.delete("1.0", tk.END)
         if lines:
@@ -109,7 +190,7 @@ class ConsolePane(tk.Frame):
         self._text.configure(state="disabled")
 
     def clear_view(self) -> None:
-        self._cleared_index = len(self._log_buffer)
+        self._cleared_index = self._line_count
         self._filter_var.set("")
         self._restore_placeholder(None)
         self._text.configure(state="normal")
@@ -125,16 +206,32 @@ class ConsolePane(tk.Frame):
         if not file_path:
             return
         try:
-            visible_text = self._text.get("1.0", tk.END)
-            full_buffer = "".join(self._log_buffer)
             if messagebox.askyesno("Save Log", "Save the full buffer instead of the visible text?"):
-                to_write = full_buffer
+                self._write_full_buffer(Path(file_path))
             else:
-                to_write = visible_text
-            atomic_write_text(file_path, to_write)
+                atomic_write_text(file_path, self._text.get("1.0", tk.END))
         except OSError as exc:
             messagebox.showerror("Save Failed", str(exc))
 
+    def _rotate_spill(self) -> None:
+        try:
+            if self.spill_path.stat().st_size >= SPILL_ROTATE_BYTES:
+                os.replace(self.spill_path, self.spill_path.with_name(self.spill_path.name + ".1"))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            self.spill_path = None
+
+    def _write_full_buffer(self, target: Path) -> None:
+        # streamed, since the spill file can be up to SPILL_ROTATE_BYTES
+        temp_path = target.with_name(f".{target.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as out:
+            if self.spill_path and self.spill_path.exists():
+                with open(self.spill_path, "r", encoding="utf-8") as spill:
+                    shutil.copyfileobj(spill, out)
+            out.writelines(self._log_buffer)
+        os.replace(temp_path, target)
+
     def _clear_placeholder(self, _event) -> None:
         if self._is_placeholder_active():
             self._filter_entry.delete(0, tk.END)
@@ -163,6 +260,7 @@ class ConsolePane(tk.Frame):
         for widget in (self._title_lbl, self._desc_lbl, self._toolbar, self._text_container):
             widget.configure(bg=theme.panel_bg)
         self._desc_lbl.configure(fg=theme.muted)
+        self._backlog_lbl.configure(bg=theme.panel_bg, fg=theme.muted)
         for button in (self._clear_btn, self._save_btn):
             button.configure(bg=theme.button_bg, fg=theme.button_fg, activebackground=theme.accent)
         self._auto_box.configure(
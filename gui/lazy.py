@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from gui.theme import LIGHT_THEME, ThemePalette
+
+# initial file reads (userdata DB, list files) run here so the window can
+# paint before they finish; results come back through an OperationTracker
+_loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-loader")
+
+
+def load_in_background(fn: Callable[..., Any], *args: Any) -> Future:
+    return _loader.submit(fn, *args)
+
+
+class LazyTab(tk.Frame):
+    """Notebook page that builds its panel the first time it is shown.
+
+    Until then it only holds a placeholder label. ``factory(master)`` must
+    return the panel widget; it is packed to fill the page and themed with
+    the last palette passed to ``apply_theme``.
+    """
+
+    def __init__(self, master, factory: Callable[[tk.Misc], tk.Widget], *, placeholder: str = "Loading…") -> None:
+        super().__init__(master)
+        self._factory = factory
+        self._theme: ThemePalette = LIGHT_THEME
+        self.panel: Optional[tk.Widget] = None
+        self._placeholder = tk.Label(self, text=placeholder)
+        self._placeholder.pack(expand=True)
+        # a notebook only maps its selected page, and only while it is itself
+        # mapped, so <Map> means "visible for the first time"
+        self._map_binding = self.bind("<Map>", self._on_map)
+
+    def _on_map(self, _event=None) -> None:
+        self.build()
+
+    def build(self) -> tk.Widget:
+        if self.panel is None:
+            self.unbind("<Map>", self._map_binding)
+            self.panel = self._factory(self)
+            self._placeholder.destroy()
+            self.panel.pack(fill=tk.BOTH, expand=True)
+            apply_theme = getattr(self.panel, "apply_theme", None)
+            if apply_theme is not None:
+                apply_theme(self._theme)
+        return self.panel
+
+    def apply_theme(self, theme: ThemePalette) -> None:
+        # the built panel is themed by whoever owns it, like any other panel
+        self._theme = theme
+        self.configure(bg=theme.bg)
+        if self.panel is None:
+            self._placeholder.configure(bg=theme.bg, fg=theme.fg)
@@ -0,0 +1,40 @@
+"""Thread-safe hand-off of log lines from the bot thread to the Tk loop."""
+from __future__ import annotations
+
+import queue
+import time
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_QUEUE_SIZE = 50_000
+
+
+class LogQueue(queue.Queue, Generic[T]):
+    """A bounded queue that drops (and counts) lines the UI cannot keep up with."""
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        super().__init__(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, item: T) -> bool:
+        try:
+            self.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def take_until(self, deadline: float, max_items: Optional[int] = None) -> List[T]:
+        """Pop queued items until the queue is empty, ``max_items`` were taken or
+        ``deadline`` (a ``time.perf_counter`` value) passes."""
+        items: List[T] = []
+        while max_items is None or len(items) < max_items:
+            # checking the clock every item would cost more than the pops themselves
+            if len(items) % 64 == 0 and items and time.perf_counter() >= deadline:
+                break
+            try:
+                items.append(self.get_nowait())
+            except queue.Empty:
+                break
+        return items
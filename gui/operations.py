@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import itertools
+import queue
+import tkinter as tk
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from tkinter import messagebox
+from typing import Any, Callable, Optional
+
+from gui.theme import LIGHT_THEME, ThemePalette
+
+
+@dataclass
+class Operation:
+    op_id: int
+    label: str
+    future: Future
+    on_done: Optional[Callable[[Any], None]] = None
+    on_error: Optional[Callable[[BaseException], None]] = None
+    on_cancel: Optional[Callable[[], None]] = None
+    progress: Optional[Callable[[], Optional[str]]] = None
+    cancel_fn: Optional[Callable[[], bool]] = None
+    progress_text: str = ""
+    background: bool = False
+    finished: bool = field(default=False)
+
+    @property
+    def cancellable(self) -> bool:
+        return not self.finished and (self.cancel_fn is not None or not self.future.done())
+
+    def describe(self) -> str:
+        return f"{self.label} ({self.progress_text})" if self.progress_text else self.label
+
+
+class OperationTracker:
+    """Runs GUI callbacks for bot-control futures on the Tk thread.
+
+    Futures complete on the bot loop or a worker thread; their done-callbacks
+    only push onto a queue, which ``_poll`` drains with ``after()`` while
+    anything is pending. The poll also refreshes progress text, and
+    listeners (the pending-operations bar) are told whenever the set of
+    pending operations or their progress changes.
+    """
+
+    def __init__(self, widget: tk.Misc, *, poll_interval: int = 100) -> None:
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self._ids = itertools.count(1)
+        self._pending: dict[int, Operation] = {}
+        self._completed: queue.Queue[Operation] = queue.Queue()
+        self._listeners: list[Callable[[list[Operation]], None]] = []
+        self._poll_job: Optional[str] = None
+
+    def run(
+        self,
+        label: str,
+        future: Future,
+        *,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+        progress: Optional[Callable[[], Optional[str]]] = None,
+        cancel: Optional[Callable[[], bool]] = None,
+        background: bool = False,
+    ) -> Operation:
+        """Deliver ``future``'s outcome on the Tk thread.
+
+        ``background`` operations (initial data loads) are not listed in the
+        pending-operations bar and cannot be cancelled from it.
+        """
+        operation = Operation(
+            op_id=next(self._ids),
+            label=label,
+            future=future,
+            on_done=on_done,
+            on_error=on_error,
+            on_cancel=on_cancel,
+            progress=progress,
+            cancel_fn=cancel,
+            background=background,
+        )
+        self._pending[operation.op_id] = operation
+        future.add_done_callback(lambda _future: self._completed.put(operation))
+        self._notify()
+        self._ensure_polling()
+        return operation
+
+    def cancel(self, operation: Operation) -> bool:
+        if operation.finished:
+            return False
+        if operation.cancel_fn is not None:
+            # cooperative (bulk jobs): the future resolves once the job stops
+            requested = operation.cancel_fn()
+            if requested:
+                operation.progress_text = "cancelling"
+                self._notify()
+            return requested
+        return operation.future.cancel()
+
+    def pending(self) -> list[Operation]:
+        return [operation for operation in self._pending.values() if not operation.background]
+
+    def subscribe(self, listener: Callable[[list[Operation]], None]) -> None:
+        self._listeners.append(listener)
+        listener(self.pending())
+
+    def _ensure_polling(self) -> None:
+        if self._poll_job is None:
+            self._poll_job = self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        changed = False
+        while True:
+            try:
+                operation = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(operation)
+            changed = True
+        for operation in self._pending.values():
+            if operation.progress is None:
+                continue
+            try:
+                text = operation.progress() or ""
+            except Exception:
+                continue
+            if text != operation.progress_text and operation.progress_text != "cancelling":
+                operation.progress_text = text
+                changed = True
+        if changed:
+            self._notify()
+        if self._pending:
+            self._ensure_polling()
+
+    def _finish(self, operation: Operation) -> None:
+        operation.finished = True
+        self._pending.pop(operation.op_id, None)
+        future = operation.future
+        try:
+            result = future.result()
+        except CancelledError:
+            if operation.on_cancel is not None:
+                self._deliver(lambda _value: operation.on_cancel(), None)
+            return
+        except Exception as exc:
+            self._deliver(operation.on_error or (lambda error: self._show_error(operation, error)), exc)
+            return
+        if operation.on_done is not None:
+            self._deliver(operation.on_done, result)
+
+    def _deliver(self, callback: Callable[[Any], None], value: Any) -> None:
+        try:
+            callback(value)
+        except tk.TclError:
+            # the panel that asked was destroyed (e.g. paths reloaded) meanwhile
+            pass
+        except Exception as exc:
+            # keep polling for the other operations
+            print(f"[GUI] Callback for a bot action failed: {exc}")
+
+    @staticmethod
+    def _show_error(operation: Operation, error: BaseException) -> None:
+        messagebox.showerror(operation.label, str(error))
+
+    def _notify(self) -> None:
+        pending = self.pending()
+        alive = []
+        for listener in self._listeners:
+            try:
+                listener(pending)
+            except tk.TclError:
+                continue
+            alive.append(listener)
+        self._listeners = alive
+
+
+class PendingOperationsBar(tk.Frame):
+    """One-line summary of running bot actions with a cancel button."""
+
+    def __init__(self, master, tracker: OperationTracker) -> None:
+        super().__init__(master)
+        self.tracker = tracker
+        self._theme: ThemePalette = LIGHT_THEME
+        self._text_var = tk.StringVar(value="")
+        self._label = tk.Label(self, textvariable=self._text_var, anchor="w", justify=tk.LEFT, wraplength=260)
+        self._label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 6), pady=4)
+        self._cancel_button = tk.Button(self, text="Cancel", command=self._cancel_latest, state=tk.DISABLED)
+        self._cancel_button.pack(side=tk.RIGHT, padx=(0, 10), pady=4)
+        tracker.subscribe(self._show)
+
+    def _show(self, pending: list[Operation]) -> None:
+        if not pending:
+            self._text_var.set("No pending bot actions.")
+        else:
+            self._text_var.set("Pending: " + ", ".join(operation.describe() for operation in pending))
+        cancellable = any(operation.cancellable for operation in pending)
+        self._cancel_button.configure(state=tk.NORMAL if cancellable else tk.DISABLED)
+
+    def _cancel_latest(self) -> None:
+        for operation in reversed(self.tracker.pending()):
+            if operation.cancellable:
+                self.tracker.cancel(operation)
+                return
+
+    def apply_theme(self, theme: ThemePalette) -> None:
+        self._theme = theme
+        self.configure(bg=theme.panel_bg)
+        self._label.configure(bg=theme.panel_bg, fg=theme.fg)
+        self._cancel_button.configure(
+            bg=theme.button_bg,
+            fg=theme.button_fg,
+            activebackground=theme.accent,
+            activeforeground=theme.console_fg,
+            highlightbackground=theme.panel_bg,
+            borderwidth=1,
+            relief=tk.FLAT,
+        )
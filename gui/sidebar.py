@@ -3,12 +3,51 @@ from __future__ import annotations
 import datetime
 import time
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import messagebox, ttk
 from typing import Callable
 
+from gui.lazy import LazyTab, load_in_background
+from gui.operations import Operation, OperationTracker, PendingOperationsBar
 from gui.theme import LIGHT_THEME, ThemePalette
+from gui.tree_sync import TreeRowSync
+from gui.virtual_list import VirtualListView
 from services import bot_control_service, list_service, userdata_service
+from services.list_index import CombinedListIndex, ListFileIndex
+from services.search_index import UserSearchIndex
 from services.server_config import get_active_servers, server_map
+from services.userdata_store import UserdataStore
+
+_LOADING_ROW = "__loading__"
+
+
+def track_bulk_job(
+    operations: OperationTracker,
+    label: str,
+    job_id: str,
+    *,
+    on_done: Callable[[dict], None],
+    on_progress: Callable[[dict], None] | None = None,
+    on_error: Callable[[BaseException], None] | None = None,
+) -> Operation:
+    """Follow a background bulk job until it finishes; it can be cancelled from the pending bar."""
+
+    def progress() -> str | None:
+        status = bot_control_service.get_job_status(job_id)
+        if status is None:
+            return None
+        if on_progress is not None:
+            on_progress(status)
+        return f"{status['done']}/{status['total']}"
+
+    return operations.run(
+        label,
+        bot_control_service.wait_for_job(job_id),
+        on_done=on_done,
+        on_error=on_error,
+        progress=progress,
+        cancel=lambda: bot_control_service.cancel_job(job_id),
+    )
 
 
 class DeadPlayersPanel(tk.Frame):
@@ -18,21 +57,28 @@ class DeadPlayersPanel(tk.Frame):
         *,
         userdata_path: str,
         servers: list[dict],
+        operations: OperationTracker,
         wait_time_seconds: int | None = None,
         refresh_interval: int = 5_000,
+        active_server_id: str | None = None,
     ) -> None:
         super().__init__(master)
         self.userdata_path = userdata_path
+        self.operations = operations
         self.servers = servers
         self._server_lookup = server_map(servers)
-        self._active_server_id: str | None = None
+        self._active_server_id = active_server_id
         self.refresh_interval = refresh_interval
         self._default_wait_seconds = self._normalize_wait_time(wait_time_seconds)
         self._theme: ThemePalette = LIGHT_THEME
         self._tree = self._build_tree()
+        self._rows = TreeRowSync(self._tree)
+        self._store = UserdataStore(userdata_path)
+        self._view_key: tuple | None = None
+        self._loaded = False
         self._context_menu = self._build_menu()
         self._actions = self._build_actions()
-        self._poll()
+        self._load_initial()
 
     def _build_tree(self) -> ttk.Treeview:
         columns = ("server", "discord", "steam", "death", "status", "revive")
@@ -74,15 +120,15 @@ class DeadPlayersPanel(tk.Frame):
         menu = tk.Menu(self, tearoff=0)
         menu.add_command(
             label="Force Revive",
-            command=lambda: self._act(bot_control_service.force_revive_user),
+            command=lambda: self._act("Force revive", bot_control_service.force_revive_user),
         )
         menu.add_command(
             label="Force Mark Dead",
-            command=lambda: self._act(bot_control_service.force_mark_dead),
+            command=lambda: self._act("Force mark dead", bot_control_service.force_mark_dead),
         )
         menu.add_command(
             label="Remove from DB",
-            command=lambda: self._act(bot_control_service.remove_user_from_database),
+            command=lambda: self._act("Remove from DB", bot_control_service.remove_user_from_database),
         )
         menu.add_separator()
         menu.add_command(label="View death details", command=self._view_details)
@@ -93,23 +139,27 @@ class DeadPlayersPanel(tk.Frame):
             return
         self._context_menu.tk_popup(event.x_root, event.y_root)
 
-    def _act(self, fn: Callable[[str, str], bool]) -> None:
+    def _act(self, label: str, fn: Callable[[str, str], "Future[bool]"]) -> None:
         selection = self._tree.selection()
         if not selection:
             return
         discord_id = selection[0]
-        try:
-            success = fn(self.userdata_path, discord_id)
-        except Exception as exc:
-            messagebox.showerror("Action failed", str(exc))
-            return
-        if success:
-            self.refresh()
-        else:
-            messagebox.showwarning("Action failed", "Unable to modify that entry.")
+
+        def on_done(success: bool) -> None:
+            if success:
+                self.refresh()
+            else:
+                messagebox.showwarning("Action failed", "Unable to modify that entry.")
+
+        self.operations.run(
+            label,
+            fn(self.userdata_path, discord_id),
+            on_done=on_done,
+            on_error=lambda exc: messagebox.showerror("Action failed", str(exc)),
+        )
 
     def _revive_selected(self) -> None:
-        self._act(bot_control_service.force_revive_user)
+        self._act("Force revive", bot_control_service.force_revive_user)
 
     def _revive_all(self) -> None:
         if not messagebox.askyesno(
@@ -117,11 +167,56 @@ class DeadPlayersPanel(tk.Frame):
             "Revive all dead players and restore their Discord roles?",
         ):
             return
-        try:
-            revived = bot_control_service.force_revive_all_users(self.userdata_path)
-        except Exception as exc:
-            messagebox.showerror("Revive Everyone", str(exc))
+        self._revive_all_button.configure(state=tk.DISABLED)
+        self.operations.run(
+            "Revive everyone",
+            bot_control_service.start_revive_all_job(),
+            on_done=self._on_revive_all_started,
+            on_error=self._on_revive_all_failed,
+            on_cancel=self._reset_revive_all_button,
+        )
+
+    def _on_revive_all_started(self, job: dict | None) -> None:
+        if job is None:
+            # bot offline: revive in the database only
+            self.operations.run(
+                "Revive everyone",
+                bot_control_service.force_revive_all_users(self.userdata_path),
+                on_done=self._on_offline_revive_done,
+                on_error=self._on_revive_all_failed,
+                on_cancel=self._reset_revive_all_button,
+            )
             return
+        track_bulk_job(
+            self.operations,
+            "Revive everyone",
+            job["job_id"],
+            on_progress=lambda status: self._revive_all_button.configure(
+                text=f"Reviving... {status['done']}/{status['total']}"
+            ),
+            on_done=self._on_revive_all_done,
+            on_error=self._on_revive_all_failed,
+        )
+
+    def _reset_revive_all_button(self) -> None:
+        self._revive_all_button.configure(text="Revive Everyone", state=tk.NORMAL)
+
+    def _on_revive_all_failed(self, exc: BaseException) -> None:
+        self._reset_revive_all_button()
+        messagebox.showerror("Revive Everyone", str(exc))
+
+    def _on_offline_revive_done(self, revived: int) -> None:
+        self._reset_revive_all_button()
+        self._show_revive_result(revived)
+
+    def _on_revive_all_done(self, status: dict) -> None:
+        self._reset_revive_all_button()
+        if status["status"] == "failed":
+            messagebox.showerror("Revive Everyone", status["message"])
+        else:
+            self._show_revive_result(status["result"])
+
+    def _show_revive_result(self, revived: int) -> None:
         if revived == 0:
             messagebox.showinfo(
                 "Revive Everyone",
@@ -149,14 +244,45 @@ class DeadPlayersPanel(tk.Frame):
         )
         messagebox.showinfo("Death Details", message)
 
-    def refresh(self) -> None:
-        previous_selection = self._tree.selection()
-        previous_focus = self._tree.focus()
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-        available_items: list[str] = []
-        for entry in userdata_service.list_dead_players(
-            self.userdata_path, default_wait_seconds=self._default_wait_seconds
+    def _load_initial(self) -> None:
+        # the first parse of a large DB happens on the loader thread; later
+        # polls hit the store's cache unless the file changed
+        self._tree.insert("", tk.END, iid=_LOADING_ROW, values=("Loading…", "", "", "", "", ""))
+
+        def on_loaded(_result=None) -> None:
+            self._loaded = True
+            if self._tree.exists(_LOADING_ROW):
+                self._tree.delete(_LOADING_ROW)
+            self._poll()
+
+        self.operations.run(
+            "Load dead players",
+            load_in_background(self._store.load),
+            on_done=on_loaded,
+            on_error=lambda _exc: on_loaded(),
+            background=True,
+        )
+
+    def refresh(self, *, force: bool = False) -> None:
+        # the panel keeps its own store: it only re-parses the DB when the file
+        # changed, and the bot thread never mutates the document read here
+        if not self._loaded:
+            return
+        try:
+            data = self._store.load()
+        except (OSError, ValueError):
+            # missing or half-written file; keep the rows we have until the next poll
+            return
+        view_key = (self._store.version, self._active_server_id, self._default_wait_seconds)
+        if view_key == self._view_key and not force:
+            return
+        self._view_key = view_key
+        self._rows.apply(self._build_rows(data))
+
+    def _build_rows(self, data: dict) -> list[tuple[str, tuple]]:
+        rows = []
+        for entry in userdata_service.dead_players_from_data(
+            data, default_wait_seconds=self._default_wait_seconds
         ):
             death_servers = entry.get("death_servers", [])
             if self._active_server_id:
@@ -173,27 +299,20 @@ class DeadPlayersPanel(tk.Frame):
                 display_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
             else:
                 display_time = "Unknown"
-            iid = entry["discord_id"]
-            self._tree.insert(
-                "",
-                tk.END,
-                iid=iid,
-                values=(
-                    server_label,
-                    entry["discord_name"],
-                    entry["steam64"],
-                    display_time,
-                    entry["alive_status"],
-                    entry["revival_eta"],
-                ),
+            rows.append(
+                (
+                    entry["discord_id"],
+                    (
+                        server_label,
+                        entry["discord_name"],
+                        entry["steam64"],
+                        display_time,
+                        entry["alive_status"],
+                        entry["revival_eta"],
+                    ),
+                )
             )
-            available_items.append(iid)
-
-        preserved_selection = [item for item in previous_selection if item in available_items]
-        if preserved_selection:
-            self._tree.selection_set(preserved_selection)
-            focus_target = previous_focus if previous_focus in preserved_selection else preserved_selection[0]
-            self._tree.focus(focus_target)
+        return rows
 
     def _poll(self) -> None:
         if not self.winfo_exists():
@@ -251,12 +370,21 @@ class DeadPlayersPanel(tk.Frame):
 
 
 class DeathCounterPanel(tk.Frame):
-    def __init__(self, master, *, death_counter_path: str, servers: list[dict]) -> None:
+    def __init__(
+        self,
+        master,
+        *,
+        death_counter_path: str,
+        servers: list[dict],
+        operations: OperationTracker,
+        active_server_id: str | None = None,
+    ) -> None:
         super().__init__(master)
         self.death_counter_path = death_counter_path
+        self.operations = operations
         self.servers = servers
         self._server_lookup = server_map(servers)
-        self._active_server_id: str | None = None
+        self._active_server_id = active_server_id
         self._theme: ThemePalette = LIGHT_THEME
         self._count_var = tk.StringVar(value="0")
         self._status_var = tk.StringVar(value="")
@@ -338,11 +466,14 @@ class DeathCounterPanel(tk.Frame):
         self._buttons.append(self._plus_button)
 
     def refresh(self) -> None:
-        try:
-            summary = bot_control_service.get_death_counter_summary(self.death_counter_path)
-        except Exception as exc:
-            messagebox.showerror("Death Counter", str(exc))
-            return
+        self.operations.run(
+            "Load death counter",
+            bot_control_service.get_death_counter_summary(self.death_counter_path),
+            on_done=self._show_summary,
+            on_error=lambda exc: messagebox.showerror("Death Counter", str(exc)),
+        )
+
+    def _show_summary(self, summary: dict) -> None:
         count = int(summary.get("count", 0))
         last_reset = int(summary.get("last_reset", 0))
         per_server = summary.get("per_server", {})
@@ -380,25 +511,31 @@ class DeathCounterPanel(tk.Frame):
             messagebox.showerror("Death Counter", "Please enter a valid integer value.")
             return
         self._update_counter(
-            lambda: bot_control_service.set_death_counter(self.death_counter_path, value)
+            "Set death counter",
+            bot_control_service.set_death_counter(self.death_counter_path, value),
         )
 
     def _adjust(self, delta: int) -> None:
         self._update_counter(
-            lambda: bot_control_service.adjust_death_counter(self.death_counter_path, delta)
+            "Adjust death counter",
+            bot_control_service.adjust_death_counter(self.death_counter_path, delta),
         )
 
     def _update_counter(
         self,
-        updater: Callable[[], dict],
+        label: str,
+        future: "Future[dict]",
         *,
         success_messages: tuple[str, str] | None = None,
     ) -> None:
-        try:
-            summary = updater()
-        except Exception as exc:
-            messagebox.showerror("Death Counter", str(exc))
-            return
+        self.operations.run(
+            label,
+            future,
+            on_done=lambda summary: self._show_update(summary, success_messages),
+            on_error=lambda exc: messagebox.showerror("Death Counter", str(exc)),
+        )
+
+    def _show_update(self, summary: dict, success_messages: tuple[str, str] | None) -> None:
         count = int(summary.get("count", 0))
         last_reset = int(summary.get("last_reset", 0))
         synced = bool(summary.get("synced", False))
@@ -416,8 +553,7 @@ class DeathCounterPanel(tk.Frame):
             self._status_var.set("Bot offline. Saved update to disk only.")
 
     def _refresh_activity(self, *, show_feedback: bool = True) -> None:
-        try:
-            bot_control_service.refresh_activity()
+        def on_done(_result) -> None:
             if show_feedback:
                 messagebox.showinfo(
                     "Bot Activity",
@@ -425,12 +561,20 @@ class DeathCounterPanel(tk.Frame):
                 )
             else:
                 self._status_var.set("Bot activity refreshed using the saved counter value.")
-        except Exception as exc:
+
+        def on_error(exc: BaseException) -> None:
             if show_feedback:
                 messagebox.showerror("Bot Activity", str(exc))
             else:
                 self._status_var.set(f"Unable to refresh bot activity: {exc}")
 
+        self.operations.run(
+            "Update bot activity",
+            bot_control_service.refresh_activity(),
+            on_done=on_done,
+            on_error=on_error,
+        )
+
     def _wipe_counter(self) -> None:
         confirm = messagebox.askyesno(
             "Death Counter",
@@ -439,7 +583,8 @@ class DeathCounterPanel(tk.Frame):
         if not confirm:
             return
         self._update_counter(
-            lambda: bot_control_service.wipe_death_counter(self.death_counter_path),
+            "Wipe death counter",
+            bot_control_service.wipe_death_counter(self.death_counter_path),
             success_messages=(
                 "Counter wiped and bot activity refreshed.",
                 "Bot offline. Counter wiped and saved to disk.",
@@ -498,18 +643,31 @@ class DeathCounterPanel(tk.Frame):
 
 
 class AdminManagerPanel(tk.Frame):
-    def __init__(self, master, *, userdata_path: str) -> None:
+    def __init__(
+        self,
+        master,
+        *,
+        userdata_path: str,
+        operations: OperationTracker,
+        search_delay_ms: int = 150,
+    ) -> None:
         super().__init__(master)
         self.userdata_path = userdata_path
+        self.operations = operations
+        self.search_delay_ms = search_delay_ms
         self._theme: ThemePalette = LIGHT_THEME
         self._entry_var = tk.StringVar()
         self._search_var = tk.StringVar()
         self._status_var = tk.StringVar(value="")
         self._buttons: list[tk.Button] = []
-        self._all_users: list[dict[str, str]] = []
+        self._store = UserdataStore(userdata_path)
+        self._search_index = UserSearchIndex()
+        self._indexed_version: int | None = None
+        self._search_job: str | None = None
         self._current_suggestions: list[dict[str, str]] = []
+        self._loading = True
         self._build_ui()
-        self.refresh()
+        self._load_initial()
 
     def _build_ui(self) -> None:
         self._title = tk.Label(self, text="Admins", font=("Segoe UI", 12, "bold"))
@@ -539,7 +697,7 @@ class AdminManagerPanel(tk.Frame):
 
         button_row = tk.Frame(self)
         button_row.pack(fill=tk.X, padx=10, pady=(0, 8))
-        refresh_btn = tk.Button(button_row, text="Refresh", command=self.refresh)
+        refresh_btn = tk.Button(button_row, text="Refresh", command=lambda: self.refresh(force=True))
         refresh_btn.pack(side=tk.LEFT)
         self._buttons.append(refresh_btn)
         remove_btn = tk.Button(
@@ -556,7 +714,7 @@ class AdminManagerPanel(tk.Frame):
         self._search_label.pack(side=tk.LEFT)
         self._search_entry = tk.Entry(search_frame, textvariable=self._search_var)
         self._search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(6, 0))
-        self._search_var.trace_add("write", lambda *_: self._update_suggestions())
+        self._search_var.trace_add("write", lambda *_: self._schedule_suggestions())
 
         self._suggestion_list = tk.Listbox(self, height=5)
         self._suggestion_list.pack(fill=tk.BOTH, expand=False, padx=10, pady=(0, 6))
@@ -573,13 +731,55 @@ class AdminManagerPanel(tk.Frame):
         add_btn.pack(side=tk.LEFT)
         self._buttons.append(add_btn)
 
-    def refresh(self) -> None:
+    def _load_initial(self) -> None:
+        self._status_var.set("Loading admins…")
+        self.operations.run(
+            "Load admins",
+            load_in_background(self._build_index),
+            on_done=self._show_loaded,
+            on_error=self._show_load_error,
+            background=True,
+        )
+
+    def _build_index(self) -> tuple[int, dict, UserSearchIndex]:
+        # runs on the loader thread; the finished index is swapped in on the Tk thread
+        data = self._store.load()
+        index = UserSearchIndex()
+        index.sync(userdata_service.users_from_data(data))
+        return self._store.version, data, index
+
+    def _show_loaded(self, result: tuple[int, dict, UserSearchIndex]) -> None:
+        version, data, index = result
+        self._loading = False
+        self._search_index = index
+        self._indexed_version = version
+        self._show_admins(data)
+        # picks up anything written while the load was running
+        self.refresh()
+
+    def _show_load_error(self, exc: BaseException) -> None:
+        self._loading = False
+        self._status_var.set(f"Unable to load the userdata DB: {exc}")
+
+    def refresh(self, *, force: bool = False) -> None:
+        # the search index is only re-synced when the DB changed on disk
+        if self._loading:
+            return
+        if force:
+            self._store.invalidate()
         try:
-            admins = userdata_service.list_admins(self.userdata_path)
-            self._all_users = userdata_service.list_all_users(self.userdata_path)
+            data = self._store.load()
         except Exception as exc:
             messagebox.showerror("Admins", str(exc))
             return
+        if self._store.version == self._indexed_version and not force:
+            return
+        self._indexed_version = self._store.version
+        self._search_index.sync(userdata_service.users_from_data(data))
+        self._show_admins(data)
+
+    def _show_admins(self, data: dict) -> None:
+        admins = userdata_service.admins_from_data(data)
         self._tree.delete(*self._tree.get_children())
         for entry in admins:
             self._tree.insert(
@@ -600,23 +800,15 @@ class AdminManagerPanel(tk.Frame):
         if selection:
             self._entry_var.set(selection[0])
 
+    def _schedule_suggestions(self) -> None:
+        # wait for a pause in typing instead of searching on every keystroke
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.search_delay_ms, self._update_suggestions)
+
     def _update_suggestions(self) -> None:
-        query = self._search_var.get().strip().lower()
-        if not self._all_users:
-            self._current_suggestions = []
-            self._suggestion_list.delete(0, tk.END)
-            return
-        matches: list[dict[str, str]] = []
-        for entry in self._all_users:
-            haystacks = [
-                entry.get("username", "").lower(),
-                entry.get("discord_id", ""),
-                entry.get("steam_id", ""),
-            ]
-            if not query or any(query in hay for hay in haystacks if hay):
-                matches.append(entry)
-            if len(matches) >= 20:
-                break
+        self._search_job = None
+        matches = self._search_index.search(self._search_var.get())
         self._current_suggestions = matches
         self._suggestion_list.delete(0, tk.END)
         for entry in matches:
@@ -663,7 +855,7 @@ class AdminManagerPanel(tk.Frame):
         self._status_var.set(message)
         if not is_admin and self._entry_var.get() == discord_id:
             self._entry_var.set("")
-        self.refresh()
+        self.refresh(force=True)
 
     def apply_theme(self, theme: ThemePalette) -> None:
         self._theme = theme
@@ -737,27 +929,46 @@ class ListViewerPanel(tk.Frame):
         title: str,
         server_paths: dict[str, str],
         server_lookup: dict[str, dict],
+        operations: OperationTracker,
+        active_server_id: str | None = None,
     ) -> None:
         super().__init__(master)
         self.title = title
         self.server_paths = server_paths
         self.server_lookup = server_lookup
-        self._active_server_id: str | None = None
+        self.operations = operations
+        self._active_server_id = active_server_id
         self._theme: ThemePalette = LIGHT_THEME
+        self._source = CombinedListIndex([])
+        self._generation = 0
         self._label = tk.Label(self, text=title, font=("Segoe UI", 11, "bold"))
         self._label.pack(anchor="w", padx=6, pady=(6, 0))
 
-        columns = ("server", "steam")
-        self._tree = ttk.Treeview(self, columns=columns, show="headings", height=10)
-        self._tree.heading("server", text="Server")
-        self._tree.heading("steam", text="Steam64")
-        self._tree.column("server", width=140, anchor=tk.CENTER)
-        self._tree.column("steam", width=160, anchor=tk.CENTER)
-        self._tree.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+        self._search_frame = tk.Frame(self)
+        self._search_frame.pack(fill=tk.X, padx=6, pady=(6, 0))
+        self._search_var = tk.StringVar()
+        self._search_entry = tk.Entry(self._search_frame, textvariable=self._search_var)
+        self._search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._search_entry.bind("<Return>", lambda _event: self._find_next())
+        self._status_var = tk.StringVar(value="")
+        self._status_label = tk.Label(self, textvariable=self._status_var, anchor="w")
+
+        # only the visible rows exist as tree items; ban files run to tens of
+        # thousands of lines
+        self._view = VirtualListView(
+            self,
+            columns=(("server", "Server", 140), ("steam", "Steam64", 160)),
+            row_count=lambda: len(self._source),
+            fetch=self._fetch_rows,
+        )
+        self._view.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
+        self._status_label.pack(fill=tk.X, padx=6)
 
         self._button_frame = tk.Frame(self)
         self._button_frame.pack(fill=tk.X, padx=6, pady=(0, 6))
         self._buttons: list[tk.Button] = []
+        self._buttons.append(tk.Button(self._search_frame, text="Find", command=self._find_next))
+        self._buttons[-1].pack(side=tk.LEFT, padx=(6, 0))
         self._buttons.append(tk.Button(self._button_frame, text="Reload", command=self.reload))
         self._buttons[-1].pack(side=tk.LEFT)
         self._buttons.append(tk.Button(self._button_frame, text="Open File", command=self._open))
@@ -770,17 +981,56 @@ class ListViewerPanel(tk.Frame):
         self.reload()
 
     def reload(self) -> None:
-        self._tree.delete(*self._tree.get_children())
+        # files are indexed on the loader thread into a fresh index, which
+        # replaces the shown one when done; a newer reload wins over an older one
         if self._active_server_id:
-            path = self.server_paths.get(self._active_server_id, "")
-            for entry in list_service.load_list(path):
-                server_label = self._server_label(self._active_server_id)
-                self._tree.insert("", tk.END, values=(server_label, entry))
+            server_ids = [self._active_server_id]
+        else:
+            server_ids = list(self.server_paths)
+        source = CombinedListIndex(
+            [
+                (self._server_label(server_id), ListFileIndex(self.server_paths.get(server_id, "")))
+                for server_id in server_ids
+            ]
+        )
+        self._generation += 1
+        generation = self._generation
+        self._status_var.set("Loading…")
+
+        def on_done(_changed: bool) -> None:
+            if generation != self._generation:
+                return
+            self._source = source
+            count = len(source)
+            self._status_var.set(f"{count:,} entr{'ies' if count != 1 else 'y'}")
+            self._view.refresh()
+
+        def on_error(exc: BaseException) -> None:
+            if generation == self._generation:
+                self._status_var.set(f"Unable to read the list: {exc}")
+
+        self.operations.run(
+            f"Load {self.title.lower()}",
+            load_in_background(source.refresh),
+            on_done=on_done,
+            on_error=on_error,
+            background=True,
+        )
+
+    def _fetch_rows(self, start: int, stop: int) -> list[tuple]:
+        return self._source.rows(start, stop)
+
+    def _find_next(self) -> None:
+        query = self._search_var.get().strip()
+        if not query:
             return
-        for server_id, path in self.server_paths.items():
-            for entry in list_service.load_list(path):
-                server_label = self._server_label(server_id)
-                self._tree.insert("", tk.END, values=(server_label, entry))
+        selected = self._view.selected_row
+        row = self._source.find(query, 0 if selected is None else selected + 1)
+        if row is None:
+            self._status_var.set(f"No entry matches {query}.")
+            return
+        self._status_var.set(f"Entry {row + 1:,} of {len(self._source):,}")
+        self._view.jump_to(row)
 
     def _server_label(self, server_id: str) -> str:
         server = self.server_lookup.get(server_id, {})
@@ -815,7 +1065,18 @@ class ListViewerPanel(tk.Frame):
         self._theme = theme
         self.configure(bg=theme.panel_bg)
         self._label.configure(bg=theme.panel_bg, fg=theme.fg)
+        self._status_label.configure(bg=theme.panel_bg, fg=theme.fg)
         self._button_frame.configure(bg=theme.panel_bg)
+        self._search_frame.configure(bg=theme.panel_bg)
+        self._view.configure(bg=theme.panel_bg)
+        self._search_entry.configure(
+            bg=theme.console_bg,
+            fg=theme.console_fg,
+            insertbackground=theme.console_fg,
+            highlightbackground=theme.panel_bg,
+            highlightcolor=theme.panel_bg,
+            relief=tk.FLAT,
+        )
         for btn in getattr(self, "_buttons", []):
             btn.configure(
                 bg=theme.button_bg,
@@ -843,13 +1104,14 @@ class ListViewerPanel(tk.Frame):
             foreground=[("selected", theme.console_fg)],
         )
         style.configure(heading_style, background=theme.panel_bg, foreground=theme.fg)
-        self._tree.configure(style=tree_style)
+        self._view.tree.configure(style=tree_style)
 
 
 class DangerPanel(tk.Frame):
-    def __init__(self, master, *, userdata_path: str) -> None:
+    def __init__(self, master, *, userdata_path: str, operations: OperationTracker) -> None:
         super().__init__(master)
         self.userdata_path = userdata_path
+        self.operations = operations
         self._theme: ThemePalette = LIGHT_THEME
         self._build_ui()
 
@@ -894,15 +1156,11 @@ class DangerPanel(tk.Frame):
         ):
             return
         if userdata_service.wipe_database(self.userdata_path):
-            role_cleanup_message = ""
-            try:
-                removed = bot_control_service.clear_alive_dead_roles()
-                role_cleanup_message = f"\nRemoved alive/dead roles from {removed} member(s)."
-            except Exception as exc:
-                role_cleanup_message = f"\nFailed to remove alive/dead roles: {exc}"
-            messagebox.showinfo(
-                "Database wiped",
-                f"The userdata database has been reset.{role_cleanup_message}",
+            self._start_role_cleanup(
+                lambda summary: messagebox.showinfo(
+                    "Database wiped",
+                    f"The userdata database has been reset.\n{summary}",
+                ),
             )
         else:
             messagebox.showerror("Database wipe failed", "Unable to modify the userdata file.")
@@ -913,14 +1171,43 @@ class DangerPanel(tk.Frame):
             "Remove the alive/dead roles from every member?",
         ):
             return
-        try:
-            removed = bot_control_service.clear_alive_dead_roles()
-            messagebox.showinfo(
-                "Role Cleanup",
-                f"Removed alive/dead roles from {removed} member(s).",
+        self._start_role_cleanup(lambda summary: messagebox.showinfo("Role Cleanup", summary))
+
+    def _start_role_cleanup(self, report: Callable[[str], None]) -> None:
+        def reset_button() -> None:
+            self._role_wipe_button.configure(text="Remove Alive/Dead Roles", state=tk.NORMAL)
+
+        def on_error(exc: BaseException) -> None:
+            reset_button()
+            report(f"Failed to remove alive/dead roles: {exc}")
+
+        def on_done(status: dict) -> None:
+            reset_button()
+            if status["status"] == "failed":
+                report(f"Failed to remove alive/dead roles: {status['message']}")
+            else:
+                report(f"Removed alive/dead roles from {status['result']} member(s).")
+
+        def on_started(job: dict) -> None:
+            track_bulk_job(
+                self.operations,
+                "Remove alive/dead roles",
+                job["job_id"],
+                on_progress=lambda status: self._role_wipe_button.configure(
+                    text=f"Removing roles... {status['done']}/{status['total']}"
+                ),
+                on_done=on_done,
+                on_error=on_error,
             )
-        except Exception as exc:
-            messagebox.showerror("Role Cleanup Failed", str(exc))
+
+        self._role_wipe_button.configure(state=tk.DISABLED)
+        self.operations.run(
+            "Remove alive/dead roles",
+            bot_control_service.start_role_cleanup_job(),
+            on_done=on_started,
+            on_error=on_error,
+            on_cancel=reset_button,
+        )
 
     def apply_theme(self, theme: ThemePalette) -> None:
         self._theme = theme
@@ -941,74 +1228,110 @@ class DangerPanel(tk.Frame):
 
 
 class SidebarPane(tk.Frame):
+    _PANELS = ("_dead_panel", "_counter_panel", "_whitelist_panel", "_banlist_panel", "_admin_panel", "_danger_panel")
+
     def __init__(self, master, *, config: dict) -> None:
         super().__init__(master)
         self.config_data = config
         self.servers = get_active_servers(config)
         self._server_lookup = server_map(self.servers)
         self._theme: ThemePalette = LIGHT_THEME
+        self._active_server_id: str | None = None
+        # outlives _build_ui so actions started before a paths reload still finish
+        self.operations = OperationTracker(self)
         self._build_ui()
 
     def _build_ui(self) -> None:
         self._container = tk.Frame(self, bg=self._theme.panel_bg)
         self._container.pack(fill=tk.BOTH, expand=True)
 
+        self._operations_bar = PendingOperationsBar(self._container, self.operations)
+        self._operations_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
         self._notebook = ttk.Notebook(self._container, style="Sidebar.TNotebook")
         self._notebook.pack(fill=tk.BOTH, expand=True)
 
+        # panels are built the first time their tab is shown and load their
+        # data in the background, so the window appears before any file is read
+        self._notebook.add(LazyTab(self._notebook, self._build_dead_panel), text="Currently Dead")
+        # built up front: it schedules the presence refresh shortly after
+        # start-up, and its summary already arrives through the bot bridge
+        self._notebook.add(self._build_counter_panel(self._notebook), text="Death Counter")
+
+        self._lists_notebook = ttk.Notebook(
+            self._notebook, style="Sidebar.SubNotebook.TNotebook"
+        )
+        self._lists_notebook.add(LazyTab(self._lists_notebook, self._build_whitelist_panel), text="Whitelist")
+        self._lists_notebook.add(LazyTab(self._lists_notebook, self._build_banlist_panel), text="Banlist")
+        self._notebook.add(self._lists_notebook, text="Lists")
+
+        self._notebook.add(LazyTab(self._notebook, self._build_admin_panel), text="Admins")
+        self._notebook.add(LazyTab(self._notebook, self._build_danger_panel), text="Danger")
+
+    def _lazy_tabs(self) -> list[LazyTab]:
+        tabs = []
+        for notebook in (getattr(self, "_notebook", None), getattr(self, "_lists_notebook", None)):
+            if notebook is not None:
+                tabs.extend(tab for tab in map(self.nametowidget, notebook.tabs()) if isinstance(tab, LazyTab))
+        return tabs
+
+    def _userdata_path(self) -> str:
+        return self.config_data.get("userdata_db_path", "userdata_db.json")
+
+    def _build_dead_panel(self, master) -> DeadPlayersPanel:
         self._dead_panel = DeadPlayersPanel(
-            self._notebook,
-            userdata_path=self.config_data.get("userdata_db_path", "userdata_db.json"),
+            master,
+            userdata_path=self._userdata_path(),
             servers=self.servers,
+            operations=self.operations,
             wait_time_seconds=self.config_data.get("wait_time_new_life_seconds"),
+            active_server_id=self._active_server_id,
         )
-        self._notebook.add(self._dead_panel, text="Currently Dead")
+        return self._dead_panel
 
+    def _build_counter_panel(self, master) -> DeathCounterPanel:
         self._counter_panel = DeathCounterPanel(
-            self._notebook,
+            master,
             death_counter_path=self.config_data.get("death_counter_path", "death_counter.json"),
             servers=self.servers,
+            operations=self.operations,
+            active_server_id=self._active_server_id,
         )
-        self._notebook.add(self._counter_panel, text="Death Counter")
+        return self._counter_panel
 
-        self._lists_notebook = ttk.Notebook(
-            self._notebook, style="Sidebar.SubNotebook.TNotebook"
-        )
-        whitelist_paths = {
-            str(server["server_id"]): server.get("path_to_whitelist", "")
-            for server in self.servers
-        }
-        banlist_paths = {
-            str(server["server_id"]): server.get("path_to_bans", "")
-            for server in self.servers
-        }
-        self._whitelist_panel = ListViewerPanel(
-            self._lists_notebook,
-            title="Whitelist",
-            server_paths=whitelist_paths,
-            server_lookup=self._server_lookup,
-        )
-        self._banlist_panel = ListViewerPanel(
-            self._lists_notebook,
-            title="Banlist",
-            server_paths=banlist_paths,
+    def _build_list_panel(self, master, title: str, path_key: str) -> ListViewerPanel:
+        return ListViewerPanel(
+            master,
+            title=title,
+            server_paths={str(server["server_id"]): server.get(path_key, "") for server in self.servers},
             server_lookup=self._server_lookup,
+            operations=self.operations,
+            active_server_id=self._active_server_id,
         )
-        self._lists_notebook.add(self._whitelist_panel, text="Whitelist")
-        self._lists_notebook.add(self._banlist_panel, text="Banlist")
-        self._notebook.add(self._lists_notebook, text="Lists")
 
+    def _build_whitelist_panel(self, master) -> ListViewerPanel:
+        self._whitelist_panel = self._build_list_panel(master, "Whitelist", "path_to_whitelist")
+        return self._whitelist_panel
+
+    def _build_banlist_panel(self, master) -> ListViewerPanel:
+        self._banlist_panel = self._build_list_panel(master, "Banlist", "path_to_bans")
+        return self._banlist_panel
+
+    def _build_admin_panel(self, master) -> AdminManagerPanel:
         self._admin_panel = AdminManagerPanel(
-            self._notebook,
-            userdata_path=self.config_data.get("userdata_db_path", "userdata_db.json"),
+            master,
+            userdata_path=self._userdata_path(),
+            operations=self.operations,
         )
-        self._notebook.add(self._admin_panel, text="Admins")
+        return self._admin_panel
 
+    def _build_danger_panel(self, master) -> DangerPanel:
         self._danger_panel = DangerPanel(
-            self._notebook,
-            userdata_path=self.config_data.get("userdata_db_path", "userdata_db.json"),
+            master,
+            userdata_path=self._userdata_path(),
+            operations=self.operations,
         )
-        self._notebook.add(self._danger_panel, text="Danger")
+        return self._danger_panel
 
     def update_death_counter(self, count: int, last_reset: int) -> None:
         if hasattr(self, "_counter_panel"):
@@ -1020,10 +1343,15 @@ class SidebarPane(tk.Frame):
         self._server_lookup = server_map(self.servers)
         for child in self.winfo_children():
             child.destroy()
+        # panels are recreated when their tab is next shown
+        for name in self._PANELS:
+            if hasattr(self, name):
+                delattr(self, name)
         self._build_ui()
         self.apply_theme(self._theme)
 
     def set_active_server(self, server_id: str | None) -> None:
+        self._active_server_id = server_id
         if hasattr(self, "_dead_panel"):
             self._dead_panel.set_active_server(server_id)
         if hasattr(self, "_counter_panel"):
@@ -1086,6 +1414,8 @@ class SidebarPane(tk.Frame):
             self._container.configure(bg=theme.panel_bg)
         if hasattr(self, "_lists_notebook"):
             self._lists_notebook.configure(style="Sidebar.SubNotebook.TNotebook")
+        for tab in self._lazy_tabs():
+            tab.apply_theme(theme)
         if hasattr(self, "_dead_panel"):
             self._dead_panel.apply_theme(theme)
         if hasattr(self, "_counter_panel"):
@@ -1098,3 +1428,5 @@ class SidebarPane(tk.Frame):
             self._admin_panel.apply_theme(theme)
         if hasattr(self, "_danger_panel"):
             self._danger_panel.apply_theme(theme)
+        if hasattr(self, "_operations_bar"):
+            self._operations_bar.apply_theme(theme)
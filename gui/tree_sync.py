@@ -0,0 +1,55 @@
+"""Apply row changes to a ``ttk.Treeview`` without rebuilding it."""
+from __future__ import annotations
+
+from tkinter import ttk
+from typing import Dict, Iterable, Tuple
+
+Row = Tuple[str, tuple]
+
+
+class TreeRowSync:
+    """Keeps a flat Treeview in step with a list of ``(iid, values)`` rows.
+
+    Only rows that appeared, disappeared, changed or moved are touched, so the
+    selection, focus and scroll position survive a refresh.
+    """
+
+    def __init__(self, tree: ttk.Treeview) -> None:
+        self.tree = tree
+        self._values: Dict[str, tuple] = {}
+
+    def apply(self, rows: Iterable[Row]) -> Dict[str, int]:
+        rows = list(rows)
+        wanted = {iid for iid, _ in rows}
+        stats = {"inserted": 0, "updated": 0, "removed": 0, "moved": 0}
+
+        stale = [iid for iid in self._values if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._values[iid]
+            stats["removed"] = len(stale)
+
+        current_order = list(self.tree.get_children())
+        for index, (iid, values) in enumerate(rows):
+            previous = self._values.get(iid)
+            if previous is None:
+                self.tree.insert("", index, iid=iid, values=values)
+                current_order.insert(index, iid)
+                stats["inserted"] += 1
+            else:
+                if previous != values:
+                    self.tree.item(iid, values=values)
+                    stats["updated"] += 1
+                if index >= len(current_order) or current_order[index] != iid:
+                    self.tree.move(iid, "", index)
+                    current_order.remove(iid)
+                    current_order.insert(index, iid)
+                    stats["moved"] += 1
+            self._values[iid] = values
+        return stats
+
+    def clear(self) -> None:
+        if self._values:
+            self.tree.delete(*self._values)
+        self._values.clear()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional, Sequence
+
+DEFAULT_ROW_HEIGHT = 24
+
+
+class VirtualListView(tk.Frame):
+    """Treeview that only materializes the rows currently on screen.
+
+    ``row_count()`` and ``fetch(start, stop)`` describe the data; the view
+    keeps one tree item per visible line and rewrites their values when the
+    user scrolls, so a list with a hundred thousand entries costs the same
+    to show as one with twenty. Selection is tracked by absolute row.
+    """
+
+    def __init__(
+        self,
+        master,
+        *,
+        columns: Sequence[tuple[str, str, int]],
+        row_count: Callable[[], int],
+        fetch: Callable[[int, int], list[tuple]],
+        row_height: int = DEFAULT_ROW_HEIGHT,
+    ) -> None:
+        super().__init__(master)
+        self._row_count = row_count
+        self._fetch = fetch
+        self._row_height = row_height
+        self._top = 0
+        self._visible = 10
+        self._selected: Optional[int] = None
+        self._items: list[str] = []
+
+        self.tree = ttk.Treeview(
+            self, columns=[key for key, _text, _width in columns], show="headings", height=10, selectmode="browse"
+        )
+        for key, text, width in columns:
+            self.tree.heading(key, text=text)
+            self.tree.column(key, width=width, anchor=tk.CENTER)
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _event: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _event: self.scroll_by(3))
+        for key, delta in (("<Up>", -1), ("<Down>", 1), ("<Prior>", None), ("<Next>", None)):
+            self.tree.bind(key, lambda event, delta=delta: self._on_key(event, delta))
+
+    @property
+    def selected_row(self) -> Optional[int]:
+        return self._selected
+
+    def set_row_height(self, row_height: int) -> None:
+        self._row_height = max(1, int(row_height))
+        self._on_resize()
+
+    def refresh(self) -> None:
+        """Redraw the visible window, e.g. after the underlying data changed."""
+        total = self._row_count()
+        if self._selected is not None and self._selected >= total:
+            self._selected = None
+        self._top = max(0, min(self._top, total - self._visible))
+        self._render()
+
+    def scroll_to(self, top: int) -> None:
+        total = self._row_count()
+        top = max(0, min(int(top), total - self._visible))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def scroll_by(self, rows: int) -> str:
+        self.scroll_to(self._top + rows)
+        return "break"
+
+    def jump_to(self, row: int, *, center: bool = True) -> None:
+        """Select ``row`` and scroll it into view, centred unless ``center`` is off."""
+        self._selected = row
+        if center and not self._top <= row < self._top + self._visible:
+            self._top = max(0, row - self._visible // 2)
+        elif row < self._top:
+            self._top = row
+        elif row >= self._top + self._visible:
+            self._top = row - self._visible + 1
+        self.refresh()
+
+    def _render(self) -> None:
+        total = self._row_count()
+        rows = self._fetch(self._top, self._top + self._visible) if total else []
+        while len(self._items) < len(rows):
+            self._items.append(self.tree.insert("", tk.END, values=()))
+        while len(self._items) > len(rows):
+            self.tree.delete(self._items.pop())
+        selected_item = None
+        for offset, (item, values) in enumerate(zip(self._items, rows)):
+            self.tree.item(item, values=values)
+            if self._top + offset == self._selected:
+                selected_item = item
+        current = self.tree.selection()
+        if selected_item is not None:
+            if current != (selected_item,):
+                self.tree.selection_set(selected_item)
+            self.tree.focus(selected_item)
+        elif current:
+            self.tree.selection_remove(*current)
+        if total:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + len(rows)) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def _on_resize(self, _event=None) -> None:
+        height = self.tree.winfo_height()
+        # the heading row takes roughly one row of space
+        visible = max(1, height // self._row_height - 1) if height > 1 else 10
+        if visible != self._visible:
+            self._visible = visible
+            self.refresh()
+
+    def _on_scrollbar(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self.scroll_to(round(float(value) * self._row_count()))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_by(int(value) * step)
+
+    def _on_wheel(self, event) -> str:
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_select(self, _event=None) -> None:
+        selection = self.tree.selection()
+        if selection and selection[0] in self._items:
+            self._selected = self._top + self._items.index(selection[0])
+
+    def _on_key(self, event, delta: Optional[int]) -> str:
+        if delta is None:
+            delta = -self._visible if event.keysym == "Prior" else self._visible
+        total = self._row_count()
+        if not total:
+            return "break"
+        current = self._selected if self._selected is not None else self._top
+        self.jump_to(max(0, min(total - 1, current + delta)), center=False)
+        return "break"
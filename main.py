@@ -9,19 +9,54 @@ import time
 import traceback
 import threading
 import ctypes
-from typing import Callable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
+from typing import Callable, Dict, List, Optional
 
 from nextcord import Interaction, SlashOption, ChannelType
 from nextcord.abc import GuildChannel
 from nextcord.ext import tasks, commands
-from nextcord.ext.commands import Bot
+from nextcord.ext.commands import AutoShardedBot, Bot
 from nextcord.member import Member
 import nextcord
 from nextcord import Webhook
 from dayz_dev_tools import guid as GUID
-from services import userdata_service
-from services.file_utils import atomic_write_lines, atomic_write_text, read_lines
+from services.bulk_jobs import DEFAULT_BULK_CONCURRENCY, BulkJob, bulk_jobs, run_concurrently
+from services.death_events import DeathEventQueue
+from services.death_log import DEFAULT_COMPACT_BYTES, DeathLogConsumer
+from services.debounce import LatestValueDebouncer
+from services.discord_actions import action_queue
+from services.error_digest import error_digest
+from services.member_index import member_index
+from services.guild_config import get_primary_guild_id, normalize_guilds
+from services.guild_resources import guild_resources
+from services.file_utils import (
+    DEFAULT_LOCK_TIMEOUT,
+    atomic_write_lines,
+    atomic_write_text,
+    configure_durability,
+    configure_file_locks,
+    read_lines,
+    register_file_class,
+)
+from services.list_service import (
+    add_steam_id_to_list,
+    apply_voice_check,
+    ban_in_state,
+    find_voice_member,
+    is_exempt_from_voice_check,
+    is_valid_steam_id,
+    load_server_list_state,
+    remove_steam_id_from_list,
+    remove_steam_id_occurrences,
+    remove_steam_ids_from_list,
+    sanitize_steam_id_list,
+    unban_in_state,
+    write_server_list_state,
+)
 from services.path_fields import PATH_FIELDS
+from services.runtime_config import set_runtime_config
+from services.timing import PhaseTimer
+from services.userdata_store import UserdataStore, get_userdata_store
 from services.server_config import (
     ensure_server_defaults,
     get_default_server_id,
@@ -42,11 +77,29 @@ os.chdir(SCRIPT_DIR)
 
 os.system("title " + "Life and Death Bot")
 
+# cogs do ``from main import ...``; when this file is the entry point, point
+# that at the running module instead of executing main.py a second time
+if __name__ == "__main__":
+    sys.modules.setdefault("main", sys.modules[__name__])
+
+DEFAULT_PATH_CHECK_TIMEOUT = 5.0
+DEFAULT_DEATH_COUNTER_FLUSH_SECONDS = 30.0
+# Discord throttles presence changes hard; a burst of deaths only needs the last one shown
+DEFAULT_PRESENCE_UPDATE_SECONDS = 15.0
+
 client: Optional[Bot] = None
 config: dict = {}
 death_counter_state: dict = {"count": 0, "last_reset": int(time.time())}
 death_counter_lock: Optional[asyncio.Lock] = None
 death_counter_observers: list[Callable[[int, int], None]] = []
+death_counter_dirty: bool = False
+presence_debouncer: Optional[LatestValueDebouncer] = None
+death_event_queue = DeathEventQueue()
+death_log_consumers: dict[str, DeathLogConsumer] = {}
+embedded_death_watcher: bool = False
+startup_timer: Optional[PhaseTimer] = None
+# (guild id, member id) -> squad channel created for a member whose move is still queued
+pending_squad_moves: dict[tuple[int, int], int] = {}
 
 
 class MissingConfigPaths(Exception):
@@ -65,11 +118,60 @@ def main(*, interactive: bool = True, death_log_callback: Optional[Callable[[str
     global client
     global config
     global death_counter_state
+    global embedded_death_watcher
+    global startup_timer
+
+    startup_timer = PhaseTimer("Startup")
 
     if (not os.path.isfile("config.json")):
         raise MissingConfigPaths(["config.json"])
 
     print("Loading config...")
+    with startup_timer.phase("load config"):
+        load_config()
+
+    with startup_timer.phase("check files"):
+        check_startup_files()
+
+    intents = nextcord.Intents.all()
+
+    with startup_timer.phase("create client"):
+        # shard count is picked by Discord unless pinned in config
+        client = AutoShardedBot(
+            command_prefix=config["prefix"],
+            intents=intents,
+            shard_count=config.get("shard_count") or None,
+        )
+
+    # expose config to cogs so optional components can read shared settings
+    client.config = config
+    client.death_watcher_logger = death_log_callback
+
+    watch_death_watcher_bans = int(config["watch_death_watcher"]) > 0
+    # the embedded watcher hands deaths over directly instead of through the
+    # deaths_<server>.txt files, which it keeps writing for external tools
+    embedded_death_watcher = (
+        watch_death_watcher_bans and int(config.get("run_death_watcher_cog", 0)) != 0
+    )
+    if embedded_death_watcher:
+        death_event_queue.bind(client.loop)
+        client.death_event_queue = death_event_queue
+
+    client.remove_command("help")
+    
+    with startup_timer.phase("load cogs"):
+        load_cogs()
+    
+    with startup_timer.phase("start tasks"):
+        start_tasks(watch_death_watcher_bans)
+    
+    print()
+
+
+def load_config() -> None:
+    """Parse and normalize config.json once and publish it to the cogs."""
+    global config
+
     with open("config.json") as file:
         config = json.load(file)
     servers = normalize_servers(config)
@@ -83,54 +185,93 @@ def main(*, interactive: bool = True, death_log_callback: Optional[Callable[[str
     config.setdefault("default_server_id", get_default_server_id(config, config["servers"]))
     config.setdefault("unban_scope", "active_server_only")
     config.setdefault("validate_whitelist_scope", "all_servers")
+    config["guild_configs"] = normalize_guilds(config)
+    config["guild_id"] = get_primary_guild_id(config)
     config["userdata_db_path"] = config.get("userdata_db_path") or "./userdata_db.json"
     config["steam_ids_to_unban_path"] = config.get("steam_ids_to_unban_path") or "./steam_ids_to_unban.txt"
     config["death_counter_path"] = config.get("death_counter_path") or "./death_counter.json"
     config["death_watcher_config_path"] = (
         config.get("death_watcher_config_path") or "./death_watcher/config.json"
     )
-
+    config["death_log_offsets_path"] = (
+        config.get("death_log_offsets_path") or "./death_watcher/death_log_offsets.json"
+    )
+    configure_file_locks(config.get("file_lock_timeout_seconds", DEFAULT_LOCK_TIMEOUT))
+    configure_durability(config.get("durability"))
+    action_queue.configure(config.get("discord_action_concurrency"))
+    error_digest.configure(
+        interval=config.get("error_digest_interval_seconds"),
+        min_send_interval=config.get("error_dump_min_interval_seconds"),
+        critical_prefixes=config.get("error_dump_critical_prefixes"),
+    )
+    register_file_class(config["userdata_db_path"], "userdata")
+    register_file_class(config["steam_ids_to_unban_path"], "lists")
+    register_file_class(config["death_log_offsets_path"], "cache")
+    for server in config["servers"]:
+        for key in ("path_to_bans", "path_to_whitelist"):
+            if server.get(key):
+                register_file_class(server[key], "lists")
+    set_runtime_config(config)
+
+
+def check_paths_exist(paths: List[str], timeout: float) -> Dict[str, Optional[bool]]:
+    """``os.path.isfile`` for every path at once. Paths that don't answer within
+    ``timeout`` (e.g. an unreachable network share) map to ``None``."""
+    results: Dict[str, Optional[bool]] = {path: None for path in paths if path}
+    if not results:
+        return results
+    executor = ThreadPoolExecutor(max_workers=min(8, len(results)))
+    futures = {executor.submit(os.path.isfile, path): path for path in results}
+    done, not_done = wait_for_futures(futures, timeout=timeout)
+    for future in done:
+        results[futures[future]] = bool(future.result())
+    for future in not_done:
+        print(f"Timed out after {timeout}s checking: {futures[future]}")
+    # a hung share must not hold up start-up; leave the stuck checks behind
+    executor.shutdown(wait=False)
+    return results
+
+
+def check_startup_files() -> None:
     load_death_counter_state()
 
+    enabled_servers = get_enabled_servers(config["active_servers"])
+    timeout = float(config.get("startup_path_check_timeout_seconds", DEFAULT_PATH_CHECK_TIMEOUT))
+    exists = check_paths_exist(
+        [config["userdata_db_path"], config["steam_ids_to_unban_path"]]
+        + [str(server.get(key, "")) for server in enabled_servers for key in ("path_to_whitelist", "path_to_bans")],
+        timeout,
+    )
+
     # create userdata db (json) file if it does not exist
-    if (not os.path.isfile(config["userdata_db_path"])):
+    if (exists.get(config["userdata_db_path"]) is False):
         print(f"Userdata db file ({config['userdata_db_path']}) not found. Creating it now.")
         atomic_write_text(
             config["userdata_db_path"], json.dumps({"userdata": {}, "season_deaths": []})
         )
 
-    # verify whitelist/ban file paths are valid per enabled server
+    # verify whitelist/ban file paths are valid per enabled server;
+    # unreachable ones are reported as missing
     missing_paths: List[str] = []
-    enabled_servers = get_enabled_servers(config["active_servers"])
     for server in enabled_servers:
         server_id = server["server_id"]
         whitelist_path = str(server.get("path_to_whitelist", ""))
         ban_path = str(server.get("path_to_bans", ""))
-        if not whitelist_path or not os.path.isfile(whitelist_path):
+        if not exists.get(whitelist_path):
             missing_paths.append(f"path_to_whitelist:{server_id}")
-        if not ban_path or not os.path.isfile(ban_path):
+        if not exists.get(ban_path):
             missing_paths.append(f"path_to_bans:{server_id}")
 
     if missing_paths:
         raise MissingConfigPaths(missing_paths)
 
-    if (not os.path.isfile(config["steam_ids_to_unban_path"])):
+    if (exists.get(config["steam_ids_to_unban_path"]) is False):
         print(f"Steam ids to unban file ({config['steam_ids_to_unban_path']}) not found. Creating it now.")
         atomic_write_text(config["steam_ids_to_unban_path"], "")
-    
-    intents = nextcord.Intents.all()
 
-    client = Bot(command_prefix=config["prefix"], intents=intents)
 
-    # expose config to cogs so optional components can read shared settings
-    client.config = config
-    client.death_watcher_logger = death_log_callback
-
-    client.remove_command("help")
-    
-    load_cogs()
-    
-    watch_death_watcher_bans = int(config["watch_death_watcher"]) > 0
+def start_tasks(watch_death_watcher_bans: bool) -> None:
+    enabled_servers = get_enabled_servers(config["active_servers"])
     if watch_death_watcher_bans:
         for server in enabled_servers:
             death_path = str(server.get("death_watcher_death_path", "")).strip()
@@ -143,17 +284,28 @@ def main(*, interactive: bool = True, death_log_callback: Optional[Callable[[str
                     f"Creating it now: ({death_path})"
                 )
                 atomic_write_text(death_path, "")
+            death_log_consumers[str(server["server_id"])] = DeathLogConsumer(
+                death_path,
+                config["death_log_offsets_path"],
+                compact_bytes=int(config.get("death_log_compact_bytes", DEFAULT_COMPACT_BYTES)),
+            )
     
+    flush_death_counter.change_interval(
+        seconds=float(config.get("death_counter_flush_seconds", DEFAULT_DEATH_COUNTER_FLUSH_SECONDS))
+    )
+    flush_death_counter.start()
     vc_check.start()
     check_if_users_can_revive.start()
     
+    if (embedded_death_watcher):
+        print("\nWatching for new deaths from the embedded death watcher")
+        process_death_events.start()
     if (watch_death_watcher_bans):
-        print("\nWatching for new death watcher deaths")
+        if not embedded_death_watcher:
+            print("\nWatching for new death watcher deaths")
         watch_for_new_deaths.start()
     print("Watching for users to unban")
     watch_for_users_to_unban.start()
-    
-    print()
 
 
 def load_cogs():
@@ -176,27 +328,6 @@ def load_cogs():
         client.load_extension(f"cogs.{cog_name}")
 
 
-def is_valid_steam_id(value: str) -> bool:
-    return value.isdigit() and len(value) == 17
-
-
-def sanitize_steam_id_list(values: List[str]) -> List[str]:
-    cleaned: List[str] = []
-    seen = set()
-    for value in values:
-        trimmed = value.strip()
-        if not is_valid_steam_id(trimmed) or trimmed in seen:
-            continue
-        cleaned.append(trimmed)
-        seen.add(trimmed)
-    return cleaned
-
-
-def remove_steam_id_occurrences(values: List[str], steam_id: str) -> List[str]:
-    target = str(steam_id)
-    return [value for value in values if value != target]
-
-
 def get_servers() -> List[dict]:
     if not config:
         return []
@@ -277,12 +408,38 @@ def load_death_counter_state() -> None:
 
 
 def save_death_counter_state() -> None:
+    global death_counter_dirty
+
     path = get_death_counter_path()
     directory = os.path.dirname(path)
     if directory and not os.path.isdir(directory):
         os.makedirs(directory, exist_ok=True)
 
     atomic_write_text(path, json.dumps(death_counter_state, indent=4))
+    death_counter_dirty = False
+
+
+def flush_death_counter_state() -> None:
+    """Write the counter if deaths were counted since the last write."""
+    if death_counter_dirty:
+        save_death_counter_state()
+
+
+@tasks.loop(seconds = DEFAULT_DEATH_COUNTER_FLUSH_SECONDS)
+async def flush_death_counter():
+    try:
+        flush_death_counter_state()
+    except Exception as exc:
+        print(f"[DeathCounter] Failed to save death counter: {exc}")
+
+
+def schedule_bot_activity_update(count: int, last_reset: int) -> None:
+    """Show the latest counter in the bot's presence, at most once per window."""
+    global presence_debouncer
+    if presence_debouncer is None:
+        window = config.get("presence_update_interval_seconds", DEFAULT_PRESENCE_UPDATE_SECONDS)
+        presence_debouncer = LatestValueDebouncer(update_bot_activity, window)
+    presence_debouncer.submit(count=count, last_reset=last_reset)
 
 
 def get_death_counter_lock() -> asyncio.Lock:
@@ -373,7 +530,7 @@ async def reset_death_counter() -> tuple[int, int]:
         count = death_counter_state["count"]
         last_reset = death_counter_state["last_reset"]
 
-    await update_bot_activity(count=count, last_reset=last_reset)
+    schedule_bot_activity_update(count, last_reset)
     _notify_death_counter_observers(count, last_reset)
     return count, last_reset
 
@@ -408,12 +565,14 @@ async def set_death_counter_value(count: int) -> tuple[int, int]:
         current = death_counter_state["count"]
         last_reset = int(death_counter_state.get("last_reset", int(time.time())))
 
-    await update_bot_activity(count=current, last_reset=last_reset)
+    schedule_bot_activity_update(current, last_reset)
     _notify_death_counter_observers(current, last_reset)
     return current, last_reset
 
 
 async def adjust_death_counter(delta: int, server_id: Optional[str] = None) -> tuple[int, int]:
+    global death_counter_dirty
+
     lock = get_death_counter_lock()
     async with lock:
         previous = int(death_counter_state.get("count", 0))
@@ -434,11 +593,12 @@ async def adjust_death_counter(delta: int, server_id: Optional[str] = None) -> t
             entry["count"] = max(0, entry_previous + int(delta))
             if entry["count"] == 0 and entry_previous != 0:
                 entry["last_reset"] = int(time.time())
-        save_death_counter_state()
+        # written by flush_death_counter; a burst of deaths costs one write
+        death_counter_dirty = True
         current = death_counter_state["count"]
         last_reset = int(death_counter_state.get("last_reset", int(time.time())))
 
-    await update_bot_activity(count=current, last_reset=last_reset)
+    schedule_bot_activity_update(current, last_reset)
     _notify_death_counter_observers(current, last_reset)
     return current, last_reset
             
@@ -449,67 +609,19 @@ async def vc_check():
     
     try:
         
-        guild = client.get_guild(config["guild_id"])
+        guilds = list(iter_guilds())
+        userdata_json = get_userdata().load()
 
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
-
-        enabled_servers = get_enabled_servers(get_servers())
-        server_state: dict[str, dict] = {}
-        for server in enabled_servers:
-            server_id = str(server["server_id"])
-            whitelist_path = server.get("path_to_whitelist", "")
-            blacklist_path = server.get("path_to_bans", "")
-            whitelist_raw = read_lines(whitelist_path)
-            blacklist_raw = read_lines(blacklist_path)
-            whitelist_list = sanitize_steam_id_list(whitelist_raw)
-            blacklist_list = sanitize_steam_id_list(blacklist_raw)
-            server_state[server_id] = {
-                "whitelist_path": whitelist_path,
-                "blacklist_path": blacklist_path,
-                "whitelist_list": whitelist_list,
-                "blacklist_list": blacklist_list,
-                "whitelist_updated": len(whitelist_list) != len(whitelist_raw),
-                "blacklist_updated": len(blacklist_list) != len(blacklist_raw),
-            }
+        server_state = load_server_list_state(get_enabled_servers(get_servers()))
         
-        
-        try:
-            join_vc_category = nextcord.utils.get(guild.categories, id=config["join_vc_category_id"])
-            category_voice_channels = None
-            if (join_vc_category == None):
-                print(f"Failed to find Category with id: {config['join_vc_category_id']}")
-            else:
-                category_voice_channels = join_vc_category.voice_channels
-                for vc in category_voice_channels:
-                    if (not len(vc.members)):
-                        #print(f"Deleting VoiceChannel ({vc.name})")
-                        await vc.delete()
-        except Exception as e:
-            category_voice_channels = None
-            print(f"Error deleting empty Voice Channels: \"{e}\"")
-        
-        try:
-            join_vc = nextcord.utils.get(guild.voice_channels, id=config["join_vc_id"])
-            if (join_vc == None):
-                print(f"Failed to find VoiceChannel with id: {config['join_vc_id']}")
-            else:
-                for member in join_vc.members:
-                    #print(f"Creating VoiceChannel for user with id: {member.id}")
-                    vc = await guild.create_voice_channel(name=str(member.id), category=join_vc_category, user_limit=5, reason=f"VoiceChannel created for user with id: {member.id}")
-                    await member.move_to(vc)
-        except Exception as e:
-            print(f"Error creating a new Voice Channel: \"{e}\"")
+        # voice channel housekeeping is independent per guild
+        await asyncio.gather(*(maintain_join_channels(block, guild) for block, guild in guilds))
         
         userdata_updated = False
         for user_id, userdata in userdata_json["userdata"].items():
 
-            try:
-                member = guild.get_member(int(user_id))
-            except:
-                member = None
-            
-            if (member != None and (member.bot or (int(userdata["is_alive"]) == 0 and int(userdata["is_admin"]) == 0))):
+            member, in_join_category = find_voice_member(guilds, user_id)
+            if is_exempt_from_voice_check(member, userdata):
                 continue
             
             is_admin = int(userdata["is_admin"])
@@ -525,65 +637,34 @@ async def vc_check():
             if not steam_id:
                 continue
 
-            try:
-                category_id = int(member.voice.channel.category_id)
-            except:
-                category_id = 0
-
-            if (is_admin != 0):
-                for server_id, state in server_state.items():
-                    if steam_id in state["blacklist_list"]:
-                        print(
-                            f"[Server {server_id}] Removed admin's ({userdata['username']}) "
-                            f"Steam ID from blacklist ({steam_id})"
-                        )
-                        state["blacklist_list"] = remove_steam_id_occurrences(
-                            state["blacklist_list"], steam_id
-                        )
-                        state["blacklist_updated"] = True
-                continue
-
-            scope_servers = resolve_user_scope_servers(userdata)
-            if (member != None and category_id == int(config["join_vc_category_id"])):
-                for server_id in scope_servers:
-                    state = server_state.get(server_id)
-                    if not state:
-                        continue
-                    if steam_id in state["blacklist_list"]:
-                        print(
-                            f"[Server {server_id}] User ({userdata['username']}) joined channel. "
-                            f"Removing Steam ID from blacklist ({steam_id})"
-                        )
-                        state["blacklist_list"] = remove_steam_id_occurrences(
-                            state["blacklist_list"], steam_id
-                        )
-                        state["blacklist_updated"] = True
-            elif member == None or category_id != int(config["join_vc_category_id"]):
-                for server_id in scope_servers:
-                    state = server_state.get(server_id)
-                    if not state:
-                        continue
-                    if steam_id not in state["blacklist_list"]:
-                        print(
-                            f"[Server {server_id}] User ({userdata['username']}) left channel. "
-                            f"Adding Steam ID to blacklist ({steam_id})"
-                        )
-                        state["blacklist_list"] = remove_steam_id_occurrences(
-                            state["blacklist_list"], steam_id
-                        )
-                        state["blacklist_list"].append(steam_id)
-                        state["blacklist_updated"] = True
+            changes = apply_voice_check(
+                server_state,
+                steam_id,
+                is_admin=is_admin != 0,
+                in_voice=member != None and in_join_category,
+                scope_servers=[] if is_admin != 0 else resolve_user_scope_servers(userdata),
+            )
+            for server_id, action in changes:
+                if (is_admin != 0):
+                    print(
+                        f"[Server {server_id}] Removed admin's ({userdata['username']}) "
+                        f"Steam ID from blacklist ({steam_id})"
+                    )
+                elif (action == "unban"):
+                    print(
+                        f"[Server {server_id}] User ({userdata['username']}) joined channel. "
+                        f"Removing Steam ID from blacklist ({steam_id})"
+                    )
+                else:
+                    print(
+                        f"[Server {server_id}] User ({userdata['username']}) left channel. "
+                        f"Adding Steam ID to blacklist ({steam_id})"
+                    )
 
         if userdata_updated:
-            atomic_write_text(
-                config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-            )
+            get_userdata().save(userdata_json)
 
-        for server_id, state in server_state.items():
-            if state["whitelist_updated"]:
-                atomic_write_lines(state["whitelist_path"], state["whitelist_list"])
-            if state["blacklist_updated"]:
-                atomic_write_lines(state["blacklist_path"], state["blacklist_list"])
+        write_server_list_state(server_state)
     
     except Exception as e:
         text = f"[VcCheck] \"{e}\"\nIt is advised to restart this script."
@@ -591,21 +672,83 @@ async def vc_check():
         await dump_error_discord(text, "Unexpected error")
 
 
+async def maintain_join_channels(block: dict, guild) -> None:
+    """Delete empty squad channels and give everyone in the join channel their own."""
+    try:
+        join_vc_category = guild_resources.channel(guild, block["join_vc_category_id"])
+        category_voice_channels = None
+        if (join_vc_category == None):
+            print(f"[{guild.name}] Failed to find Category with id: {block['join_vc_category_id']}")
+        else:
+            category_voice_channels = guild_resources.voice_channels_in(guild, join_vc_category.id)
+            awaiting_move = set(pending_squad_moves.values())
+            for vc in category_voice_channels:
+                # a fresh channel stays empty until the queued move goes through
+                if (not len(vc.members) and vc.id not in awaiting_move):
+                    #print(f"Deleting VoiceChannel ({vc.name})")
+                    await vc.delete()
+    except Exception as e:
+        join_vc_category = None
+        print(f"[{guild.name}] Error deleting empty Voice Channels: \"{e}\"")
+    
+    try:
+        join_vc = guild_resources.channel(guild, block["join_vc_id"])
+        if (join_vc == None):
+            print(f"[{guild.name}] Failed to find VoiceChannel with id: {block['join_vc_id']}")
+        else:
+            for member in join_vc.members:
+                key = (guild.id, member.id)
+                if (key in pending_squad_moves):
+                    continue
+                #print(f"Creating VoiceChannel for user with id: {member.id}")
+                vc = await guild.create_voice_channel(name=str(member.id), category=join_vc_category, user_limit=5, reason=f"VoiceChannel created for user with id: {member.id}")
+                pending_squad_moves[key] = vc.id
+                move = action_queue.move_to(member, vc)
+                # once the move lands (or fails) the normal bookkeeping takes over again
+                move.add_done_callback(lambda _future, key=key: pending_squad_moves.pop(key, None))
+    except Exception as e:
+        print(f"[{guild.name}] Error creating a new Voice Channel: \"{e}\"")
+
+
+def get_userdata() -> UserdataStore:
+    return get_userdata_store(config["userdata_db_path"])
+
+
+def get_guild_configs() -> List[dict]:
+    return config.get("guild_configs") or normalize_guilds(config)
+
+
+def iter_guilds():
+    """Yield ``(guild config block, guild)`` for every configured guild the bot is in."""
+    for block in get_guild_configs():
+        guild = client.get_guild(block["guild_id"])
+        if guild is not None:
+            yield block, guild
+
+
+def find_member(user_id):
+    """Return the first guild member for ``user_id`` across the configured guilds."""
+    for _, guild in iter_guilds():
+        member = guild.get_member(int(user_id))
+        if member is not None:
+            return member
+    return None
+
+
 @tasks.loop(seconds = 5)
 async def check_if_users_can_revive():
     await client.wait_until_ready()
     
     try:
         
-        guild = client.get_guild(config["guild_id"])
         #can_revive_role = nextcord.utils.get(guild.roles, id = config["can_revive_role"])
         #season_pass_role = nextcord.utils.get(guild.roles, id = config["season_pass_role"])
         
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
+        userdata_json = get_userdata().load()
         
         updated_users = 0
-        for user_id in userdata_json["season_deaths"]:
+        # unban_user removes revived players from season_deaths, so walk a copy
+        for user_id in list(userdata_json["season_deaths"]):
             
             try:
                 userdata = userdata_json["userdata"][user_id]
@@ -619,7 +762,7 @@ async def check_if_users_can_revive():
             if userdata["is_alive"] == 1:
                 continue
             
-            member = guild.get_member(int(user_id))
+            member = find_member(user_id)
             if (member == None or member.bot):
                 continue
             
@@ -631,12 +774,12 @@ async def check_if_users_can_revive():
                 await unban_user(member.id)
                 userdata["is_alive"] = 1
                 updated_users += 1
-                try:
-                    await member.send(f"It has been {config['wait_time_new_life_seconds']/60} minutes since your last death. You have been revived.")
-                except Exception as e:
-                    text = f"[MarkUserCanRevive] Failed to send revive dm to user: {member.id}"
-                    print(text)
-                    await dump_error_discord(text, "Unexpected error")
+                revive_dm = action_queue.send_dm(member, f"It has been {config['wait_time_new_life_seconds']/60} minutes since your last death. You have been revived.")
+                revive_dm.add_done_callback(
+                    lambda future, member_id=member.id: report_failed_action(
+                        future, f"[MarkUserCanRevive] Failed to send revive dm to user: {member_id}"
+                    )
+                )
                 """
                 if (not can_revive_role in member.roles):
                     await member.add_roles(can_revive_role)
@@ -650,9 +793,7 @@ async def check_if_users_can_revive():
             
         
         if (updated_users > 0):
-            atomic_write_text(
-                config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-            )
+            get_userdata().save(userdata_json)
     
     except Exception as e:
         text = f"[MarkUserCanRevive] \"{e}\"\nIt is advised to restart this script."
@@ -665,24 +806,19 @@ async def watch_for_new_deaths():
     await client.wait_until_ready()
     
     try:
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
-
         for server in get_enabled_servers(get_servers()):
             server_id = str(server["server_id"])
-            death_path = server.get("death_watcher_death_path", "")
-            if not death_path:
+            consumer = death_log_consumers.get(server_id)
+            if consumer is None:
                 continue
-            death_list = read_lines(death_path)
-            if not death_list:
-                continue
-            for guid in death_list:
-                for user_id, userdata in userdata_json["userdata"].items():
-                    if (str(guid) == str(userdata.get("guid")) and int(userdata["is_alive"]) != 0):
-                        await set_user_as_dead(user_id, server_id=server_id)
-
-            # clear file
-            atomic_write_text(death_path, "")
+            death_list = consumer.read_new()
+            # deaths from the embedded watcher were already delivered in-process;
+            # the log is only consumed here so it can be compacted
+            if death_list and not embedded_death_watcher:
+                for guid in death_list:
+                    await handle_new_death(guid, server_id=server_id)
+            consumer.commit()
+            consumer.compact()
     
     except Exception as e:
         text = f"[WatchForNewDeaths] \"{e}\"\nIt is advised to restart this script."
@@ -690,6 +826,28 @@ async def watch_for_new_deaths():
         await dump_error_discord(text, "Unexpected error")
 
 
+@tasks.loop(seconds = 0)
+async def process_death_events():
+    await client.wait_until_ready()
+
+    server_id, guid = await death_event_queue.get()
+    try:
+        await handle_new_death(guid, server_id=server_id)
+    except Exception as e:
+        text = f"[ProcessDeathEvents] \"{e}\"\nIt is advised to restart this script."
+        print(text)
+        await dump_error_discord(text, "Unexpected error")
+
+
+async def handle_new_death(guid: str, *, server_id: Optional[str] = None) -> None:
+    store = get_userdata()
+    # several entries can share a GUID (e.g. re-registered accounts); all of them die
+    for user_id in store.find_all_by_guid(guid):
+        userdata = store.load()["userdata"].get(user_id, {})
+        if (int(userdata.get("is_alive", 0)) != 0):
+            await set_user_as_dead(user_id, server_id=server_id)
+
+
 @tasks.loop(seconds = 2)
 async def watch_for_users_to_unban():
     
@@ -699,8 +857,7 @@ async def watch_for_users_to_unban():
         if (len(steam_ids) <= 1):
             return
         
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
+        userdata_json = get_userdata().load()
         
         if (steam_ids[1] == "-1"):
             print(f"Unbanning all players")
@@ -735,12 +892,9 @@ async def watch_for_users_to_unban():
 async def set_user_as_dead(user_id, *, server_id: Optional[str] = None):
     
     try:
-    
-        guild = client.get_guild(config["guild_id"])
         
         # update userdata (set user as dead)
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
+        userdata_json = get_userdata().load()
         userdata = userdata_json["userdata"][user_id]
         season_deaths = userdata_json["season_deaths"]
         
@@ -768,9 +922,7 @@ async def set_user_as_dead(user_id, *, server_id: Optional[str] = None):
         if (not str(user_id) in season_deaths):
             season_deaths.append(str(user_id))
         
-        atomic_write_text(
-            config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-        )
+        get_userdata().save(userdata_json)
         
         scope_servers = resolve_user_scope_servers(userdata)
         if server_id:
@@ -780,41 +932,37 @@ async def set_user_as_dead(user_id, *, server_id: Optional[str] = None):
             server = get_server_by_id(scoped_server_id)
             if not server:
                 continue
-            blacklist_path = server.get("path_to_bans", "")
-            blacklist_list_raw = read_lines(blacklist_path)
-            blacklist_list = sanitize_steam_id_list(blacklist_list_raw)
-            blacklist_list = remove_steam_id_occurrences(
-                blacklist_list, userdata["steam_id"]
-            )
-            blacklist_list.append(str(userdata["steam_id"]))
-            atomic_write_lines(blacklist_path, blacklist_list)
+            add_steam_id_to_list(server.get("path_to_bans", ""), userdata["steam_id"])
         
-        # update discord roles
-        member = guild.get_member(int(user_id))
-        if (member == None):
+        # update discord roles in every guild the player is in
+        found_member = False
+        for block, guild in iter_guilds():
+            member = guild.get_member(int(user_id))
+            if (member == None):
+                continue
+            found_member = True
+            
+            alive_role = guild_resources.role(guild, block["alive_role"])
+            dead_role = guild_resources.role(guild, block["dead_role"])
+            #can_revive_role = nextcord.utils.get(guild.roles, id = config["can_revive_role"])
+            
+            # queued so the role swap and voice kick below go out as one edit
+            action_queue.update_roles(member, add=[dead_role], remove=[alive_role])
+            #if (can_revive_role in member.roles):
+                #await member.remove_roles(can_revive_role)
+            
+            # kick user from voice channel
+            try:
+                channel = member.voice.channel
+                channel_id = channel.id
+                category_id = channel.category_id
+            except:
+                channel_id = -1
+                category_id = -1
+            if (channel_id == int(block["join_vc_id"]) or category_id == int(block["join_vc_category_id"])):
+                action_queue.disconnect_voice(member)
+        if (not found_member):
             return
-        
-        alive_role = nextcord.utils.get(guild.roles, id = config["alive_role"])
-        dead_role = nextcord.utils.get(guild.roles, id = config["dead_role"])
-        #can_revive_role = nextcord.utils.get(guild.roles, id = config["can_revive_role"])
-        
-        if (alive_role in member.roles):
-            await member.remove_roles(alive_role)
-        if (not dead_role in member.roles):
-            await member.add_roles(dead_role)
-        #if (can_revive_role in member.roles):
-            #await member.remove_roles(can_revive_role)
-        
-        # kick user from voice channel
-        try:
-            channel = member.voice.channel
-            channel_id = channel.id
-            category_id = channel.category_id
-        except:
-            channel_id = -1
-            category_id = -1
-        if (channel_id == int(config["join_vc_id"]) or category_id == int(config["join_vc_category_id"])):
-            await member.edit(voice_channel = None)
 
         print(f"[{server_label}] Marked user ({userdata['username']}) as dead.")
 
@@ -830,8 +978,7 @@ async def unban_user(user_id, *, scope_override: Optional[str] = None):
     
     try:
     
-        with open(config["userdata_db_path"], "r") as json_file:
-            userdata_json = json.load(json_file)
+        userdata_json = get_userdata().load()
         
         season_deaths = userdata_json["season_deaths"]
         
@@ -858,80 +1005,39 @@ async def unban_user(user_id, *, scope_override: Optional[str] = None):
         if (str(user_id) in season_deaths):
             season_deaths.remove(str(user_id))
         
-        atomic_write_text(
-            config["userdata_db_path"], json.dumps(userdata_json, indent=4)
-        )
+        get_userdata().save(userdata_json)
 
         scope_servers = resolve_user_scope_servers(
             userdata, scope=scope_override or get_unban_scope(config)
         )
 
-        # remove from death list
-        for scoped_server_id in scope_servers:
-            server = get_server_by_id(scoped_server_id)
-            if not server:
-                continue
-            death_path = server.get("death_watcher_death_path", "")
-            if not death_path:
-                continue
-            success = False
-            tries = 0
-            while not success and tries < 10:
-                try:
-                    deaths_list = read_lines(death_path)
-                    if str(userdata["steam_id"]) in deaths_list:
-                        deaths_list.remove(str(userdata["steam_id"]))
-                    atomic_write_lines(death_path, deaths_list)
-                    success = True
-                except Exception as e:
-                    print(
-                        "[UnbanUser] Attempt "
-                        f"{tries + 1} - Failed to open deaths list file: {death_path} '{e}'"
-                    )
-                    tries += 1
-                    time.sleep(0.25)
-
-            if not success:
-                print(f"Could not write user id: {user_id} to ban list after 10 tries.")
-                await dump_error_discord(
-                    f"Error unbanning user: `{user_id}`\nFailed to add user id to the ban list. "
-                    "(likely file permission error?)",
-                    "Unexpected error",
-                )
-                return
-
         # update user's roles + remove from blacklist(s)
         for scoped_server_id in scope_servers:
             server = get_server_by_id(scoped_server_id)
             if not server:
                 continue
-            blacklist_path = server.get("path_to_bans", "")
-            blacklist_list_raw = read_lines(blacklist_path)
-            blacklist_list = sanitize_steam_id_list(blacklist_list_raw)
-            updated_blacklist = remove_steam_id_occurrences(
-                blacklist_list, userdata["steam_id"]
-            )
-            if len(updated_blacklist) != len(blacklist_list):
-                atomic_write_lines(blacklist_path, updated_blacklist)
+            remove_steam_id_from_list(server.get("path_to_bans", ""), userdata["steam_id"])
 
-        guild = client.get_guild(config["guild_id"])
-        member = guild.get_member(int(user_id))
-        if (member == None):
+        found_member = False
+        for block, guild in iter_guilds():
+            member = guild.get_member(int(user_id))
+            if (member == None):
+                continue
+            found_member = True
+            
+            alive_role = guild_resources.role(guild, block["alive_role"])
+            dead_role = guild_resources.role(guild, block["dead_role"])
+            #can_revive_role = nextcord.utils.get(guild.roles, id = config["can_revive_role"])
+            
+            action_queue.update_roles(member, add=[alive_role], remove=[dead_role])
+            #if (can_revive_role in member.roles):
+                #await member.remove_roles(can_revive_role)
+        
+        if (not found_member):
             text = f"[UnbanUser] Found user in database but not in server. ({user_id}) Maybe they left the server?)"
             print(text)
             await dump_error_discord(text, "Warning")
             return
-
-        alive_role = nextcord.utils.get(guild.roles, id = config["alive_role"])
-        dead_role = nextcord.utils.get(guild.roles, id = config["dead_role"])
-        #can_revive_role = nextcord.utils.get(guild.roles, id = config["can_revive_role"])
-        
-        if (dead_role in member.roles):
-            await member.remove_roles(dead_role)
-        #if (can_revive_role in member.roles):
-            #await member.remove_roles(can_revive_role)
-        if (not alive_role in member.roles):
-            await member.add_roles(alive_role)
         
         print(f"Successfully unbanned: {userdata['username']}")
     
@@ -941,61 +1047,129 @@ async def unban_user(user_id, *, scope_override: Optional[str] = None):
         await dump_error_discord(text, "Unexpected error")
 
 
-async def bulk_revive_dead_users() -> int:
-    if not config:
-        return 0
-    path = config.get("userdata_db_path", "userdata_db.json")
-    try:
-        dead_players = userdata_service.list_dead_players(path)
-    except Exception as exc:
-        print(f"[BulkRevive] Failed to load userdata: {exc}")
-        return 0
+async def _revive_dead_users(job: BulkJob) -> None:
+    """Revive every dead player: one userdata write and one rewrite per ban list,
+    then the role swaps run concurrently through the action queue."""
+    store = get_userdata()
+    userdata_json = store.load()
 
-    revived = 0
-    for entry in dead_players:
-        discord_id = entry.get("discord_id")
-        if not discord_id:
+    revived_ids = []
+    for discord_id, userdata in userdata_json["userdata"].items():
+        # same coercion as list_dead_players: "0" counts as dead
+        if (int(userdata.get("is_alive", 1)) != 0):
             continue
-        try:
-            await unban_user(discord_id)
-            revived += 1
-        except Exception as exc:
-            print(f"[BulkRevive] Failed to revive {discord_id}: {exc}")
+        userdata["is_alive"] = 1
+        userdata["time_of_death"] = 0
+        userdata["can_revive"] = 0
+        revived_ids.append(discord_id)
 
-    print(f"[BulkRevive] Completed request. Revived {revived} players.")
-    return revived
+    if not revived_ids:
+        job.message = "No dead players were found in the database."
+        return
 
+    revived = set(revived_ids)
+    userdata_json["season_deaths"] = [
+        user_id for user_id in userdata_json["season_deaths"] if str(user_id) not in revived
+    ]
+    store.save(userdata_json)
+    job.result = len(revived_ids)
+
+    # group the unbans by ban list so every file is rewritten once
+    unbans_by_path = {}
+    unban_scope = get_unban_scope(config)
+    for discord_id in revived_ids:
+        userdata = userdata_json["userdata"][discord_id]
+        for scoped_server_id in resolve_user_scope_servers(userdata, scope=unban_scope):
+            server = get_server_by_id(scoped_server_id)
+            if not server or not server.get("path_to_bans"):
+                continue
+            unbans_by_path.setdefault(server["path_to_bans"], set()).add(userdata["steam_id"])
+    for path, steam_ids in unbans_by_path.items():
+        remove_steam_ids_from_list(path, steam_ids)
+
+    role_updates = []
+    for block, guild in iter_guilds():
+        alive_role = guild_resources.role(guild, block["alive_role"])
+        dead_role = guild_resources.role(guild, block["dead_role"])
+        for discord_id in revived_ids:
+            member = guild.get_member(int(discord_id))
+            if member is not None:
+                role_updates.append((member, alive_role, dead_role))
+
+    async def restore_roles(update) -> bool:
+        member, alive_role, dead_role = update
+        return await action_queue.update_roles(
+            member, add=[alive_role], remove=[dead_role], reason="Bulk revive"
+        )
 
-async def clear_alive_dead_roles() -> int:
-    if not config or client is None:
-        return 0
-    guild = client.get_guild(config["guild_id"])
-    if guild is None:
+    await run_concurrently(job, role_updates, restore_roles, get_bulk_concurrency())
+    job.message = f"Revived {len(revived_ids)} players."
+    print(f"[BulkRevive] Revived {len(revived_ids)} players, {job.done - job.failed}/{job.total} role updates applied.")
+
+
+async def _clear_alive_dead_roles(job: BulkJob) -> None:
+    role_removals = []
+    for block, guild in iter_guilds():
+        alive_role = guild_resources.role(guild, block["alive_role"])
+        dead_role = guild_resources.role(guild, block["dead_role"])
+        if alive_role is None and dead_role is None:
+            continue
+
+        for member in guild.members:
+            if member.bot:
+                continue
+            roles_to_remove = []
+            if alive_role and alive_role in member.roles:
+                roles_to_remove.append(alive_role)
+            if dead_role and dead_role in member.roles:
+                roles_to_remove.append(dead_role)
+            if roles_to_remove:
+                role_removals.append((member, roles_to_remove))
+
+    async def remove_roles(removal) -> bool:
+        member, roles_to_remove = removal
+        # failures are already logged by the action queue
+        return await action_queue.update_roles(
+            member, remove=roles_to_remove, reason="DeathWatcher wipe cleanup"
+        )
+
+    await run_concurrently(job, role_removals, remove_roles, get_bulk_concurrency())
+    job.result = job.done - job.failed
+    job.message = f"Removed alive/dead roles from {job.result} member(s)."
+
+
+def get_bulk_concurrency() -> int:
+    return int(config.get("bulk_action_concurrency", DEFAULT_BULK_CONCURRENCY))
+
+
+async def start_bulk_revive() -> BulkJob:
+    return bulk_jobs.start("revive_all", _revive_dead_users)
+
+
+async def start_role_cleanup() -> BulkJob:
+    return bulk_jobs.start("role_cleanup", _clear_alive_dead_roles)
+
+
+async def bulk_revive_dead_users() -> int:
+    if not config:
         return 0
+    job = await (await start_bulk_revive()).wait()
+    return job.result
+
 
-    alive_role = nextcord.utils.get(guild.roles, id=config["alive_role"])
-    dead_role = nextcord.utils.get(guild.roles, id=config["dead_role"])
-    if alive_role is None and dead_role is None:
+async def clear_alive_dead_roles() -> int:
+    if not config or client is None:
         return 0
+    job = await (await start_role_cleanup()).wait()
+    return job.result
 
-    updated = 0
-    for member in guild.members:
-        if member.bot:
-            continue
-        roles_to_remove = []
-        if alive_role and alive_role in member.roles:
-            roles_to_remove.append(alive_role)
-        if dead_role and dead_role in member.roles:
-            roles_to_remove.append(dead_role)
-        if not roles_to_remove:
-            continue
-        try:
-            await member.remove_roles(*roles_to_remove, reason="DeathWatcher wipe cleanup")
-            updated += 1
-        except Exception as exc:
-            print(f"[WipeRoles] Failed to update roles for {member.id}: {exc}")
 
-    return updated
+def report_failed_action(future: asyncio.Future, text: str) -> None:
+    """Done-callback for queued Discord actions that should surface failures."""
+    if future.cancelled() or future.result():
+        return
+    print(text)
+    client.loop.create_task(dump_error_discord(text, "Unexpected error"))
 
 
 async def dump_error_discord(error_message : str, prefix : str = "Error", force_mention_tag : str = ""):
@@ -1018,25 +1192,24 @@ async def dump_error_discord(error_message : str, prefix : str = "Error", force_
             if (mention != "" and mention != "everyone" and mention != "here"):
                 mention = await get_user_id_from_name(mention)
         mention = (f"@{mention} " if (mention == "everyone" or mention == "here") else f"<@{mention}> ") if (mention != "") else ""
-        await channel.send(f"{mention}**{prefix}**\n{error_message}")
+        await error_digest.report(channel, prefix, error_message, mention)
     
     
     
 async def get_user_id_from_name(username : str):
-    ID = ""
     try:
-        guild = client.get_guild(config["guild_id"])
-        if (guild != None):
-            mention_member = nextcord.utils.get(guild.members, name=username)
-            ID = str(mention_member.id) if (mention_member != None) else ""
-        else:
-            ID = ""
+        return member_index.lookup(client.get_guild(config["guild_id"]), username)
     except:
-        ID = ""
+        return ""
+
 
-    return ID
 
 
+async def close_client() -> None:
+    # the last debounced presence would otherwise be dropped with the window
+    if presence_debouncer is not None:
+        await presence_debouncer.flush()
+    await client.close()
 
 
 def stop_bot() -> None:
@@ -1046,7 +1219,7 @@ def stop_bot() -> None:
 
     loop = getattr(client, "loop", None)
     if loop and loop.is_running():
-        asyncio.run_coroutine_threadsafe(client.close(), loop)
+        asyncio.run_coroutine_threadsafe(close_client(), loop)
 
 
 def run_bot(*, interactive: bool = True, death_log_callback: Optional[Callable[[str], None]] = None) -> None:
@@ -1066,10 +1239,14 @@ def run_bot(*, interactive: bool = True, death_log_callback: Optional[Callable[[
             input("Press enter to close this window.")
         else:
             raise
+    finally:
+        flush_death_counter_state()
 
 
 def launch_gui() -> None:
-    from gui.app import GuiApplication
+    gui_timer = PhaseTimer("GUI")
+    with gui_timer.phase("import GUI"):
+        from gui.app import GuiApplication
 
     class GuiConsoleWriter:
         def __init__(self, emit: Callable[[str], None], fallback):
@@ -1116,7 +1293,7 @@ def launch_gui() -> None:
         if app.bot_thread and app.bot_thread.is_alive():
             app.bot_thread.join(timeout=5)
 
-    app = GuiApplication(on_close=shutdown)
+    app = GuiApplication(on_close=shutdown, startup_timer=gui_timer)
     register_death_counter_observer(app.handle_death_counter_update)
 
     original_stdout = sys.stdout
@@ -1,9 +1,10 @@
+import copy
 import json
 import os
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
-from services.file_utils import atomic_write_text
+from services.file_utils import atomic_write_text, file_lock
 
 
 DEFAULT_CACHE_CONTENT = {"prev_log_read": {"line": ""}, "log_label": ""}
@@ -96,23 +97,29 @@ class AliveTimeLogWatcher:
             )
 
         if not self.cache_path.exists():
-            atomic_write_text(self.cache_path, json.dumps(DEFAULT_CACHE_CONTENT))
+            atomic_write_text(
+                self.cache_path, json.dumps(DEFAULT_CACHE_CONTENT), file_class="cache"
+            )
         try:
             cache_data = json.loads(self.cache_path.read_text())
         except json.JSONDecodeError:
-            cache_data = dict(DEFAULT_CACHE_CONTENT)
+            cache_data = copy.deepcopy(DEFAULT_CACHE_CONTENT)
             self.current_cache = cache_data
             self._update_cache()
             return
 
         if self.server_id:
-            if "servers" not in cache_data:
+            migrated = "servers" not in cache_data
+            if migrated:
                 cache_data = {"servers": {self.server_id: cache_data}}
             self._cache_container = cache_data
             self.current_cache = cache_data.get("servers", {}).get(
-                self.server_id, dict(DEFAULT_CACHE_CONTENT)
+                self.server_id, copy.deepcopy(DEFAULT_CACHE_CONTENT)
             )
             self.current_cache.setdefault("prev_log_read", {}).setdefault("line", "")
+            if migrated:
+                # claim the old single-server cache before another watcher reads it
+                self._update_cache()
         else:
             self.current_cache = cache_data
             if "prev_log_read" not in self.current_cache:
@@ -121,15 +128,32 @@ class AliveTimeLogWatcher:
     def _update_cache(self) -> None:
         try:
             if self.server_id:
-                if "servers" not in self._cache_container:
-                    self._cache_container = {"servers": {}}
-                self._cache_container["servers"][self.server_id] = self.current_cache
-                atomic_write_text(self.cache_path, json.dumps(self._cache_container, indent=4))
+                # every server's watcher shares the cache file, so merge into
+                # what is on disk instead of writing back a stale copy
+                with file_lock(self.cache_path):
+                    self._cache_container = self._read_cache_container()
+                    self._cache_container["servers"][self.server_id] = self.current_cache
+                    atomic_write_text(
+                        self.cache_path,
+                        json.dumps(self._cache_container, indent=4),
+                        file_class="cache",
+                    )
             else:
-                atomic_write_text(self.cache_path, json.dumps(self.current_cache, indent=4))
+                atomic_write_text(
+                    self.cache_path, json.dumps(self.current_cache, indent=4), file_class="cache"
+                )
         except Exception:
             self._log(f"Failed to update alive time cache at {self.cache_path}")
 
+    def _read_cache_container(self) -> Dict:
+        try:
+            container = json.loads(self.cache_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            container = None
+        if not isinstance(container, dict) or not isinstance(container.get("servers"), dict):
+            container = {"servers": {}}
+        return container
+
     def _get_latest_file(self) -> Optional[Path]:
         if not self.logs_directory.exists():
             return None
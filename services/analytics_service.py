@@ -1,20 +1,15 @@
-import csv
-import io
-import json
 import time
+from collections import deque
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
-from services.file_utils import atomic_write_text
+from services.analytics_store import AnalyticsStore
+from services.death_classifier import DEFAULT_CAUSE_RULES, DeathClassifier
 
-CAUSE_PATTERNS: Dict[str, List[str]] = {
-    "Firearm": ["shot", "rifle", "gun", "m4"],
-    "Melee": ["knife", "sword", "axe", "melee"],
-    "Zombie": ["infected", "zombie"],
-    "Fall": ["fall", "fell"],
-    "Explosive": ["grenade", "explosion", "explosive"],
-}
+DEFAULT_ANALYTICS_DIRECTORY = "analytics"
+
+# kept for callers that read the default labels
+CAUSE_PATTERNS: Dict[str, List[str]] = DEFAULT_CAUSE_RULES
 
 
 @dataclass
@@ -25,56 +20,56 @@ class DeathEvent:
 
 
 class AnalyticsManager:
-    def __init__(self, max_events: int = 200) -> None:
+    """Detects death events in log lines and records them in an :class:`AnalyticsStore`.
+
+    The charts read the store's running counters; only the newest
+    ``max_events`` events are also kept in memory for :attr:`events`.
+    """
+
+    def __init__(
+        self,
+        store: Optional[AnalyticsStore] = None,
+        max_events: int = 200,
+        classifier: Optional[DeathClassifier] = None,
+    ) -> None:
+        self.store = store or AnalyticsStore(DEFAULT_ANALYTICS_DIRECTORY)
+        self.classifier = classifier or DeathClassifier()
         self.max_events = max_events
-        self._events: List[DeathEvent] = []
+        self._events: Deque[DeathEvent] = deque(maxlen=max_events)
 
-    def record_line(self, line: str) -> bool:
+    def record_line(self, line: str, server_id: Optional[str] = None) -> bool:
         """Attempt to extract a death event from the provided log line."""
         cause = self._detect_cause(line)
         if cause is None:
             return False
         event = DeathEvent(timestamp=time.time(), raw=line.strip(), cause=cause)
         self._events.append(event)
-        if len(self._events) > self.max_events:
-            self._events = self._events[-self.max_events :]
+        try:
+            self.store.append(event.timestamp, event.cause, event.raw, str(server_id or ""))
+        except OSError as exc:
+            print(f"[Analytics] Failed to store death event: {exc}")
         return True
 
     def _detect_cause(self, line: str) -> str | None:
-        lower = line.lower()
-        if "death" not in lower and "killed" not in lower:
-            return None
-        for label, keywords in CAUSE_PATTERNS.items():
-            if any(word in lower for word in keywords):
-                return label
-        return "Unknown"
+        return self.classifier.classify_line(line)
 
     @property
     def events(self) -> List[DeathEvent]:
         return list(self._events)
 
-    def export(self, path: str, fmt: str = "json") -> None:
-        path_obj = Path(path)
-        if fmt == "json":
-            payload = [event.__dict__ for event in self._events]
-            atomic_write_text(path_obj, json.dumps(payload, indent=2))
-        elif fmt == "csv":
-            buffer = io.StringIO()
-            writer = csv.writer(buffer)
-            writer.writerow(["timestamp", "cause", "raw"])
-            for event in self._events:
-                writer.writerow([event.timestamp, event.cause, event.raw])
-            atomic_write_text(path_obj, buffer.getvalue())
-        else:
-            raise ValueError(f"Unsupported format: {fmt}")
+    def export(self, path: str, fmt: str = "json") -> int:
+        return self.store.export(path, fmt=fmt)
 
     def timeline(self) -> Tuple[List[float], List[int]]:
-        times = [event.timestamp for event in self._events]
-        counts = list(range(1, len(times) + 1))
-        return times, counts
+        return self.store.hourly_timeline()
 
     def cause_breakdown(self) -> Dict[str, int]:
-        breakdown: Dict[str, int] = {label: 0 for label in list(CAUSE_PATTERNS) + ["Unknown"]}
-        for event in self._events:
-            breakdown[event.cause] = breakdown.get(event.cause, 0) + 1
+        breakdown: Dict[str, int] = {label: 0 for label in self.classifier.labels}
+        breakdown.update(self.store.cause_breakdown())
         return breakdown
+
+    def server_breakdown(self) -> Dict[str, int]:
+        return self.store.server_breakdown()
+
+    def close(self) -> None:
+        self.store.close()
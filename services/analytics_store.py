@@ -0,0 +1,241 @@
+"""Append-only, day-rolled storage for death analytics events.
+
+Events go to ``deaths-YYYY-MM-DD.jsonl`` (one compact JSON object per line) in
+the store directory. Per-cause, per-server and per-hour counters are kept in
+memory and are what the charts read, so a season of data never has to be
+re-scanned to draw them. Each finished day gets a small ``.summary.json``
+with its counters, so start-up only re-reads the current day's file.
+Exports stream the day files instead of loading them.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from services.file_utils import atomic_write_text
+
+HOUR = 3600
+_DAY_PREFIX = "deaths-"
+
+
+@dataclass
+class AnalyticsTotals:
+    by_cause: Counter
+    by_server: Counter
+    by_hour: Counter
+
+    @classmethod
+    def empty(cls) -> "AnalyticsTotals":
+        return cls(Counter(), Counter(), Counter())
+
+    def add(self, timestamp: float, cause: str, server_id: str, count: int = 1) -> None:
+        self.by_cause[cause] += count
+        self.by_server[server_id] += count
+        self.by_hour[int(timestamp) // HOUR * HOUR] += count
+
+    def merge(self, other: "AnalyticsTotals") -> None:
+        self.by_cause.update(other.by_cause)
+        self.by_server.update(other.by_server)
+        self.by_hour.update(other.by_hour)
+
+    def to_json(self) -> Dict:
+        return {
+            "by_cause": dict(self.by_cause),
+            "by_server": dict(self.by_server),
+            "by_hour": {str(hour): count for hour, count in self.by_hour.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "AnalyticsTotals":
+        return cls(
+            Counter(data.get("by_cause", {})),
+            Counter(data.get("by_server", {})),
+            Counter({int(hour): count for hour, count in data.get("by_hour", {}).items()}),
+        )
+
+
+def _day_key(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """True for an empty file or one whose last byte is a newline."""
+    with open(path, "rb") as day_file:
+        day_file.seek(0, 2)
+        if day_file.tell() == 0:
+            return True
+        day_file.seek(-1, 2)
+        return day_file.read(1) == b"\n"
+
+
+class AnalyticsStore:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.totals = AnalyticsTotals.empty()
+        self._day: Optional[str] = None
+        self._handle: Optional[TextIO] = None
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # files
+    # ------------------------------------------------------------------
+    def _day_path(self, day: str) -> Path:
+        return self.directory / f"{_DAY_PREFIX}{day}.jsonl"
+
+    def _summary_path(self, day: str) -> Path:
+        return self.directory / f"{_DAY_PREFIX}{day}.summary.json"
+
+    def days(self) -> List[str]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            path.name[len(_DAY_PREFIX) : -len(".jsonl")]
+            for path in self.directory.glob(f"{_DAY_PREFIX}*.jsonl")
+        )
+
+    def load(self) -> None:
+        """Rebuild the in-memory counters from summaries (finished days) and the day files."""
+        totals = AnalyticsTotals.empty()
+        today = _day_key(time.time())
+        for day in self.days():
+            totals.merge(self._day_totals(day, write_summary=day != today))
+        self.totals = totals
+        self._loaded = True
+
+    def _day_totals(self, day: str, *, write_summary: bool) -> AnalyticsTotals:
+        day_path = self._day_path(day)
+        size = day_path.stat().st_size
+        summary_path = self._summary_path(day)
+        if summary_path.exists():
+            try:
+                summary = json.loads(summary_path.read_text())
+                if summary.get("size") == size:
+                    return AnalyticsTotals.from_json(summary)
+            except (OSError, ValueError):
+                pass
+        totals = AnalyticsTotals.empty()
+        for event in self._read_day(day):
+            totals.add(event["t"], event["c"], event.get("s", ""))
+        if write_summary:
+            atomic_write_text(summary_path, json.dumps({"size": size, **totals.to_json()}), file_class="analytics")
+        return totals
+
+    def _read_day(self, day: str) -> Iterator[Dict]:
+        try:
+            with open(self._day_path(day), "r", encoding="utf-8") as day_file:
+                for line in day_file:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # a line cut short by a crash; the rest of the file is fine
+                        continue
+        except FileNotFoundError:
+            return
+
+    # ------------------------------------------------------------------
+    # writes
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def append(self, timestamp: float, cause: str, raw: str, server_id: str = "") -> None:
+        self._ensure_loaded()
+        day = _day_key(timestamp)
+        if day != self._day:
+            self._roll(day)
+        record = {"t": round(timestamp, 3), "c": cause, "s": server_id, "r": raw}
+        self._handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        self.totals.add(timestamp, cause, server_id)
+
+    def _roll(self, day: str) -> None:
+        previous = self._day
+        self.close()
+        if previous is not None and self._day_path(previous).exists():
+            self._day_totals(previous, write_summary=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._day_path(day)
+        self._handle = open(path, "a", encoding="utf-8")
+        if not _ends_with_newline(path):
+            # terminate a line cut short by a crash, or the next event is
+            # appended onto it and dropped with it on the next read
+            self._handle.write("\n")
+            self._handle.flush()
+        self._day = day
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def cause_breakdown(self) -> Dict[str, int]:
+        self._ensure_loaded()
+        return dict(self.totals.by_cause)
+
+    def server_breakdown(self) -> Dict[str, int]:
+        self._ensure_loaded()
+        return dict(self.totals.by_server)
+
+    def hourly_timeline(self, since: Optional[float] = None) -> Tuple[List[float], List[int]]:
+        """Cumulative deaths at the start of every hour that had any."""
+        self._ensure_loaded()
+        hours = sorted(hour for hour in self.totals.by_hour if since is None or hour >= since)
+        times: List[float] = []
+        counts: List[int] = []
+        running = 0
+        for hour in hours:
+            running += self.totals.by_hour[hour]
+            times.append(float(hour))
+            counts.append(running)
+        return times, counts
+
+    def iter_events(self, start: Optional[float] = None, end: Optional[float] = None) -> Iterator[Dict]:
+        """Stream stored events in time order, optionally limited to ``[start, end)``."""
+        first_day = _day_key(start) if start is not None else None
+        last_day = _day_key(end) if end is not None else None
+        for day in self.days():
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            for event in self._read_day(day):
+                if start is not None and event["t"] < start:
+                    continue
+                if end is not None and event["t"] >= end:
+                    continue
+                yield event
+
+    def export(self, path: str | Path, fmt: str = "json") -> int:
+        """Stream every stored event to ``path``; returns the number of events written."""
+        if fmt not in ("json", "csv"):
+            raise ValueError(f"Unsupported format: {fmt}")
+        if self._handle is not None:
+            self._handle.flush()
+        written = 0
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            if fmt == "csv":
+                writer = csv.writer(out)
+                writer.writerow(["timestamp", "cause", "server_id", "raw"])
+                for event in self.iter_events():
+                    writer.writerow([event["t"], event["c"], event.get("s", ""), event.get("r", "")])
+                    written += 1
+            else:
+                out.write("[")
+                for event in self.iter_events():
+                    payload = {
+                        "timestamp": event["t"],
+                        "cause": event["c"],
+                        "server_id": event.get("s", ""),
+                        "raw": event.get("r", ""),
+                    }
+                    out.write(("," if written else "") + "\n  " + json.dumps(payload))
+                    written += 1
+                out.write("\n]\n")
+        return written
@@ -1,13 +1,25 @@
-"""Bridge helpers that let the GUI control the running Discord bot."""
+"""Bridge helpers that let the GUI control the running Discord bot.
+
+Every action returns a :class:`concurrent.futures.Future` straight away: bot
+coroutines are scheduled on the bot loop and file work runs on a small worker
+pool, so nothing here blocks the caller. The GUI hands these futures to
+``gui.operations.OperationTracker`` to get results back on the Tk thread.
+"""
 from __future__ import annotations
 
 import asyncio
 import sys
-from typing import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
 from services import death_counter_service, userdata_service
+from services.bulk_jobs import bulk_jobs
+
+T = TypeVar("T")
 
-_DEFAULT_TIMEOUT = 10.0
+# file reads/writes that belong to a GUI request run here, never on the
+# bot loop or the Tk thread
+_worker = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot-control")
 
 
 def _get_main_module():
@@ -26,118 +38,172 @@ def _get_bot_loop():
     return None
 
 
-def _run_in_loop(factory: Callable[[], "asyncio.Future"], timeout: float = _DEFAULT_TIMEOUT):
+def _schedule(name: str, *args) -> Optional[Future]:
+    """Start ``main.<name>(*args)`` on the bot loop and return its future without
+    waiting, or ``None`` when the bot (or that coroutine) is not available."""
+    coro = getattr(_get_main_module(), name, None)
     loop = _get_bot_loop()
-    if loop is None:
-        raise RuntimeError("The Discord bot is not running.")
-    future = asyncio.run_coroutine_threadsafe(factory(), loop)
-    return future.result(timeout=timeout)
+    if coro is None or loop is None:
+        return None
+    return asyncio.run_coroutine_threadsafe(coro(*args), loop)
+
+
+def _offline(fn: Callable[..., T], *args) -> "Future[T]":
+    return _worker.submit(fn, *args)
+
+
+def _then(source: Future, fn: Callable[[Any], T]) -> "Future[T]":
+    """Future for ``fn(source.result())``. ``fn`` runs on the worker pool, and
+    cancelling the returned future cancels ``source`` (and its bot task)."""
+    chained: Future = Future()
+
+    def resolve(done: Future) -> None:
+        if chained.done():
+            return
+        try:
+            if done.cancelled():
+                chained.cancel()
+                return
+            error = done.exception()
+            if error is not None:
+                chained.set_exception(error)
+                return
+            chained.set_result(fn(done.result()))
+        except InvalidStateError:
+            # cancelled by the caller while fn was running
+            pass
+        except Exception as exc:
+            if not chained.done():
+                chained.set_exception(exc)
+
+    source.add_done_callback(lambda done: _worker.submit(resolve, done))
+    chained.add_done_callback(lambda done: done.cancelled() and source.cancel())
+    return chained
+
+
+def _failed(message: str) -> Future:
+    future: Future = Future()
+    future.set_exception(RuntimeError(message))
+    return future
 
 
 def is_bot_running() -> bool:
     return _get_bot_loop() is not None
 
 
-def get_death_counter_summary(path: str) -> dict:
-    module = _get_main_module()
-    coro = getattr(module, "get_death_counter_summary", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        summary = _run_in_loop(coro)
-        summary["synced"] = True
-        return summary
+def _synced_summary(path: str, count: int, last_reset: int) -> dict:
     summary = death_counter_service.get_counter_summary(path)
-    summary["synced"] = False
+    summary.update({"count": count, "last_reset": last_reset, "synced": True})
     return summary
 
 
-def set_death_counter(path: str, count: int) -> dict:
-    module = _get_main_module()
-    coro = getattr(module, "set_death_counter_value", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        new_count, last_reset = _run_in_loop(lambda: coro(count))
-        summary = death_counter_service.get_counter_summary(path)
-        summary.update({"count": new_count, "last_reset": last_reset, "synced": True})
-        return summary
-    summary = death_counter_service.set_counter(path, count)
+def _offline_summary(fn: Callable[..., dict], *args) -> dict:
+    summary = fn(*args)
     summary["synced"] = False
     return summary
 
 
-def adjust_death_counter(path: str, delta: int) -> dict:
-    module = _get_main_module()
-    coro = getattr(module, "adjust_death_counter", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        count, last_reset = _run_in_loop(lambda: coro(delta))
-        summary = death_counter_service.get_counter_summary(path)
-        summary.update({"count": count, "last_reset": last_reset, "synced": True})
-        return summary
-    summary = death_counter_service.adjust_counter(path, delta)
-    summary["synced"] = False
-    return summary
+def get_death_counter_summary(path: str) -> "Future[dict]":
+    future = _schedule("get_death_counter_summary")
+    if future is None:
+        return _offline(_offline_summary, death_counter_service.get_counter_summary, path)
+    return _then(future, lambda summary: {**summary, "synced": True})
 
 
-def wipe_death_counter(path: str) -> dict:
-    module = _get_main_module()
-    coro = getattr(module, "reset_death_counter", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        count, last_reset = _run_in_loop(coro)
-        summary = death_counter_service.get_counter_summary(path)
-        summary.update({"count": count, "last_reset": last_reset, "synced": True})
-        return summary
-    summary = death_counter_service.wipe_counter(path)
-    summary["synced"] = False
-    return summary
+def set_death_counter(path: str, count: int) -> "Future[dict]":
+    future = _schedule("set_death_counter_value", count)
+    if future is None:
+        return _offline(_offline_summary, death_counter_service.set_counter, path, count)
+    return _then(future, lambda result: _synced_summary(path, *result))
 
 
-def refresh_activity() -> None:
-    module = _get_main_module()
-    coro = getattr(module, "update_bot_activity", None)
-    if coro is None:
-        raise RuntimeError("Unable to find the activity updater.")
-    _run_in_loop(coro)
+def adjust_death_counter(path: str, delta: int) -> "Future[dict]":
+    future = _schedule("adjust_death_counter", delta)
+    if future is None:
+        return _offline(_offline_summary, death_counter_service.adjust_counter, path, delta)
+    return _then(future, lambda result: _synced_summary(path, *result))
 
 
-def force_revive_user(path: str, discord_id: str) -> bool:
-    module = _get_main_module()
-    coro = getattr(module, "unban_user", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        _run_in_loop(lambda: coro(discord_id))
-        return True
-    return userdata_service.force_revive(path, discord_id)
+def wipe_death_counter(path: str) -> "Future[dict]":
+    future = _schedule("reset_death_counter")
+    if future is None:
+        return _offline(_offline_summary, death_counter_service.wipe_counter, path)
+    return _then(future, lambda result: _synced_summary(path, *result))
 
 
-def force_revive_all_users(path: str) -> int:
-    module = _get_main_module()
-    coro = getattr(module, "bulk_revive_dead_users", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        return _run_in_loop(coro)
-    return userdata_service.force_revive_all(path)
+def refresh_activity() -> "Future[None]":
+    future = _schedule("update_bot_activity")
+    if future is None:
+        return _failed("The Discord bot is not running.")
+    return future
 
 
-def clear_alive_dead_roles() -> int:
-    module = _get_main_module()
-    coro = getattr(module, "clear_alive_dead_roles", None)
-    loop = _get_bot_loop()
-    if coro and loop:
-        return _run_in_loop(coro)
-    raise RuntimeError("The Discord bot is not running.")
+def force_revive_user(path: str, discord_id: str) -> "Future[bool]":
+    future = _schedule("unban_user", discord_id)
+    if future is None:
+        return _offline(userdata_service.force_revive, path, discord_id)
+    return _then(future, lambda _result: True)
 
 
-def force_mark_dead(path: str, discord_id: str) -> bool:
-    module = _get_main_module()
-    coro = getattr(module, "set_user_as_dead", None)
+def force_revive_all_users(path: str) -> "Future[int]":
+    future = _schedule("bulk_revive_dead_users")
+    if future is None:
+        return _offline(userdata_service.force_revive_all, path)
+    return future
+
+
+def clear_alive_dead_roles() -> "Future[int]":
+    return _schedule("clear_alive_dead_roles") or _failed("The Discord bot is not running.")
+
+
+def start_revive_all_job() -> "Future[Optional[dict]]":
+    """Start a background revive of every dead player. Resolves to ``None`` when the
+    bot is not running, in which case the caller should fall back to the offline path."""
+    future = _schedule("start_bulk_revive")
+    if future is None:
+        future = Future()
+        future.set_result(None)
+        return future
+    return _then(future, lambda job: job.snapshot())
+
+
+def start_role_cleanup_job() -> "Future[dict]":
+    future = _schedule("start_role_cleanup")
+    if future is None:
+        return _failed("The Discord bot is not running.")
+    return _then(future, lambda job: job.snapshot())
+
+
+def get_job_status(job_id: str) -> Optional[dict]:
+    job = bulk_jobs.get(job_id)
+    return job.snapshot() if job else None
+
+
+def cancel_job(job_id: str) -> bool:
+    job = bulk_jobs.get(job_id)
+    return job.cancel() if job else False
+
+
+def wait_for_job(job_id: str) -> "Future[dict]":
+    """Future resolving to the job's final snapshot once it finishes."""
+    job = bulk_jobs.get(job_id)
+    if job is None:
+        return _failed(f"Unknown job: {job_id}")
     loop = _get_bot_loop()
-    if coro and loop:
-        _run_in_loop(lambda: coro(discord_id))
-        return True
-    return userdata_service.force_mark_dead(path, discord_id)
+    if job.finished or loop is None:
+        future: Future = Future()
+        future.set_result(job.snapshot())
+        return future
+    return _then(asyncio.run_coroutine_threadsafe(job.wait(), loop), lambda finished: finished.snapshot())
+
+
+def force_mark_dead(path: str, discord_id: str) -> "Future[bool]":
+    future = _schedule("set_user_as_dead", discord_id)
+    if future is None:
+        return _offline(userdata_service.force_mark_dead, path, discord_id)
+    return _then(future, lambda _result: True)
+
 
+def remove_user_from_database(path: str, discord_id: str) -> "Future[bool]":
+    return _offline(userdata_service.remove_user, path, discord_id)
 
-def remove_user_from_database(path: str, discord_id: str) -> bool:
-    return userdata_service.remove_user(path, discord_id)
@@ -0,0 +1,156 @@
+"""Long-running bulk operations (mass revive, role cleanup) run as pollable jobs.
+
+``start`` schedules the runner as a task on the bot loop and hands back a
+:class:`BulkJob` straight away, so callers on other threads (the GUI) or with
+a short response window (slash commands) can poll ``snapshot()`` and request
+cancellation instead of blocking until every Discord action has finished.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+
+DEFAULT_BULK_CONCURRENCY = 8
+_HISTORY_SIZE = 20
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkJob:
+    job_id: str
+    kind: str
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    result: int = 0
+    status: str = JOB_PENDING
+    message: str = ""
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    cancel_requested: bool = False
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_CANCELLED, JOB_FAILED)
+
+    def cancel(self) -> bool:
+        """Ask the job to stop before its next item. Safe to call from any thread."""
+        if self.finished:
+            return False
+        self.cancel_requested = True
+        return True
+
+    def snapshot(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "result": self.result,
+            "message": self.message,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    async def wait(self) -> "BulkJob":
+        if self._task is not None:
+            await asyncio.shield(self._task)
+        return self
+
+
+class BulkJobManager:
+    def __init__(self, history: int = _HISTORY_SIZE) -> None:
+        self.history = history
+        self._jobs: Dict[str, BulkJob] = {}
+        self._ids = itertools.count(1)
+
+    def start(self, kind: str, runner: Callable[[BulkJob], Awaitable[None]]) -> BulkJob:
+        """Run ``runner(job)`` in the background. Only one job per kind runs at a time;
+        starting another while one is active returns the active job."""
+        active = self.active(kind)
+        if active is not None:
+            return active
+        job = BulkJob(job_id=f"{kind}-{next(self._ids)}", kind=kind)
+        self._jobs[job.job_id] = job
+        self._trim()
+        job._task = asyncio.get_running_loop().create_task(self._run(job, runner))
+        return job
+
+    async def _run(self, job: BulkJob, runner: Callable[[BulkJob], Awaitable[None]]) -> None:
+        job.status = JOB_RUNNING
+        try:
+            await runner(job)
+            job.status = JOB_CANCELLED if job.cancel_requested else JOB_COMPLETED
+        except Exception as exc:
+            job.status = JOB_FAILED
+            job.message = str(exc)
+            print(f"[BulkJobs] Job {job.job_id} failed: {exc}")
+        finally:
+            job.finished_at = time.time()
+
+    def _trim(self) -> None:
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in finished[: max(0, len(self._jobs) - self.history)]:
+            self._jobs.pop(job.job_id, None)
+
+    def get(self, job_id: str) -> Optional[BulkJob]:
+        return self._jobs.get(job_id)
+
+    def active(self, kind: Optional[str] = None) -> Optional[BulkJob]:
+        for job in self._jobs.values():
+            if not job.finished and (kind is None or job.kind == kind):
+                return job
+        return None
+
+    def latest(self, kind: Optional[str] = None) -> Optional[BulkJob]:
+        for job in reversed(list(self._jobs.values())):
+            if kind is None or job.kind == kind:
+                return job
+        return None
+
+    def jobs(self) -> List[BulkJob]:
+        return list(self._jobs.values())
+
+
+async def run_concurrently(
+    job: BulkJob,
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[bool]],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> None:
+    """Feed ``items`` to ``worker`` with at most ``concurrency`` in flight,
+    counting successes/failures on ``job`` and stopping once it is cancelled."""
+    items = list(items)
+    job.total = len(items)
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def run_one(item: T) -> None:
+        async with semaphore:
+            if job.cancel_requested:
+                return
+            try:
+                ok = await worker(item)
+            except Exception as exc:
+                print(f"[BulkJobs] {job.job_id}: {exc}")
+                ok = False
+            job.done += 1
+            if not ok:
+                job.failed += 1
+
+    await asyncio.gather(*(run_one(item) for item in items))
+
+
+bulk_jobs = BulkJobManager()
@@ -0,0 +1,123 @@
+"""Cause-of-death classification for analytics.
+
+Death events from the ``.ljson`` detailed logs carry structured fields
+(``killer``, ``weapon``, ``ammo``, ``hitZone``); when a line contains such an
+event those fields are classified instead of the display text, so a player
+named "Zombie" or a chat line mentioning a knife no longer skews the chart.
+Only events whose ``event`` type is a death are classified; other quoted
+events (hits, damage) fall back to the free-text check, so they do not count
+as deaths. Everything else falls back to free text. Keywords are checked with
+plain substring tests in rule order, which for rule sets of this size beats a
+compiled regex alternation, and an event line is only parsed when one of the
+keywords occurs somewhere in it.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+UNKNOWN_CAUSE = "Unknown"
+
+DEFAULT_CAUSE_RULES: Dict[str, List[str]] = {
+    "Firearm": ["shot", "rifle", "gun", "m4"],
+    "Melee": ["knife", "sword", "axe", "melee"],
+    "Zombie": ["infected", "zombie"],
+    "Fall": ["fall", "fell"],
+    "Explosive": ["grenade", "explosion", "explosive"],
+}
+
+# ljson fields the rules are matched against; the player's own name is not one of them
+_STRUCTURED_FIELDS = ("weapon", "ammo", "killer", "cause", "sub_event", "hitZone", "hit_zone")
+
+# finds the event type without parsing the whole object
+_EVENT_TYPE = re.compile(r'"event"\s*:\s*"([^"]*)"')
+
+
+def _field_text(value) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        # a nested killer object also carries the killer's player name, which
+        # is display text like any other name and must not pick the label
+        return " ".join(str(value[key]) for key in ("type", "weapon") if value.get(key))
+    return "" if value is None else str(value)
+
+
+def _embedded_event(line: str) -> Optional[Dict]:
+    """Return the ljson object quoted in a watcher log line, if there is one."""
+    start = line.find("{")
+    if start < 0:
+        return None
+    end = line.rfind("}")
+    if end <= start:
+        return None
+    try:
+        event = json.loads(line[start : end + 1])
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+class DeathClassifier:
+    """Maps death events to one of the configured cause labels.
+
+    ``rules`` is an ordered ``label -> keywords`` mapping; when keywords from
+    several labels occur, the label listed first wins, as it always has.
+    """
+
+    def __init__(self, rules: Optional[Mapping[str, Iterable[str]]] = None) -> None:
+        self.rules: Dict[str, List[str]] = {
+            str(label): [str(word) for word in words if str(word).strip()]
+            for label, words in (rules or DEFAULT_CAUSE_RULES).items()
+        }
+        self.labels = list(self.rules) + ([] if UNKNOWN_CAUSE in self.rules else [UNKNOWN_CAUSE])
+        # (keyword, label) in rule order, so the first hit belongs to the first matching label
+        seen = set()
+        keywords: List[Tuple[str, str]] = []
+        for label, words in self.rules.items():
+            for word in words:
+                word = word.lower()
+                if word not in seen:
+                    seen.add(word)
+                    keywords.append((word, label))
+        self._keywords = tuple(keywords)
+
+    @classmethod
+    def from_config(cls, config: Mapping) -> "DeathClassifier":
+        rules = config.get("death_cause_rules")
+        if not isinstance(rules, Mapping) or not rules:
+            return cls()
+        return cls(rules)
+
+    def match(self, text: str) -> str:
+        """Best label for ``text``, or :data:`UNKNOWN_CAUSE`."""
+        return self._match_lower(text.lower())
+
+    def _match_lower(self, lower: str) -> str:
+        for word, label in self._keywords:
+            if word in lower:
+                return label
+        return UNKNOWN_CAUSE
+
+    def classify_event(self, event: Mapping) -> str:
+        """Classify a parsed ljson death event by its structured fields."""
+        parts = [_field_text(event[key]) for key in _STRUCTURED_FIELDS if key in event]
+        return self._match_lower(" ".join(parts).lower())
+
+    def classify_line(self, line: str) -> Optional[str]:
+        """Classify a log line; ``None`` when it does not describe a death."""
+        lower = line.lower()
+        if '"event"' in line:
+            event_type = _EVENT_TYPE.search(line)
+            if event_type is not None and "DEATH" in event_type.group(1).upper():
+                # no keyword anywhere in the line means none in its fields either
+                if self._match_lower(lower) == UNKNOWN_CAUSE:
+                    return UNKNOWN_CAUSE
+                event = _embedded_event(line)
+                if event is not None:
+                    # never fall back to the display text (player names) for a real event
+                    return self.classify_event(event)
+        if "death" not in lower and "killed" not in lower:
+            return None
+        return self._match_lower(lower)
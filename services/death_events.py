@@ -0,0 +1,48 @@
+"""In-process handoff of death events from watcher threads to the bot loop."""
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, Tuple
+
+DeathNotice = Tuple[str, str]
+
+
+class DeathEventQueue:
+    """Asyncio queue that watcher threads can publish GUIDs into safely.
+
+    The embedded death watcher runs on plain threads while the death handler
+    lives on the Discord client's event loop, so producers go through
+    ``loop.call_soon_threadsafe`` and consumers simply ``await get()``.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[DeathNotice]] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._queue = asyncio.Queue()
+
+    @property
+    def is_bound(self) -> bool:
+        return self._loop is not None and self._queue is not None
+
+    def put_threadsafe(self, server_id: str, guid: str) -> bool:
+        """Publish a death from any thread. Returns False if it could not be queued."""
+        if not self.is_bound or not guid:
+            return False
+        notice = (str(server_id), str(guid))
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, notice)
+        except RuntimeError:
+            # loop already closed (bot shutting down)
+            return False
+        return True
+
+    async def get(self) -> DeathNotice:
+        if self._queue is None:
+            raise RuntimeError("Death event queue is not bound to an event loop.")
+        return await self._queue.get()
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
@@ -0,0 +1,145 @@
+"""Offset-based consumer for the append-only deaths_<server>.txt logs.
+
+The death watcher only ever appends ``<guid>\\n`` lines to its deaths file. The
+bot remembers how many bytes of each file it has consumed in a small offsets
+file, so it never has to rewrite the log while the watcher is writing to it.
+
+Compaction uses rotate-and-drain: once the consumed prefix grows past a
+threshold the log is renamed aside, the watcher's next append recreates the
+original path, and the next read drains whatever landed in the rotated file
+before deleting it. Every step is safe to repeat after a crash; at worst a
+GUID is delivered twice, and the death handler ignores players already dead.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services.file_utils import FileLockTimeout, atomic_write_text, file_lock
+
+DEFAULT_COMPACT_BYTES = 64 * 1024
+
+
+def _load_offsets(path: Path) -> Dict[str, Dict]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _decode_lines(data: bytes) -> List[str]:
+    text = data.decode("utf-8", errors="ignore")
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+class DeathLogConsumer:
+    """Reads new GUIDs from one deaths log and tracks the consumed offset."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        offsets_path: str | Path,
+        *,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.offsets_path = Path(offsets_path)
+        self.compact_bytes = max(0, int(compact_bytes))
+        self._key = str(self.path.resolve())
+        self._rotated_path = self.path.with_name(f".{self.path.name}.consumed")
+
+        state = _load_offsets(self.offsets_path).get(self._key, {})
+        self._offset = int(state.get("offset", 0) or 0)
+        rotated_offset = state.get("rotated_offset")
+        self._rotated_offset: Optional[int] = (
+            int(rotated_offset) if rotated_offset is not None else None
+        )
+        self._pending_offset = self._offset
+        self._drained_rotated = False
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def read_new(self) -> List[str]:
+        """Return GUIDs appended since the last commit without advancing the offset."""
+        lines: List[str] = []
+        offset = self._offset
+
+        if self._rotated_path.exists():
+            if self._rotated_offset is None:
+                # rotated before the offsets file was updated: the stored
+                # offset still describes the rotated file
+                start, offset = offset, 0
+            else:
+                start = self._rotated_offset
+            with self._rotated_path.open("rb") as file:
+                file.seek(start)
+                lines.extend(_decode_lines(file.read()))
+            self._drained_rotated = True
+
+        self._pending_offset = offset
+        if not self.path.exists():
+            return lines
+
+        if self.path.stat().st_size < offset:
+            # the log was truncated or replaced behind our back
+            offset = 0
+        with self.path.open("rb") as file:
+            file.seek(offset)
+            data = file.read()
+        end = data.rfind(b"\n")
+        if end >= 0:
+            # only consume complete lines; a partial append is picked up next time
+            lines.extend(_decode_lines(data[: end + 1]))
+            self._pending_offset = offset + end + 1
+        else:
+            self._pending_offset = offset
+        return lines
+
+    def commit(self) -> None:
+        """Mark everything returned by the last ``read_new`` as consumed."""
+        changed = self._drained_rotated or self._pending_offset != self._offset
+        if self._drained_rotated:
+            try:
+                self._rotated_path.unlink()
+            except FileNotFoundError:
+                pass
+            self._rotated_offset = None
+            self._drained_rotated = False
+        self._offset = self._pending_offset
+        if changed:
+            self._save()
+
+    def compact(self) -> bool:
+        """Rotate the log aside once the consumed prefix exceeds the threshold."""
+        if self._rotated_path.exists() or not self.path.exists():
+            return False
+        if self._offset < max(1, self.compact_bytes):
+            return False
+        try:
+            # the watcher appends under the same lock, so no write is in flight
+            with file_lock(self.path):
+                os.replace(self.path, self._rotated_path)
+        except (OSError, FileLockTimeout):
+            # the watcher may hold the file open (Windows); try again next tick
+            return False
+        self._rotated_offset = self._offset
+        self._offset = 0
+        self._pending_offset = 0
+        self._save()
+        return True
+
+    def _save(self) -> None:
+        offsets = _load_offsets(self.offsets_path)
+        offsets[self._key] = {
+            "offset": self._offset,
+            "rotated_offset": self._rotated_offset,
+        }
+        # losing an update only means a GUID is delivered twice
+        atomic_write_text(self.offsets_path, json.dumps(offsets, indent=4), file_class="cache")
@@ -0,0 +1,57 @@
+"""Coalesce bursts of calls to a rate-limited async operation."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+
+class LatestValueDebouncer:
+    """Run ``callback`` at most once per ``window`` seconds with the newest arguments.
+
+    A call after a quiet period runs straight away; calls arriving inside the
+    window replace each other, and only the last one is delivered when the
+    window closes.
+    """
+
+    def __init__(self, callback: Callable[..., Awaitable[Any]], window: float) -> None:
+        self.callback = callback
+        self.window = max(0.0, float(window))
+        self.submitted = 0
+        self.delivered = 0
+        self._pending: Optional[Tuple[tuple, dict]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_run = 0.0
+
+    def submit(self, *args, **kwargs) -> None:
+        self.submitted += 1
+        self._pending = (args, kwargs)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            delay = self._last_run + self.window - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._deliver()
+
+    async def _deliver(self) -> None:
+        if self._pending is None:
+            return
+        args, kwargs = self._pending
+        self._pending = None
+        self._last_run = time.monotonic()
+        self.delivered += 1
+        try:
+            await self.callback(*args, **kwargs)
+        except Exception as exc:
+            print(f"[Debounce] {getattr(self.callback, '__name__', 'callback')} failed: {exc}")
+
+    async def flush(self) -> None:
+        """Deliver a pending value now instead of waiting out the window."""
+        if self._pending is None:
+            return
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        await self._deliver()
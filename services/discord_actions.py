@@ -0,0 +1,289 @@
+"""Prioritized queue for Discord member actions: voice moves, role changes and DMs.
+
+Role changes and voice moves for the same member are merged while they wait,
+so a death that removes the alive role, adds the dead role and kicks the
+player from voice costs a single ``member.edit`` call. Member edits and DMs
+hit different Discord rate-limit buckets and get their own worker pools, so a
+burst of DMs never delays a voice kick.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+MEMBER_BUCKET = "member"
+DM_BUCKET = "dm"
+DEFAULT_CONCURRENCY = {MEMBER_BUCKET: 4, DM_BUCKET: 2}
+_LATENCY_SAMPLES = 500
+_UNSET = object()
+
+
+class ActionPriority(IntEnum):
+    VOICE = 0
+    ROLES = 1
+    DM = 2
+
+
+@dataclass
+class _Action:
+    bucket: str
+    key: Tuple
+    priority: int
+    guild: Any
+    member_id: int
+    target: Any = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    add_roles: Set[int] = field(default_factory=set)
+    remove_roles: Set[int] = field(default_factory=set)
+    voice_channel: Any = _UNSET
+    content: Optional[str] = None
+    reason: Optional[str] = None
+    futures: List[asyncio.Future] = field(default_factory=list)
+    started: bool = False
+
+
+@dataclass
+class _BucketStats:
+    submitted: int = 0
+    coalesced: int = 0
+    executed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+    runs: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+
+
+def _summarize(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    return {
+        "mean_ms": sum(ordered) / len(ordered) * 1000.0,
+        "p95_ms": ordered[int(0.95 * (len(ordered) - 1))] * 1000.0,
+        "max_ms": ordered[-1] * 1000.0,
+    }
+
+
+class DiscordActionQueue:
+    """Runs Discord member actions in priority order with bounded concurrency.
+
+    Every submit returns a future that resolves to ``True`` when the action
+    was applied (or was already in effect) and ``False`` when it failed, so
+    callers may await it or fire and forget. Must be used from the bot loop.
+    """
+
+    def __init__(self, concurrency: Optional[Dict[str, int]] = None) -> None:
+        self._concurrency = dict(DEFAULT_CONCURRENCY)
+        self.configure(concurrency)
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._pending: Dict[Tuple, _Action] = {}
+        self._stats = {bucket: _BucketStats() for bucket in self._concurrency}
+        self._sequence = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def configure(self, concurrency: Optional[Dict[str, int]]) -> None:
+        for bucket, value in (concurrency or {}).items():
+            if bucket in self._concurrency:
+                self._concurrency[bucket] = max(1, int(value))
+
+    # ------------------------------------------------------------------
+    # submitting
+    # ------------------------------------------------------------------
+    def update_roles(
+        self,
+        member,
+        *,
+        add: Tuple = (),
+        remove: Tuple = (),
+        reason: Optional[str] = None,
+    ) -> asyncio.Future:
+        add_ids = {role.id for role in add if role is not None}
+        remove_ids = {role.id for role in remove if role is not None}
+
+        def merge(action: _Action) -> None:
+            # the most recent request for a role wins
+            action.add_roles = (action.add_roles - remove_ids) | add_ids
+            action.remove_roles = (action.remove_roles - add_ids) | remove_ids
+
+        return self._submit_member_edit(member, ActionPriority.ROLES, merge, reason)
+
+    def disconnect_voice(self, member, *, reason: Optional[str] = None) -> asyncio.Future:
+        def merge(action: _Action) -> None:
+            action.voice_channel = None
+
+        return self._submit_member_edit(member, ActionPriority.VOICE, merge, reason)
+
+    def move_to(self, member, channel, *, reason: Optional[str] = None) -> asyncio.Future:
+        def merge(action: _Action) -> None:
+            action.voice_channel = channel
+
+        return self._submit_member_edit(member, ActionPriority.VOICE, merge, reason)
+
+    def send_dm(self, member, content: str) -> asyncio.Future:
+        self._ensure_started()
+        action = _Action(
+            bucket=DM_BUCKET,
+            key=(DM_BUCKET, next(self._sequence)),
+            priority=ActionPriority.DM,
+            guild=getattr(member, "guild", None),
+            member_id=int(member.id),
+            target=member,
+            content=content,
+        )
+        action.futures.append(self._loop.create_future())
+        self._stats[DM_BUCKET].submitted += 1
+        self._push(action)
+        return action.futures[0]
+
+    def _submit_member_edit(self, member, priority, merge, reason) -> asyncio.Future:
+        self._ensure_started()
+        stats = self._stats[MEMBER_BUCKET]
+        stats.submitted += 1
+        key = (MEMBER_BUCKET, member.guild.id, int(member.id))
+        future = self._loop.create_future()
+        action = self._pending.get(key)
+        if action is not None and not action.started:
+            stats.coalesced += 1
+            merge(action)
+            action.futures.append(future)
+            action.reason = action.reason or reason
+            if priority < action.priority:
+                # re-queue at the higher priority; the stale entry is skipped
+                action.priority = priority
+                self._push(action)
+            return future
+
+        action = _Action(
+            bucket=MEMBER_BUCKET,
+            key=key,
+            priority=priority,
+            guild=member.guild,
+            member_id=int(member.id),
+            reason=reason,
+        )
+        merge(action)
+        action.futures.append(future)
+        self._pending[key] = action
+        self._push(action)
+        return future
+
+    def _push(self, action: _Action) -> None:
+        entry = (action.priority, next(self._sequence), action)
+        self._queues[action.bucket].put_nowait(entry)
+
+    # ------------------------------------------------------------------
+    # workers
+    # ------------------------------------------------------------------
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._pending.clear()
+        self._queues = {bucket: asyncio.PriorityQueue() for bucket in self._concurrency}
+        self._workers = [
+            loop.create_task(self._worker(bucket))
+            for bucket, count in self._concurrency.items()
+            for _ in range(count)
+        ]
+
+    async def _worker(self, bucket: str) -> None:
+        queue = self._queues[bucket]
+        stats = self._stats[bucket]
+        while True:
+            priority, _, action = await queue.get()
+            try:
+                if action.started or priority != action.priority:
+                    continue
+                action.started = True
+                self._pending.pop(action.key, None)
+                stats.waits.append(time.monotonic() - action.enqueued_at)
+                started = time.monotonic()
+                try:
+                    if bucket == DM_BUCKET:
+                        await action.target.send(action.content)
+                        applied = True
+                    else:
+                        applied = await self._apply_member_edit(action)
+                    ok = True
+                except Exception as exc:
+                    print(f"[DiscordActions] Action for member {action.member_id} failed: {exc}")
+                    stats.failed += 1
+                    ok = False
+                else:
+                    if applied:
+                        stats.executed += 1
+                    else:
+                        stats.skipped += 1
+                stats.runs.append(time.monotonic() - started)
+                for future in action.futures:
+                    if not future.done():
+                        future.set_result(ok)
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _apply_member_edit(action: _Action) -> bool:
+        # look the member up again so the role list reflects everything that
+        # happened while the action was waiting
+        member = action.guild.get_member(action.member_id)
+        if member is None:
+            return False
+        kwargs: Dict[str, Any] = {}
+
+        if action.add_roles or action.remove_roles:
+            current = [role for role in member.roles if not role.is_default()]
+            current_ids = {role.id for role in current}
+            roles = [role for role in current if role.id not in action.remove_roles]
+            for role_id in action.add_roles - current_ids:
+                role = action.guild.get_role(role_id)
+                if role is not None:
+                    roles.append(role)
+            if {role.id for role in roles} != current_ids:
+                kwargs["roles"] = roles
+
+        if action.voice_channel is not _UNSET:
+            target = action.voice_channel
+            current_channel = member.voice.channel if member.voice else None
+            if target is None and current_channel is not None:
+                kwargs["voice_channel"] = None
+            elif target is not None and current_channel is not None and current_channel.id != target.id:
+                kwargs["voice_channel"] = target
+
+        if not kwargs:
+            return False
+        await member.edit(reason=action.reason, **kwargs)
+        return True
+
+    # ------------------------------------------------------------------
+    # metrics
+    # ------------------------------------------------------------------
+    def depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def stats(self) -> Dict[str, Dict]:
+        """Queue depth, counters and wait/run latency per rate-limit bucket."""
+        report: Dict[str, Dict] = {}
+        for bucket, stats in self._stats.items():
+            queue = self._queues.get(bucket)
+            report[bucket] = {
+                "depth": queue.qsize() if queue is not None else 0,
+                "concurrency": self._concurrency[bucket],
+                "submitted": stats.submitted,
+                "coalesced": stats.coalesced,
+                "executed": stats.executed,
+                "skipped": stats.skipped,
+                "failed": stats.failed,
+                "wait": _summarize(stats.waits),
+                "run": _summarize(stats.runs),
+            }
+        return report
+
+
+action_queue = DiscordActionQueue()
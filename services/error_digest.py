@@ -0,0 +1,186 @@
+"""Deduplicating, rate-limited delivery of error reports to the error dump channel.
+
+The first report of an error signature goes out straight away. Repeats of the
+same signature are only counted and summarised in a periodic digest, so a
+failure inside a 2-second task loop costs one message per digest interval
+instead of one per tick. Messages whose prefix or text starts with a
+configured critical prefix skip the digest entirely.
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+DISCORD_MESSAGE_LIMIT = 2000
+DEFAULT_DIGEST_INTERVAL = 60.0
+DEFAULT_MIN_SEND_INTERVAL = 2.0
+_SIGNATURE_LENGTH = 200
+_NUMBER_PATTERN = re.compile(r"\d+")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+def error_signature(prefix: str, message: str) -> str:
+    """Collapse ids, counters and whitespace so repeats of one failure share a key."""
+    text = _NUMBER_PATTERN.sub("#", str(message))
+    text = _SPACE_PATTERN.sub(" ", text).strip()
+    return f"{prefix}|{text[:_SIGNATURE_LENGTH]}"
+
+
+def split_message(text: str, limit: int = DISCORD_MESSAGE_LIMIT) -> List[str]:
+    """Split on line boundaries into chunks Discord will accept."""
+    chunks: List[str] = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+@dataclass
+class _DigestEntry:
+    prefix: str
+    sample: str
+    first_seen: float
+    last_seen: float
+    repeats: int = 0
+
+
+class ErrorDigest:
+    def __init__(self) -> None:
+        self.interval = DEFAULT_DIGEST_INTERVAL
+        self.min_send_interval = DEFAULT_MIN_SEND_INTERVAL
+        self.critical_prefixes: tuple[str, ...] = ()
+        self._entries: Dict[int, Dict[str, _DigestEntry]] = {}
+        self._channels: Dict[int, object] = {}
+        self._mentions: Dict[int, str] = {}
+        self._last_sent: Dict[int, float] = {}
+        self._send_locks: Dict[int, asyncio.Lock] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def configure(
+        self,
+        *,
+        interval: Optional[float] = None,
+        min_send_interval: Optional[float] = None,
+        critical_prefixes: Optional[Iterable[str]] = None,
+    ) -> None:
+        if interval is not None:
+            self.interval = max(1.0, float(interval))
+        if min_send_interval is not None:
+            self.min_send_interval = max(0.0, float(min_send_interval))
+        if critical_prefixes is not None:
+            self.critical_prefixes = tuple(str(value) for value in critical_prefixes if str(value))
+
+    def is_critical(self, prefix: str, message: str) -> bool:
+        return any(
+            str(prefix).startswith(critical) or str(message).startswith(critical)
+            for critical in self.critical_prefixes
+        )
+
+    async def report(self, channel, prefix: str, message: str, mention: str = "") -> None:
+        """Send ``message`` now or fold it into the channel's next digest."""
+        self._ensure_flusher()
+        channel_id = channel.id
+        self._channels[channel_id] = channel
+        text = f"{mention}**{prefix}**\n{message}"
+
+        if self.is_critical(prefix, message):
+            await self._send(channel, text, wait=True)
+            return
+
+        now = time.time()
+        entries = self._entries.setdefault(channel_id, {})
+        signature = error_signature(prefix, message)
+        entry = entries.get(signature)
+        if entry is not None:
+            entry.repeats += 1
+            entry.last_seen = now
+            entry.sample = str(message)
+            if mention:
+                self._mentions[channel_id] = mention
+            return
+
+        entry = _DigestEntry(prefix=str(prefix), sample=str(message), first_seen=now, last_seen=now)
+        entries[signature] = entry
+        if not await self._send(channel, text, wait=False):
+            # throttled: let the digest carry it
+            entry.repeats += 1
+            if mention:
+                self._mentions[channel_id] = mention
+
+    async def flush(self) -> None:
+        """Send a digest of repeated errors for every channel and start a new window."""
+        for channel_id, entries in list(self._entries.items()):
+            repeated = {key: entry for key, entry in entries.items() if entry.repeats}
+            # signatures that stayed quiet for a whole window get reported
+            # immediately again next time; noisy ones stay in the digest
+            self._entries[channel_id] = {
+                key: _DigestEntry(entry.prefix, entry.sample, entry.first_seen, entry.last_seen)
+                for key, entry in repeated.items()
+            }
+            channel = self._channels.get(channel_id)
+            if not repeated or channel is None:
+                continue
+            mention = self._mentions.pop(channel_id, "")
+            text = self._format_digest(list(repeated.values()), mention)
+            for chunk in split_message(text):
+                await self._send(channel, chunk, wait=True)
+
+    def _format_digest(self, entries: List[_DigestEntry], mention: str) -> str:
+        total = sum(entry.repeats for entry in entries)
+        lines = [f"{mention}**Error digest** ({total} repeated reports in the last {int(self.interval)}s)"]
+        for entry in sorted(entries, key=lambda item: item.repeats, reverse=True):
+            first = time.strftime("%H:%M:%S", time.localtime(entry.first_seen))
+            last = time.strftime("%H:%M:%S", time.localtime(entry.last_seen))
+            sample = entry.sample if len(entry.sample) <= 300 else entry.sample[:297] + "..."
+            lines.append(f"- **{entry.prefix}** x{entry.repeats} (first {first}, last {last})")
+            lines.append(f"  {sample}")
+        return "\n".join(lines)
+
+    async def _send(self, channel, text: str, *, wait: bool) -> bool:
+        lock = self._send_locks.setdefault(channel.id, asyncio.Lock())
+        if not wait and lock.locked():
+            return False
+        async with lock:
+            elapsed = time.monotonic() - self._last_sent.get(channel.id, 0.0)
+            if elapsed < self.min_send_interval:
+                if not wait:
+                    return False
+                await asyncio.sleep(self.min_send_interval - elapsed)
+            try:
+                for chunk in split_message(text):
+                    await channel.send(chunk)
+            except Exception as exc:
+                print(f"[ErrorDigest] Failed to send to channel {channel.id}: {exc}")
+            self._last_sent[channel.id] = time.monotonic()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                print(f"[ErrorDigest] Failed to flush digest: {exc}")
+
+
+error_digest = ErrorDigest()
@@ -1,43 +1,334 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 import os
+import tempfile
 import threading
-import uuid
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
 
-_LOCKS: dict[str, threading.Lock] = {}
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_LOCK_TIMEOUT = 5.0
+# one app-owned place for the lock files, so none are left next to the data
+# (ban lists in the DayZ profile, user-chosen export paths, ...); every
+# cooperating process running as the same user resolves the same directory
+LOCK_DIRECTORY = Path(tempfile.gettempdir()) / "dayz-death-watcher-locks"
+_LOCK_POLL_INTERVAL = 0.01
+_LOCK_POLL_MAX = 0.1
+
+_LOCKS: dict[str, threading.RLock] = {}
 _LOCKS_GUARD = threading.Lock()
+_HELD = threading.local()
+_WRITE_STATS: Dict[str, int] = {"writes": 0, "bytes": 0}
+_STATS_GUARD = threading.Lock()
+_lock_timeout = DEFAULT_LOCK_TIMEOUT
+
+DURABILITY_MODES = ("none", "file", "full")
+# "file" fsyncs the temp file before the rename, "full" also fsyncs the directory
+DEFAULT_DURABILITY: Dict[str, str] = {
+    "userdata": "full",
+    "lists": "full",
+    "cache": "none",
+    "default": "none",
+}
+_durability: Dict[str, str] = dict(DEFAULT_DURABILITY)
+_FILE_CLASSES: Dict[str, str] = {}
+LATENCY_BUCKETS_MS = (0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+class FileLockTimeout(TimeoutError):
+    """Raised when a shared file stays locked by another thread or process."""
+
+
+@dataclass
+class LockStats:
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+@dataclass
+class LatencyHistogram:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+
+_LOCK_STATS: Dict[str, LockStats] = {}
+_WRITE_LATENCY: Dict[str, LatencyHistogram] = {mode: LatencyHistogram() for mode in DURABILITY_MODES}
 
 
 def _get_lock_key(path: str | Path) -> str:
     return str(Path(path).resolve())
 
 
-def get_file_lock(path: str | Path) -> threading.Lock:
+def get_file_lock(path: str | Path) -> threading.RLock:
+    """In-process lock for ``path``. Prefer :func:`file_lock`, which also locks across processes."""
     key = _get_lock_key(path)
     with _LOCKS_GUARD:
         if key not in _LOCKS:
-            _LOCKS[key] = threading.Lock()
+            _LOCKS[key] = threading.RLock()
         return _LOCKS[key]
 
 
+def configure_file_locks(timeout: Optional[float]) -> None:
+    """Set how long :func:`file_lock` waits before raising :class:`FileLockTimeout`."""
+    global _lock_timeout
+    try:
+        _lock_timeout = max(0.0, float(timeout))
+    except (TypeError, ValueError):
+        _lock_timeout = DEFAULT_LOCK_TIMEOUT
+
+
+def _lock_path_for(path: Path) -> Path:
+    # the data file itself is swapped out by os.replace, so a separate file is
+    # locked; it is named after the resolved path to keep same-named files apart
+    digest = hashlib.sha1(os.path.normcase(_get_lock_key(path)).encode("utf-8")).hexdigest()[:16]
+    return LOCK_DIRECTORY / f"{digest}-{path.name}.lock"
+
+
+def _try_lock_fd(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except (BlockingIOError, PermissionError):
+        return False
+    except OSError as exc:
+        # msvcrt reports a held lock as EACCES/EDEADLK
+        if fcntl is None and exc.errno in (13, 36):
+            return False
+        raise
+    return True
+
+
+def _unlock_fd(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _record_lock(key: str, waited: float, contended: bool, timed_out: bool) -> None:
+    with _STATS_GUARD:
+        stats = _LOCK_STATS.setdefault(key, LockStats())
+        if timed_out:
+            stats.timeouts += 1
+        else:
+            stats.acquisitions += 1
+        if contended:
+            stats.contended += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+
+@contextmanager
+def file_lock(path: str | Path, timeout: Optional[float] = None) -> Iterator[None]:
+    """Hold ``path`` exclusively against other threads and cooperating processes.
+
+    The cross-process part is advisory: the bot, the death watcher and anything
+    else going through this module respect it, the DayZ server does not.
+    Re-entering from the same thread is allowed.
+    """
+    file_path = Path(path)
+    key = _get_lock_key(file_path)
+    held: Dict[str, int] = getattr(_HELD, "depth", None) or {}
+    _HELD.depth = held
+    if held.get(key):
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    limit = _lock_timeout if timeout is None else max(0.0, timeout)
+    start = time.monotonic()
+    deadline = start + limit
+    thread_lock = get_file_lock(file_path)
+    contended = not thread_lock.acquire(blocking=False)
+    if contended and not thread_lock.acquire(timeout=limit):
+        _record_lock(key, time.monotonic() - start, True, True)
+        raise FileLockTimeout(f"Timed out waiting for lock on {file_path}")
+
+    fd = None
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        LOCK_DIRECTORY.mkdir(parents=True, exist_ok=True)
+        fd = os.open(_lock_path_for(file_path), os.O_RDWR | os.O_CREAT, 0o644)
+        delay = _LOCK_POLL_INTERVAL
+        while not _try_lock_fd(fd):
+            contended = True
+            if time.monotonic() >= deadline:
+                _record_lock(key, time.monotonic() - start, True, True)
+                raise FileLockTimeout(f"Timed out waiting for lock on {file_path}")
+            time.sleep(delay)
+            delay = min(delay * 2, _LOCK_POLL_MAX)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        thread_lock.release()
+        raise
+
+    _record_lock(key, time.monotonic() - start, contended, False)
+    held[key] = 1
+    try:
+        yield
+    finally:
+        held[key] = 0
+        try:
+            _unlock_fd(fd)
+        finally:
+            os.close(fd)
+            thread_lock.release()
+
+
+def get_lock_stats() -> Dict[str, Dict[str, float]]:
+    """Return per-file lock counters: acquisitions, contention, timeouts and wait times."""
+    with _STATS_GUARD:
+        return {key: asdict(stats) for key, stats in _LOCK_STATS.items()}
+
+
+def reset_lock_stats() -> None:
+    with _STATS_GUARD:
+        _LOCK_STATS.clear()
+
+
 def read_lines(path: str | Path) -> List[str]:
     file_path = Path(path)
     if not file_path.exists():
         return []
-    with get_file_lock(file_path):
+    with file_lock(file_path):
         return [line.strip() for line in file_path.read_text().splitlines()]
 
 
-def atomic_write_text(path: str | Path, text: str) -> None:
+def register_file_class(path: str | Path, file_class: str) -> None:
+    """Associate ``path`` with a durability class such as ``userdata``, ``lists`` or ``cache``."""
+    with _STATS_GUARD:
+        _FILE_CLASSES[_get_lock_key(path)] = file_class
+
+
+def configure_durability(policies: Optional[Mapping[str, str]]) -> None:
+    """Override the durability mode per file class, e.g. ``{"cache": "none"}``."""
+    updated = dict(DEFAULT_DURABILITY)
+    for file_class, mode in (policies or {}).items():
+        mode = str(mode).strip().lower()
+        if mode not in DURABILITY_MODES:
+            print(f"[FileUtils] Ignoring unknown durability '{mode}' for '{file_class}'.")
+            continue
+        updated[str(file_class)] = mode
+    with _STATS_GUARD:
+        _durability.clear()
+        _durability.update(updated)
+
+
+def get_durability(path: str | Path, file_class: Optional[str] = None) -> str:
+    with _STATS_GUARD:
+        file_class = file_class or _FILE_CLASSES.get(_get_lock_key(path), "default")
+        return _durability.get(file_class, _durability.get("default", "none"))
+
+
+def _fsync_directory(directory: Path) -> None:
+    if os.name == "nt":
+        # directories cannot be opened for fsync on Windows; NTFS journals the rename
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(
+    path: str | Path,
+    text: str,
+    *,
+    durability: Optional[str] = None,
+    file_class: Optional[str] = None,
+) -> None:
+    """Replace ``path`` with ``text`` via a temp file and ``os.replace``.
+
+    ``durability`` (or the policy for ``file_class``/the registered class of
+    ``path``) decides whether the data is fsynced before the rename.
+    """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
-    with get_file_lock(file_path):
-        temp_path.write_text(text)
+    mode = durability or get_durability(file_path, file_class)
+    if mode not in DURABILITY_MODES:
+        raise ValueError(f"Unknown durability mode: {mode}")
+    # the lock makes the writer exclusive, so one temp name per file is enough
+    temp_path = file_path.with_name(f".{file_path.name}.tmp")
+    start = time.perf_counter()
+    with file_lock(file_path):
+        with open(temp_path, "w") as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            if mode != "none":
+                os.fsync(temp_file.fileno())
+            size = temp_file.tell()
         os.replace(temp_path, file_path)
+        if mode == "full":
+            _fsync_directory(file_path.parent)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    with _STATS_GUARD:
+        _WRITE_STATS["writes"] += 1
+        _WRITE_STATS["bytes"] += size
+        _WRITE_LATENCY[mode].add(elapsed_ms)
+
+
+def atomic_write_lines(path: str | Path, lines: Iterable[str], **kwargs) -> None:
+    atomic_write_text(path, "\n".join(lines), **kwargs)
+
+
+def get_write_stats() -> Dict[str, int]:
+    """Return how many atomic writes (and bytes) this process has performed."""
+    with _STATS_GUARD:
+        return dict(_WRITE_STATS)
+
+
+def reset_write_stats() -> None:
+    with _STATS_GUARD:
+        _WRITE_STATS["writes"] = 0
+        _WRITE_STATS["bytes"] = 0
+
+
+def get_write_latency_histograms() -> Dict[str, Dict]:
+    """Return write latency per durability mode; bucket labels are upper bounds in ms."""
+    labels = [f"<={bound:g}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]:g}ms"]
+    with _STATS_GUARD:
+        return {
+            mode: {
+                "count": histogram.count,
+                "mean_ms": histogram.total_ms / histogram.count if histogram.count else 0.0,
+                "max_ms": histogram.max_ms,
+                "buckets": dict(zip(labels, histogram.buckets)),
+            }
+            for mode, histogram in _WRITE_LATENCY.items()
+        }
 
 
-def atomic_write_lines(path: str | Path, lines: Iterable[str]) -> None:
-    atomic_write_text(path, "\n".join(lines))
+def reset_write_latency_histograms() -> None:
+    with _STATS_GUARD:
+        for mode in DURABILITY_MODES:
+            _WRITE_LATENCY[mode] = LatencyHistogram()
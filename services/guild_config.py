@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+# settings that may differ per Discord guild; everything else is shared
+GUILD_KEYS = (
+    "guild_id",
+    "admin_role_id",
+    "validate_steam_id_channel",
+    "join_vc_id",
+    "join_vc_category_id",
+    "alive_role",
+    "dead_role",
+    "can_revive_role",
+    "season_pass_role",
+)
+
+
+def _coerce_guild_id(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def normalize_guilds(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return one settings block per guild.
+
+    ``config["guilds"]`` is a list of blocks holding any of :data:`GUILD_KEYS`;
+    keys a block leaves out fall back to the top-level value. Without a
+    ``guilds`` list the top-level keys describe the single legacy guild.
+    """
+    defaults = {key: config.get(key) for key in GUILD_KEYS if key in config}
+    blocks = config.get("guilds")
+    if not isinstance(blocks, list) or not blocks:
+        blocks = [{}]
+
+    normalized: List[Dict[str, Any]] = []
+    seen = set()
+    for entry in blocks:
+        if not isinstance(entry, dict):
+            continue
+        block = dict(defaults)
+        block.update({key: entry[key] for key in GUILD_KEYS if key in entry})
+        guild_id = _coerce_guild_id(block.get("guild_id"))
+        if not guild_id or guild_id in seen:
+            continue
+        block["guild_id"] = guild_id
+        seen.add(guild_id)
+        normalized.append(block)
+    return normalized
+
+
+def get_guild_ids(config: Dict[str, Any]) -> List[int]:
+    return [block["guild_id"] for block in normalize_guilds(config)]
+
+
+def get_primary_guild_id(config: Dict[str, Any]) -> int:
+    """The first configured guild; used where a single guild has to be picked."""
+    guild_ids = get_guild_ids(config)
+    return guild_ids[0] if guild_ids else _coerce_guild_id(config.get("guild_id"))
+
+
+def get_guild_config(config: Dict[str, Any], guild_id: Any) -> Optional[Dict[str, Any]]:
+    target = _coerce_guild_id(guild_id)
+    for block in config.get("guild_configs") or normalize_guilds(config):
+        if block["guild_id"] == target:
+            return block
+    return None
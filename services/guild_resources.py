@@ -0,0 +1,111 @@
+"""Id -> role/channel cache shared by the task loops and cogs.
+
+A guild is indexed lazily on its first lookup (or on ``on_ready``); after that
+the ``cogs/guild_resources.py`` listeners apply role and channel
+create/update/delete events, so resolving a configured role, the join voice
+channel or the voice channels of the join category is a dictionary access
+instead of a pass over ``guild.roles`` / ``guild.channels``.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set
+
+import nextcord
+
+
+class _GuildEntry:
+    def __init__(self) -> None:
+        self.roles: Dict[int, object] = {}
+        self.channels: Dict[int, object] = {}
+        self.category_voice: Dict[int, Set[int]] = {}
+
+
+class GuildResourceCache:
+    def __init__(self) -> None:
+        self._guilds: Dict[int, _GuildEntry] = {}
+
+    def rebuild(self, guild) -> None:
+        entry = _GuildEntry()
+        for role in guild.roles:
+            entry.roles[role.id] = role
+        for channel in guild.channels:
+            self._store_channel(entry, channel)
+        self._guilds[guild.id] = entry
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def _entry(self, guild) -> _GuildEntry:
+        entry = self._guilds.get(guild.id)
+        if entry is None:
+            self.rebuild(guild)
+            entry = self._guilds[guild.id]
+        return entry
+
+    # ------------------------------------------------------------------
+    # lookups
+    # ------------------------------------------------------------------
+    def role(self, guild, role_id) -> Optional[object]:
+        if guild is None:
+            return None
+        try:
+            return self._entry(guild).roles.get(int(role_id))
+        except (TypeError, ValueError):
+            return None
+
+    def channel(self, guild, channel_id) -> Optional[object]:
+        if guild is None:
+            return None
+        try:
+            return self._entry(guild).channels.get(int(channel_id))
+        except (TypeError, ValueError):
+            return None
+
+    def voice_channels_in(self, guild, category_id) -> List[object]:
+        """Voice channels currently under ``category_id``."""
+        if guild is None:
+            return []
+        entry = self._entry(guild)
+        try:
+            channel_ids = entry.category_voice.get(int(category_id), ())
+        except (TypeError, ValueError):
+            return []
+        return [entry.channels[channel_id] for channel_id in list(channel_ids) if channel_id in entry.channels]
+
+    # ------------------------------------------------------------------
+    # event updates
+    # ------------------------------------------------------------------
+    def role_changed(self, role) -> None:
+        entry = self._guilds.get(role.guild.id)
+        if entry is not None:
+            entry.roles[role.id] = role
+
+    def role_deleted(self, role) -> None:
+        entry = self._guilds.get(role.guild.id)
+        if entry is not None:
+            entry.roles.pop(role.id, None)
+
+    def channel_changed(self, channel) -> None:
+        entry = self._guilds.get(channel.guild.id)
+        if entry is not None:
+            self._drop_channel(entry, channel.id)
+            self._store_channel(entry, channel)
+
+    def channel_deleted(self, channel) -> None:
+        entry = self._guilds.get(channel.guild.id)
+        if entry is not None:
+            self._drop_channel(entry, channel.id)
+            entry.category_voice.pop(channel.id, None)
+
+    def _store_channel(self, entry: _GuildEntry, channel) -> None:
+        entry.channels[channel.id] = channel
+        if isinstance(channel, nextcord.VoiceChannel) and channel.category_id is not None:
+            entry.category_voice.setdefault(channel.category_id, set()).add(channel.id)
+
+    def _drop_channel(self, entry: _GuildEntry, channel_id: int) -> None:
+        entry.channels.pop(channel_id, None)
+        for channel_ids in entry.category_voice.values():
+            channel_ids.discard(channel_id)
+
+
+guild_resources = GuildResourceCache()
@@ -0,0 +1,208 @@
+"""Incrementally maintained alive-time leaderboards.
+
+Each board keeps its scores in a list sorted by ``(-seconds, discord_id)``, so
+a disconnect event costs a bisect + insert instead of re-reading and sorting
+the whole userdata DB. Boards are named ``all_time``, ``server:<id>`` and
+``season:<key>``. ``all_time`` mirrors ``alive_time_seconds`` in the userdata
+DB: it follows disconnects like the others and is only rebuilt from the DB on
+start-up and when users are added, removed or renamed. The other boards only
+exist here, so they are persisted to a small snapshot file.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from services.file_utils import atomic_write_text
+
+ALL_TIME = "all_time"
+
+
+def server_board(server_id: str) -> str:
+    return f"server:{server_id}"
+
+
+def season_board(season: str) -> str:
+    return f"season:{season}"
+
+
+class LeaderboardIndex:
+    """Sorted scores for one board with O(log n) lookup of a player's slot."""
+
+    def __init__(self) -> None:
+        self._order: List[Tuple[int, str]] = []
+        self._scores: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @classmethod
+    def from_scores(cls, scores: Dict[str, int]) -> "LeaderboardIndex":
+        """Build a board in one sort instead of one insort per player."""
+        board = cls()
+        board._scores = {discord_id: max(0, int(seconds)) for discord_id, seconds in scores.items()}
+        board._order = sorted((-seconds, discord_id) for discord_id, seconds in board._scores.items())
+        return board
+
+    def set(self, discord_id: str, seconds: int) -> bool:
+        """Record ``seconds`` as the player's score. Returns False if nothing changed."""
+        seconds = max(0, int(seconds))
+        previous = self._scores.get(discord_id)
+        if previous == seconds:
+            return False
+        if previous is not None:
+            self._discard(discord_id, previous)
+        self._scores[discord_id] = seconds
+        bisect.insort(self._order, (-seconds, discord_id))
+        return True
+
+    def remove(self, discord_id: str) -> bool:
+        previous = self._scores.pop(discord_id, None)
+        if previous is None:
+            return False
+        self._discard(discord_id, previous)
+        return True
+
+    def _discard(self, discord_id: str, seconds: int) -> None:
+        key = (-seconds, discord_id)
+        position = bisect.bisect_left(self._order, key)
+        if position < len(self._order) and self._order[position] == key:
+            del self._order[position]
+
+    def top(self, count: int) -> List[Tuple[str, int]]:
+        return [(discord_id, -negative) for negative, discord_id in self._order[:count]]
+
+    def scores(self) -> Dict[str, int]:
+        return dict(self._scores)
+
+
+class LeaderboardService:
+    def __init__(self, snapshot_path: Optional[str | Path] = None) -> None:
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._boards: Dict[str, LeaderboardIndex] = {ALL_TIME: LeaderboardIndex()}
+        self._players: Dict[str, Dict] = {}
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # loading / saving
+    # ------------------------------------------------------------------
+    def load_all_time(self, userdata_json: Dict) -> None:
+        """Rebuild the ``all_time`` board and player details from the userdata DB.
+
+        Disconnects reach the board through ``record``; this full rebuild is for
+        changes that bypass it (wipes, deleted users, renames).
+        """
+        scores: Dict[str, int] = {}
+        players: Dict[str, Dict] = {}
+        for discord_id, user in userdata_json.get("userdata", {}).items():
+            players[discord_id] = {
+                "username": user.get("username", "Unknown"),
+                "steam_id": user.get("steam_id", ""),
+                "is_alive": int(user.get("is_alive", 1)),
+            }
+            alive_seconds = user.get("alive_time_seconds")
+            if alive_seconds in (None, ""):
+                continue
+            try:
+                scores[discord_id] = int(alive_seconds)
+            except (TypeError, ValueError):
+                continue
+        self._boards[ALL_TIME] = LeaderboardIndex.from_scores(scores)
+        self._players = players
+
+    def load_snapshot(self) -> None:
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            data = json.loads(self.snapshot_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            print(f"[Leaderboard] Ignoring unreadable snapshot: {self.snapshot_path}")
+            return
+        for name, scores in data.get("boards", {}).items():
+            if name == ALL_TIME or not isinstance(scores, dict):
+                continue
+            valid: Dict[str, int] = {}
+            for discord_id, seconds in scores.items():
+                try:
+                    valid[str(discord_id)] = int(seconds)
+                except (TypeError, ValueError):
+                    continue
+            self._boards[name] = LeaderboardIndex.from_scores(valid)
+
+    def save_snapshot(self) -> None:
+        if not self.snapshot_path or not self._dirty:
+            return
+        boards = {
+            name: board.scores() for name, board in self._boards.items() if name != ALL_TIME
+        }
+        atomic_write_text(self.snapshot_path, json.dumps({"boards": boards}, indent=4))
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # updates
+    # ------------------------------------------------------------------
+    def record(
+        self,
+        discord_id: str,
+        seconds: int,
+        *,
+        user: Optional[Dict] = None,
+        server_id: Optional[str] = None,
+        season: Optional[str] = None,
+    ) -> Set[str]:
+        """Apply one disconnect to every board it belongs on; returns the boards that changed."""
+        discord_id = str(discord_id)
+        if user is not None:
+            self._players[discord_id] = {
+                "username": user.get("username", "Unknown"),
+                "steam_id": user.get("steam_id", ""),
+                "is_alive": int(user.get("is_alive", 1)),
+            }
+        names = [ALL_TIME]
+        if server_id:
+            names.append(server_board(server_id))
+        if season:
+            names.append(season_board(season))
+
+        changed: Set[str] = set()
+        for name in names:
+            board = self._boards.setdefault(name, LeaderboardIndex())
+            if board.set(discord_id, seconds):
+                changed.add(name)
+        if changed - {ALL_TIME}:
+            self._dirty = True
+        return changed
+
+    def set_player_status(self, discord_id: str, *, is_alive: bool) -> bool:
+        player = self._players.get(str(discord_id))
+        if player is None or player["is_alive"] == int(is_alive):
+            return False
+        player["is_alive"] = int(is_alive)
+        return True
+
+    # ------------------------------------------------------------------
+    # queries
+    # ------------------------------------------------------------------
+    def board_names(self) -> Iterable[str]:
+        return list(self._boards)
+
+    def top(self, name: str, count: int = 10) -> List[Dict]:
+        """Top entries in the same shape ``get_alive_time_leaderboard`` returns."""
+        board = self._boards.get(name)
+        if board is None:
+            return []
+        entries = []
+        for discord_id, seconds in board.top(count):
+            player = self._players.get(discord_id, {})
+            entries.append(
+                {
+                    "discord_id": discord_id,
+                    "username": player.get("username", "Unknown"),
+                    "steam_id": player.get("steam_id", ""),
+                    "alive_time_seconds": seconds,
+                    "is_alive": player.get("is_alive", 1),
+                }
+            )
+        return entries
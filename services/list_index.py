@@ -0,0 +1,138 @@
+"""Line-offset index over whitelist/ban files for paging through huge lists.
+
+The file is read once per change (mtime/size) into memory together with an
+``array`` of line start offsets, so any row can be fetched by position
+without splitting the whole file into Python strings. The file is not
+memory-mapped on purpose: an open mapping would stop the bot from atomically
+replacing the list on Windows.
+"""
+from __future__ import annotations
+
+import bisect
+import operator
+import os
+from array import array
+from itertools import accumulate, compress, repeat
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+
+class ListFileIndex:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._data = b""
+        self._starts = array("Q")
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    def refresh(self) -> bool:
+        """Re-index the file if it changed on disk; returns True when it did."""
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            stamp = None
+        if stamp == self._stamp and (stamp is not None or not self._data):
+            return False
+        self._stamp = stamp
+        if stamp is None:
+            self._data = b""
+            self._starts = array("Q")
+            return True
+        with open(self.path, "rb") as file:
+            data = file.read()
+        lines = data.split(b"\n")
+        # start offset of every line, computed and filtered without a Python loop;
+        # blank lines are skipped, as ``load_list`` does
+        offsets = accumulate(map(operator.add, map(len, lines), repeat(1)), initial=0)
+        self._data = data
+        self._starts = array("Q", compress(offsets, map(bytes.strip, lines)))
+        return True
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line(self, index: int) -> str:
+        start = self._starts[index]
+        end = self._data.find(b"\n", start)
+        if end < 0:
+            end = len(self._data)
+        return self._data[start:end].decode("utf-8", errors="ignore").strip()
+
+    def lines(self, start: int, stop: int) -> List[str]:
+        return [self.line(index) for index in range(max(0, start), min(stop, len(self._starts)))]
+
+    def find(self, query: str, start: int = 0) -> Optional[int]:
+        """Index of the first line at or after ``start`` containing ``query``."""
+        needle = query.strip().encode("utf-8")
+        if not needle or b"\n" in needle or start >= len(self._starts):
+            return None
+        offset = self._data.find(needle, self._starts[max(0, start)])
+        if offset < 0:
+            return None
+        # blank lines are not indexed, but they cannot contain a non-blank needle
+        return bisect.bisect_right(self._starts, offset) - 1
+
+
+class CombinedListIndex:
+    """Presents several files' indexes as one list of ``(label, line)`` rows."""
+
+    def __init__(self, parts: Sequence[Tuple[str, ListFileIndex]]) -> None:
+        self.parts = list(parts)
+        self._ends: List[int] = []
+        self._recount()
+
+    def _recount(self) -> None:
+        total = 0
+        ends = []
+        for _label, index in self.parts:
+            total += len(index)
+            ends.append(total)
+        self._ends = ends
+
+    def refresh(self) -> bool:
+        changed = False
+        for _label, index in self.parts:
+            changed = index.refresh() or changed
+        if changed:
+            self._recount()
+        return changed
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def _locate(self, row: int) -> Tuple[int, int]:
+        part = bisect.bisect_right(self._ends, row)
+        offset = self._ends[part - 1] if part else 0
+        return part, row - offset
+
+    def rows(self, start: int, stop: int) -> List[Tuple[str, str]]:
+        result: List[Tuple[str, str]] = []
+        row = max(0, start)
+        stop = min(stop, len(self))
+        while row < stop:
+            part, local = self._locate(row)
+            label, index = self.parts[part]
+            take = min(stop - row, len(index) - local)
+            result.extend((label, line) for line in index.lines(local, local + take))
+            row += take
+        return result
+
+    def find(self, query: str, start: int = 0) -> Optional[int]:
+        """Row of the next match at or after ``start`` across all files, wrapping around."""
+        total = len(self)
+        if not total:
+            return None
+        start = min(max(0, start), total - 1)
+        found = self._find_from(query, start)
+        if found is None and start:
+            found = self._find_from(query, 0)
+        return found
+
+    def _find_from(self, query: str, start: int) -> Optional[int]:
+        first_part, local = self._locate(start)
+        for part in range(first_part, len(self.parts)):
+            index = self.parts[part][1]
+            found = index.find(query, local if part == first_part else 0)
+            if found is not None:
+                return self._ends[part] - len(index) + found
+        return None
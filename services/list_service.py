@@ -2,9 +2,178 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from services.file_utils import atomic_write_text
+from services.file_utils import atomic_write_lines, atomic_write_text, file_lock, read_lines
+
+
+def is_valid_steam_id(value: str) -> bool:
+    return value.isdigit() and len(value) == 17
+
+
+def sanitize_steam_id_list(values: List[str]) -> List[str]:
+    cleaned: List[str] = []
+    seen = set()
+    for value in values:
+        trimmed = value.strip()
+        if not is_valid_steam_id(trimmed) or trimmed in seen:
+            continue
+        cleaned.append(trimmed)
+        seen.add(trimmed)
+    return cleaned
+
+
+def remove_steam_id_occurrences(values: List[str], steam_id: str) -> List[str]:
+    target = str(steam_id)
+    return [value for value in values if value != target]
+
+
+def add_steam_id_to_list(path: str, steam_id: str) -> None:
+    """Append a Steam ID to a whitelist/ban file, dropping invalid and duplicate lines."""
+    with file_lock(path):
+        values = sanitize_steam_id_list(read_lines(path))
+        values = remove_steam_id_occurrences(values, steam_id)
+        values.append(str(steam_id))
+        atomic_write_lines(path, values, file_class="lists")
+
+
+def remove_steam_id_from_list(path: str, steam_id: str) -> bool:
+    """Remove a Steam ID from a whitelist/ban file. Only rewrites the file when it changed."""
+    with file_lock(path):
+        values = sanitize_steam_id_list(read_lines(path))
+        updated = remove_steam_id_occurrences(values, steam_id)
+        if len(updated) == len(values):
+            return False
+        atomic_write_lines(path, updated, file_class="lists")
+    return True
+
+
+def remove_steam_ids_from_list(path: str, steam_ids: Iterable[str]) -> int:
+    """Remove several Steam IDs with a single rewrite. Returns how many lines were dropped."""
+    targets = {str(steam_id) for steam_id in steam_ids}
+    if not targets:
+        return 0
+    with file_lock(path):
+        values = sanitize_steam_id_list(read_lines(path))
+        updated = [value for value in values if value not in targets]
+        removed = len(values) - len(updated)
+        if removed:
+            atomic_write_lines(path, updated, file_class="lists")
+    return removed
+
+
+def load_server_list_state(servers: Iterable[Dict]) -> Dict[str, Dict]:
+    """Read and sanitize every server's whitelist and ban file for one enforcement pass."""
+    server_state: Dict[str, Dict] = {}
+    for server in servers:
+        server_id = str(server["server_id"])
+        whitelist_path = server.get("path_to_whitelist", "")
+        blacklist_path = server.get("path_to_bans", "")
+        whitelist_raw = read_lines(whitelist_path)
+        blacklist_raw = read_lines(blacklist_path)
+        whitelist_list = sanitize_steam_id_list(whitelist_raw)
+        blacklist_list = sanitize_steam_id_list(blacklist_raw)
+        server_state[server_id] = {
+            "whitelist_path": whitelist_path,
+            "blacklist_path": blacklist_path,
+            "whitelist_list": whitelist_list,
+            "blacklist_list": blacklist_list,
+            "whitelist_updated": len(whitelist_list) != len(whitelist_raw),
+            "blacklist_updated": len(blacklist_list) != len(blacklist_raw),
+        }
+    return server_state
+
+
+def ban_in_state(state: Dict, steam_id: str) -> bool:
+    if steam_id in state["blacklist_list"]:
+        return False
+    state["blacklist_list"].append(steam_id)
+    state["blacklist_updated"] = True
+    return True
+
+
+def unban_in_state(state: Dict, steam_id: str) -> bool:
+    if steam_id not in state["blacklist_list"]:
+        return False
+    state["blacklist_list"] = remove_steam_id_occurrences(state["blacklist_list"], steam_id)
+    state["blacklist_updated"] = True
+    return True
+
+
+def find_voice_member(guilds: Iterable[Tuple[Dict, Any]], user_id: str) -> Tuple[Optional[Any], bool]:
+    """Look a user up in every ``(guild block, guild)`` pair for one ``vc_check`` pass.
+
+    Returns the first member found and whether they sit in any guild's join
+    voice category, so one pass over the shared userdata serves every guild.
+    """
+    member = None
+    in_join_category = False
+    for block, guild in guilds:
+        try:
+            guild_member = guild.get_member(int(user_id))
+        except Exception:
+            guild_member = None
+        if guild_member is None:
+            continue
+        member = member or guild_member
+        try:
+            category_id = int(guild_member.voice.channel.category_id)
+        except Exception:
+            category_id = 0
+        if category_id == int(block["join_vc_category_id"]):
+            in_join_category = True
+    return member, in_join_category
+
+
+def is_exempt_from_voice_check(member: Optional[Any], userdata: Dict) -> bool:
+    """Bots and dead non-admins are left alone by ``vc_check``."""
+    if member is None:
+        return False
+    return bool(member.bot) or (int(userdata["is_alive"]) == 0 and int(userdata["is_admin"]) == 0)
+
+
+def apply_voice_check(
+    server_state: Dict[str, Dict],
+    steam_id: str,
+    *,
+    is_admin: bool,
+    in_voice: bool,
+    scope_servers: Iterable[str],
+) -> List[Tuple[str, str]]:
+    """Ban or unban one Steam ID in the loaded list state.
+
+    Admins are unbanned everywhere; everyone else is unbanned on their scope
+    servers while in a join channel and banned there otherwise. Returns the
+    ``(server_id, "ban" | "unban")`` changes that were actually made.
+    """
+    changes: List[Tuple[str, str]] = []
+    if is_admin:
+        for server_id, state in server_state.items():
+            if unban_in_state(state, steam_id):
+                changes.append((server_id, "unban"))
+        return changes
+    for server_id in scope_servers:
+        state = server_state.get(server_id)
+        if not state:
+            continue
+        if in_voice:
+            if unban_in_state(state, steam_id):
+                changes.append((server_id, "unban"))
+        elif ban_in_state(state, steam_id):
+            changes.append((server_id, "ban"))
+    return changes
+
+
+def write_server_list_state(server_state: Dict[str, Dict]) -> None:
+    for state in server_state.values():
+        if state["whitelist_updated"]:
+            atomic_write_lines(
+                state["whitelist_path"], state["whitelist_list"], file_class="lists"
+            )
+        if state["blacklist_updated"]:
+            atomic_write_lines(
+                state["blacklist_path"], state["blacklist_list"], file_class="lists"
+            )
 
 
 def load_list(path: str) -> List[str]:
@@ -0,0 +1,74 @@
+"""Name -> member id index used to resolve error-dump mentions without scanning guilds."""
+from __future__ import annotations
+
+from typing import Dict, Set
+
+
+class MemberNameIndex:
+    """Keeps ``member.name`` -> ids per guild in sync with member events.
+
+    A guild is indexed lazily on its first lookup; after that the
+    ``cogs/member_index.py`` listeners keep it current so each lookup is a
+    dictionary access instead of a pass over ``guild.members``.
+    """
+
+    def __init__(self) -> None:
+        self._ids_by_name: Dict[int, Dict[str, Set[int]]] = {}
+        self._name_by_id: Dict[int, Dict[int, str]] = {}
+
+    def rebuild(self, guild) -> None:
+        ids_by_name: Dict[str, Set[int]] = {}
+        name_by_id: Dict[int, str] = {}
+        for member in guild.members:
+            ids_by_name.setdefault(member.name, set()).add(member.id)
+            name_by_id[member.id] = member.name
+        self._ids_by_name[guild.id] = ids_by_name
+        self._name_by_id[guild.id] = name_by_id
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._ids_by_name.pop(guild_id, None)
+        self._name_by_id.pop(guild_id, None)
+
+    def add(self, member) -> None:
+        guild_id = member.guild.id
+        if guild_id not in self._name_by_id:
+            return
+        self._remove_id(guild_id, member.id)
+        self._name_by_id[guild_id][member.id] = member.name
+        self._ids_by_name[guild_id].setdefault(member.name, set()).add(member.id)
+
+    def remove(self, member) -> None:
+        if member.guild.id in self._name_by_id:
+            self._remove_id(member.guild.id, member.id)
+
+    def rename_user(self, user) -> None:
+        """Apply a username change to every guild the user is indexed in."""
+        for guild_id, name_by_id in self._name_by_id.items():
+            if user.id not in name_by_id:
+                continue
+            self._remove_id(guild_id, user.id)
+            name_by_id[user.id] = user.name
+            self._ids_by_name[guild_id].setdefault(user.name, set()).add(user.id)
+
+    def _remove_id(self, guild_id: int, member_id: int) -> None:
+        old_name = self._name_by_id[guild_id].pop(member_id, None)
+        if old_name is None:
+            return
+        ids = self._ids_by_name[guild_id].get(old_name)
+        if ids is not None:
+            ids.discard(member_id)
+            if not ids:
+                del self._ids_by_name[guild_id][old_name]
+
+    def lookup(self, guild, name: str) -> str:
+        """Return the member id for ``name`` as a string, or ``""`` if nobody has it."""
+        if guild is None or not name:
+            return ""
+        if guild.id not in self._ids_by_name:
+            self.rebuild(guild)
+        ids = self._ids_by_name[guild.id].get(name)
+        # duplicate legacy names resolve to the oldest account
+        return str(min(ids)) if ids else ""
+
+
+member_index = MemberNameIndex()
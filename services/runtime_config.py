@@ -0,0 +1,24 @@
+"""The parsed ``config.json`` shared by main and the cogs.
+
+``main.main`` parses and normalizes the file once and publishes it here, so
+loading a cog no longer re-opens and re-parses the config. Reading it before
+it was published (e.g. importing a cog on its own) falls back to the file.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+_config: Optional[Dict[str, Any]] = None
+
+
+def set_runtime_config(config: Dict[str, Any]) -> None:
+    global _config
+    _config = config
+
+
+def get_runtime_config(path: str = "config.json") -> Dict[str, Any]:
+    if _config is None:
+        with open(path) as file:
+            return json.load(file)
+    return _config
@@ -0,0 +1,139 @@
+"""In-memory search over registered users for the GUI's member pickers."""
+from __future__ import annotations
+
+import bisect
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_SUGGESTION_LIMIT = 20
+
+_FIELD_SEP = "\x1f"
+_ENTRY_SEP = "\x1e"
+
+
+def _search_keys(entry: Dict) -> Tuple[str, ...]:
+    keys = (
+        str(entry.get("username", "")).lower(),
+        str(entry.get("discord_id", "")),
+        str(entry.get("steam_id", "")).lower(),
+    )
+    return tuple(key.replace(_FIELD_SEP, "").replace(_ENTRY_SEP, "") for key in keys if key)
+
+
+def _sort_key(entry: Dict) -> Tuple[str, str]:
+    return (str(entry.get("username", "")).lower(), str(entry.get("discord_id", "")))
+
+
+class UserSearchIndex:
+    """Prefix and substring lookup over usernames, Discord IDs and Steam IDs.
+
+    Prefix matches come from a sorted key array (``bisect``), substring
+    matches from one joined haystack searched with ``str.find``, so a query
+    never loops over users in Python. ``sync`` applies a fresh user list as
+    a diff, re-sorting only the entries whose searchable fields changed.
+    """
+
+    def __init__(self, limit: int = DEFAULT_SUGGESTION_LIMIT) -> None:
+        self.limit = limit
+        self._entries: Dict[str, Dict] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._order: List[Tuple[Tuple[str, str], str]] = []
+        self._haystack = ""
+        self._starts: List[int] = []
+        self._haystack_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, entries: Iterable[Dict]) -> int:
+        """Make the index match ``entries``; returns how many users were added, changed or removed."""
+        incoming = {str(entry["discord_id"]): entry for entry in entries}
+        if not self._entries:
+            self._rebuild(incoming)
+            return len(incoming)
+        changed = 0
+        for discord_id in [key for key in self._entries if key not in incoming]:
+            self._remove(discord_id)
+            changed += 1
+        for discord_id, entry in incoming.items():
+            current = self._entries.get(discord_id)
+            if current is not None and _search_keys(current) == _search_keys(entry):
+                # only non-searchable fields (e.g. is_admin) may differ
+                self._entries[discord_id] = entry
+                continue
+            if current is not None:
+                self._remove(discord_id)
+            self._add(discord_id, entry)
+            changed += 1
+        if changed:
+            self._build_haystack()
+        return changed
+
+    def _rebuild(self, entries: Dict[str, Dict]) -> None:
+        self._entries = dict(entries)
+        self._keys = sorted(
+            (key, discord_id) for discord_id, entry in entries.items() for key in _search_keys(entry)
+        )
+        self._order = sorted((_sort_key(entry), discord_id) for discord_id, entry in entries.items())
+        self._build_haystack()
+
+    def _add(self, discord_id: str, entry: Dict) -> None:
+        self._entries[discord_id] = entry
+        for key in _search_keys(entry):
+            bisect.insort(self._keys, (key, discord_id))
+        bisect.insort(self._order, (_sort_key(entry), discord_id))
+
+    def _remove(self, discord_id: str) -> None:
+        entry = self._entries.pop(discord_id)
+        for key in _search_keys(entry):
+            position = bisect.bisect_left(self._keys, (key, discord_id))
+            if position < len(self._keys) and self._keys[position] == (key, discord_id):
+                del self._keys[position]
+        position = bisect.bisect_left(self._order, (_sort_key(entry), discord_id))
+        if position < len(self._order) and self._order[position][1] == discord_id:
+            del self._order[position]
+
+    def _build_haystack(self) -> None:
+        parts: List[str] = []
+        starts: List[int] = []
+        ids: List[str] = []
+        offset = 0
+        for _sort, discord_id in self._order:
+            text = _FIELD_SEP.join(_search_keys(self._entries[discord_id])) + _ENTRY_SEP
+            starts.append(offset)
+            ids.append(discord_id)
+            parts.append(text)
+            offset += len(text)
+        self._haystack = "".join(parts)
+        self._starts = starts
+        self._haystack_ids = ids
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """Up to ``limit`` users: prefix matches first, then substring matches."""
+        limit = self.limit if limit is None else limit
+        query = query.strip().lower().replace(_FIELD_SEP, "").replace(_ENTRY_SEP, "")
+        if not query:
+            return [self._entries[discord_id] for _sort, discord_id in self._order[:limit]]
+
+        found: Dict[str, None] = {}
+        position = bisect.bisect_left(self._keys, (query, ""))
+        while position < len(self._keys) and len(found) < limit:
+            key, discord_id = self._keys[position]
+            if not key.startswith(query):
+                break
+            found.setdefault(discord_id, None)
+            position += 1
+        prefix_ids = sorted(found, key=lambda discord_id: _sort_key(self._entries[discord_id]))
+
+        if len(found) < limit:
+            haystack = self._haystack
+            cursor = haystack.find(query)
+            while cursor >= 0 and len(found) < limit:
+                index = bisect.bisect_right(self._starts, cursor) - 1
+                discord_id = self._haystack_ids[index]
+                if discord_id not in found:
+                    found[discord_id] = None
+                    prefix_ids.append(discord_id)
+                # continue with the next user rather than the next occurrence
+                next_start = self._starts[index + 1] if index + 1 < len(self._starts) else len(haystack)
+                cursor = haystack.find(query, next_start)
+        return [self._entries[discord_id] for discord_id in prefix_ids]
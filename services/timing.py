@@ -0,0 +1,41 @@
+"""Wall-clock breakdown of multi-step operations such as bot start-up."""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+
+class PhaseTimer:
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.phases: List[Tuple[str, float]] = []
+        self._started = time.perf_counter()
+        self._last = self._started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - started))
+
+    def mark(self, name: str) -> None:
+        """Record the time since the previous phase ended as ``name``."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self._started
+
+    def report(self) -> str:
+        width = max([len(name) for name, _ in self.phases] + [5])
+        lines = [f"[{self.label}] Timing:"]
+        for name, seconds in self.phases:
+            lines.append(f"\t{name:<{width}} {seconds * 1000:9.1f} ms")
+        lines.append(f"\t{'total':<{width}} {self.total * 1000:9.1f} ms")
+        return "\n".join(lines)
@@ -21,7 +21,12 @@ def load_userdata(path: str) -> Dict:
 def list_dead_players(
     path: str, *, default_wait_seconds: Optional[int] = None
 ) -> List[Dict[str, str]]:
-    data = load_userdata(path)
+    return dead_players_from_data(load_userdata(path), default_wait_seconds=default_wait_seconds)
+
+
+def dead_players_from_data(
+    data: Dict, *, default_wait_seconds: Optional[int] = None
+) -> List[Dict[str, str]]:
     result: List[Dict[str, str]] = []
     for discord_id, info in data.get("userdata", {}).items():
         if int(info.get("is_alive", 1)) == 0:
@@ -70,7 +75,7 @@ def _calculate_revive_eta(
 
 
 def _save_userdata(path: Path, data: Dict) -> None:
-    atomic_write_text(path, json.dumps(data, indent=4))
+    atomic_write_text(path, json.dumps(data, indent=4), file_class="userdata")
 
 
 def _modify_user(path: Path, discord_id: str, updater) -> Tuple[bool, Dict]:
@@ -159,30 +164,45 @@ def _match_user_by_identifier(data: Dict, steam_id: Optional[str], guid: Optiona
     return None, None
 
 
-def set_alive_time_seconds(
+def record_alive_time(
     path: str,
     *,
     steam_id: Optional[str] = None,
     guid: Optional[str] = None,
     alive_seconds: Optional[int] = None,
-) -> bool:
-    """Persist the latest recorded alive time for a player."""
+) -> Optional[Tuple[str, Dict]]:
+    """Persist the latest recorded alive time and return ``(discord_id, user)``."""
 
     if alive_seconds is None:
-        return False
+        return None
 
     data = _read_json(Path(path))
-    _, user = _match_user_by_identifier(data, steam_id, guid)
+    discord_id, user = _match_user_by_identifier(data, steam_id, guid)
     if not user:
-        return False
+        return None
 
     try:
         user["alive_time_seconds"] = max(0, int(alive_seconds))
     except (TypeError, ValueError):
-        return False
+        return None
 
     _save_userdata(Path(path), data)
-    return True
+    return discord_id, user
+
+
+def set_alive_time_seconds(
+    path: str,
+    *,
+    steam_id: Optional[str] = None,
+    guid: Optional[str] = None,
+    alive_seconds: Optional[int] = None,
+) -> bool:
+    """Persist the latest recorded alive time for a player."""
+
+    return (
+        record_alive_time(path, steam_id=steam_id, guid=guid, alive_seconds=alive_seconds)
+        is not None
+    )
 
 
 def get_alive_time_leaderboard(path: str, top_n: int = 10) -> List[Dict[str, str]]:
@@ -224,7 +244,10 @@ def wipe_database(path: str) -> bool:
 
 def list_admins(path: str) -> List[Dict[str, str]]:
     """Return metadata for every user currently flagged as an admin."""
-    data = load_userdata(path)
+    return admins_from_data(load_userdata(path))
+
+
+def admins_from_data(data: Dict) -> List[Dict[str, str]]:
     admins: List[Dict[str, str]] = []
     for discord_id, info in data.get("userdata", {}).items():
         if int(info.get("is_admin", 0)) != 1:
@@ -242,22 +265,23 @@ def list_admins(path: str) -> List[Dict[str, str]]:
 
 def list_all_users(path: str) -> List[Dict[str, str]]:
     """Return lightweight metadata for every user in the database."""
-
-    data = load_userdata(path)
-    entries: List[Dict[str, str]] = []
-    for discord_id, info in data.get("userdata", {}).items():
-        entries.append(
-            {
-                "discord_id": discord_id,
-                "username": info.get("username", "Unknown"),
-                "steam_id": info.get("steam_id", ""),
-                "is_admin": info.get("is_admin", 0),
-            }
-        )
+    entries = users_from_data(load_userdata(path))
     entries.sort(key=lambda entry: entry.get("username", "").lower())
     return entries
 
 
+def users_from_data(data: Dict) -> List[Dict[str, str]]:
+    return [
+        {
+            "discord_id": discord_id,
+            "username": info.get("username", "Unknown"),
+            "steam_id": info.get("steam_id", ""),
+            "is_admin": info.get("is_admin", 0),
+        }
+        for discord_id, info in data.get("userdata", {}).items()
+    ]
+
+
 def set_admin_status(path: str, discord_id: str, is_admin: bool) -> Tuple[bool, str]:
     """Toggle the admin flag for a specific Discord ID."""
 
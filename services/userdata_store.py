@@ -0,0 +1,120 @@
+"""Shared, cached view of the userdata DB.
+
+Every task loop used to ``json.load`` the whole DB on each tick. The store
+re-reads the file only when its mtime or size changes, keeps Steam ID and
+GUID indexes next to the parsed document, and bumps ``version`` whenever the
+content changes so callers can skip work when nothing happened.
+``membership_version`` only moves when users are added, removed or renamed
+(or their Steam ID / GUID changes), for callers that only care about that.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from services.file_utils import atomic_write_text
+
+
+class UserdataStore:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.version = 0
+        self.membership_version = 0
+        self._data: Optional[Dict] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._by_steam_id: Dict[str, str] = {}
+        self._by_guid: Dict[str, List[str]] = {}
+        self._members: Dict[str, Tuple[str, str, str]] = {}
+        self._lock = threading.RLock()
+
+    def _current_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> Dict:
+        """Return the parsed DB, re-reading it only if the file changed on disk.
+
+        The returned document is shared by every caller, not a copy: callers
+        that modify it must ``save`` it, and a loop that may call code which
+        adds or removes entries (e.g. ``unban_user`` editing ``season_deaths``)
+        must iterate over a copy of the collection.
+        """
+        with self._lock:
+            stamp = self._current_stamp()
+            if self._data is None or stamp != self._stamp:
+                with open(self.path, "r") as json_file:
+                    data = json.load(json_file)
+                data.setdefault("userdata", {})
+                data.setdefault("season_deaths", [])
+                self._data = data
+                self._stamp = stamp
+                self._reindex()
+            return self._data
+
+    def save(self, data: Optional[Dict] = None) -> None:
+        with self._lock:
+            if data is not None:
+                self._data = data
+            if self._data is None:
+                return
+            atomic_write_text(self.path, json.dumps(self._data, indent=4), file_class="userdata")
+            self._stamp = self._current_stamp()
+            self._reindex()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._stamp = None
+
+    def _reindex(self) -> None:
+        by_steam_id: Dict[str, str] = {}
+        by_guid: Dict[str, List[str]] = {}
+        members: Dict[str, Tuple[str, str, str]] = {}
+        for discord_id, user in self._data.get("userdata", {}).items():
+            steam_id = str(user.get("steam_id", "")).strip()
+            if steam_id:
+                by_steam_id.setdefault(steam_id, discord_id)
+            guid = str(user.get("guid", "")).strip()
+            if guid:
+                by_guid.setdefault(guid, []).append(discord_id)
+            members[discord_id] = (str(user.get("username", "")), steam_id, guid)
+        self._by_steam_id = by_steam_id
+        self._by_guid = by_guid
+        self.version += 1
+        if members != self._members:
+            self._members = members
+            self.membership_version += 1
+
+    def is_registered(self, discord_id) -> bool:
+        return str(discord_id) in self.load()["userdata"]
+
+    def find_by_guid(self, guid: str) -> Optional[str]:
+        matches = self.find_all_by_guid(guid)
+        return matches[0] if matches else None
+
+    def find_all_by_guid(self, guid: str) -> List[str]:
+        """Every user registered with ``guid``; a GUID may be shared by several entries."""
+        self.load()
+        return list(self._by_guid.get(str(guid), ()))
+
+    def find_by_steam_id(self, steam_id: str) -> Optional[str]:
+        self.load()
+        return self._by_steam_id.get(str(steam_id))
+
+
+_STORES: Dict[str, UserdataStore] = {}
+_STORES_GUARD = threading.Lock()
+
+
+def get_userdata_store(path: str | Path) -> UserdataStore:
+    """Return the process-wide store for ``path`` so main and the cogs share one cache."""
+    key = str(Path(path).resolve())
+    with _STORES_GUARD:
+        if key not in _STORES:
+            _STORES[key] = UserdataStore(path)
+        return _STORES[key]